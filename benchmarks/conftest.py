@@ -0,0 +1,123 @@
+"""Fixtures for the view benchmarks.
+
+The benchmarks are not collected by the default test run; run them with::
+
+    $ pytest benchmarks --no-cov --bench-tasks 20000 --bench-report report.json
+"""
+
+import json
+import random
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+import pytest
+from django.test import Client
+from django.utils import timezone
+
+from benchmarks.utils import profile_call
+
+
+def pytest_addoption(parser: Any) -> None:
+    """Register the benchmark volume and report options."""
+
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-users", type=int, default=50)
+    group.addoption("--bench-tasks", type=int, default=5000)
+    group.addoption("--bench-repeat", type=int, default=5)
+    group.addoption("--bench-report", type=Path, default=Path("benchmark-report.json"))
+
+
+def seed(*, users: int, tasks: int) -> Dict[str, Any]:
+    """Create the lookup rows, users and tasks from the test factories."""
+
+    from tests.accounts.factories import CustomUserFactory
+    from tests.tasktrack.factories import PriorityFactory, StatusFactory, TaskFactory
+    from webapp.accounts.models import CustomUser
+    from webapp.tasktrack.enums import PriorityLevel, StatusType
+    from webapp.tasktrack.models import Task, TaskStatistics
+
+    generator = random.Random(1)
+    now = timezone.now()
+
+    priorities = [PriorityFactory(name=name) for name in PriorityLevel.values]
+    statuses = [StatusFactory(name=name) for name in StatusType.values]
+    admin = CustomUserFactory(is_superuser=True, is_staff=True, password=None)
+    assignees = CustomUser.objects.bulk_create(
+        CustomUserFactory.build_batch(users, password=None)
+    )
+
+    rows = []
+    for _ in range(tasks):
+        created_at = now - timedelta(minutes=generator.randint(0, 525600))
+        due_date = created_at.date() + timedelta(days=generator.randint(0, 120))
+        rows.append(
+            TaskFactory.build(
+                due_date=generator.choice([None, due_date, due_date, due_date]),
+                priority=generator.choice(priorities),
+                status=generator.choices(statuses, weights=[3, 2, 4, 1])[0],
+                assigned_to=generator.choice(assignees + [admin]),
+                created_by=admin,
+                updated_by=admin,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+        )
+    Task.objects.bulk_create(rows, batch_size=1000)
+    TaskStatistics.rebuild()
+
+    return {"admin": admin, "priorities": priorities, "users": assignees}
+
+
+@pytest.fixture(scope="session")
+def bench_data(
+    request: Any, django_db_setup: Any, django_db_blocker: Any
+) -> Dict[str, Any]:
+    """Seed the test database once for the whole benchmark session."""
+
+    with django_db_blocker.unblock():
+        return seed(
+            users=request.config.getoption("--bench-users"),
+            tasks=request.config.getoption("--bench-tasks"),
+        )
+
+
+@pytest.fixture(scope="session")
+def bench_report(request: Any) -> Iterator[Dict[str, Any]]:
+    """Collect the benchmark results and write them as JSON at the end."""
+
+    results: Dict[str, Any] = {}
+    yield results
+
+    report = {
+        "users": request.config.getoption("--bench-users"),
+        "tasks": request.config.getoption("--bench-tasks"),
+        "repeat": request.config.getoption("--bench-repeat"),
+        "benchmarks": results,
+    }
+    path = request.config.getoption("--bench-report")
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture
+def bench(
+    request: Any, bench_report: Dict[str, Any], db: Any
+) -> Callable[[str, Callable[[], Any]], Dict[str, Any]]:
+    """Return a function profiling a callable and recording it under a name."""
+
+    repeat = request.config.getoption("--bench-repeat")
+
+    def run(name: str, func: Callable[[], Any]) -> Dict[str, Any]:
+        bench_report[name] = profile_call(func, repeat=repeat)
+        return bench_report[name]
+
+    return run
+
+
+@pytest.fixture
+def superuser_client(bench_data: Dict[str, Any], db: Any) -> Client:
+    """Return a client logged in as the seeded superuser."""
+
+    client = Client()
+    client.force_login(bench_data["admin"])
+    return client
@@ -0,0 +1,239 @@
+"""Compare the concurrent request throughput of the WSGI and ASGI handlers.
+
+Seeds a throwaway SQLite database with the seed_tasks command, then sends the
+same batch of concurrent requests to the read-heavy async views through the
+WSGI handler, served by a fixed pool of worker threads, and through the ASGI
+handler, served by one event loop::
+
+    $ python -m benchmarks.server_throughput --tasks 200000 --requests 400
+
+Both handlers run in this process, so the numbers leave out the HTTP server
+and measure how many requests each handler completes while the others wait
+on the database. SQLite answers from local memory, so ``--db-latency-ms``
+adds a fixed delay to every query to model a database server across the
+network.
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+from wsgiref.util import setup_testing_defaults
+
+from benchmarks.utils import setup_django
+
+
+def add_query_latency(seconds: float) -> None:
+    """Delay every query of every new connection by the given time."""
+
+    from django.db.backends.signals import connection_created
+
+    def delay(
+        execute: Callable, sql: str, params: Any, many: bool, context: Any
+    ) -> Any:
+        time.sleep(seconds)
+        return execute(sql, params, many, context)
+
+    def install(connection: Any, **kwargs: Any) -> None:
+        if delay not in connection.execute_wrappers:
+            connection.execute_wrappers.append(delay)
+
+    connection_created.connect(install, weak=False)
+
+
+def session_cookie() -> str:
+    """Log a benchmark superuser in and return the session cookie header."""
+
+    from django.conf import settings
+    from django.test import Client
+
+    from webapp.accounts.models import CustomUser
+
+    user = CustomUser.objects.create_superuser(
+        "bench-admin", email="bench-admin@example.com"
+    )
+    client = Client()
+    client.force_login(user)
+    name = settings.SESSION_COOKIE_NAME
+    return f"{name}={client.cookies[name].value}"
+
+
+def wsgi_request(application: Any, url: str, cookie: str) -> int:
+    """Send a GET request through the WSGI handler and read the whole body."""
+
+    parts = urlsplit(url)
+    environ: Dict[str, Any] = {
+        "PATH_INFO": parts.path,
+        "QUERY_STRING": parts.query,
+        "HTTP_COOKIE": cookie,
+        "HTTP_HOST": "localhost",
+    }
+    setup_testing_defaults(environ)
+    statuses: List[str] = []
+
+    def start_response(status: str, headers: Any, exc_info: Any = None) -> Any:
+        statuses.append(status)
+
+    body = application(environ, start_response)
+    try:
+        for _ in body:
+            pass
+    finally:
+        body.close()
+    return int(statuses[0].split()[0])
+
+
+async def asgi_request(application: Any, url: str, cookie: str) -> int:
+    """Send a GET request through the ASGI handler and read the whole body."""
+
+    parts = urlsplit(url)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": parts.path,
+        "raw_path": parts.path.encode(),
+        "query_string": parts.query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"localhost"), (b"cookie", cookie.encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+    statuses: List[int] = []
+
+    async def receive() -> Dict[str, Any]:
+        if messages:
+            return messages.pop()
+        # The client never disconnects; the handler cancels this wait.
+        await asyncio.Future()
+        return {}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    await application(scope, receive, send)
+    return statuses[0]
+
+
+def run_wsgi(url: str, cookie: str, *, requests: int, workers: int) -> List[int]:
+    """Send the requests through a pool of WSGI worker threads."""
+
+    from django.core.wsgi import get_wsgi_application
+
+    application = get_wsgi_application()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(
+            pool.map(lambda _: wsgi_request(application, url, cookie), range(requests))
+        )
+
+
+def run_asgi(url: str, cookie: str, *, requests: int, concurrency: int) -> List[int]:
+    """Send the requests to the ASGI handler, concurrency at a time."""
+
+    from django.core.asgi import get_asgi_application
+
+    application = get_asgi_application()
+
+    async def send_all() -> List[int]:
+        slots = asyncio.Semaphore(concurrency)
+
+        async def send_one() -> int:
+            async with slots:
+                return await asgi_request(application, url, cookie)
+
+        return await asyncio.gather(*(send_one() for _ in range(requests)))
+
+    return asyncio.run(send_all())
+
+
+def throughput(run: Callable[[], List[int]], *, requests: int) -> Dict[str, Any]:
+    """Run one batch and return its requests per second."""
+
+    started = time.perf_counter()
+    statuses = run()
+    elapsed = time.perf_counter() - started
+    assert statuses == [200] * requests, set(statuses)
+    return {
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(requests / elapsed, 1),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print a JSON report."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument("--database", type=Path, default=None)
+    args = parser.parse_args()
+
+    database = args.database or Path(tempfile.mkdtemp()) / "throughput.sqlite3"
+    setup_django(database)
+
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.urls import reverse
+
+    settings.DEBUG = False
+    call_command("migrate", verbosity=0)
+    call_command("seed_tasks", users=args.users, tasks=args.tasks, stdout=io.StringIO())
+    cookie = session_cookie()
+
+    from django.db import connections
+
+    connections.close_all()
+    if args.db_latency_ms:
+        add_query_latency(args.db_latency_ms / 1000)
+
+    today = date.today()
+    calendar = f"?start={today}&end={today + timedelta(days=7)}"
+    urls: List[Tuple[str, str]] = [
+        ("home_counts_api", reverse("home_counts_api")),
+        ("dashboard_stats_api", reverse("dashboard_stats_api")),
+        ("task_calendar_api", reverse("task_calendar_api") + calendar),
+    ]
+
+    report: Dict[str, Any] = {
+        "tasks": args.tasks,
+        "requests": args.requests,
+        "wsgi_workers": args.workers,
+        "asgi_concurrency": args.concurrency,
+        "db_latency_ms": args.db_latency_ms,
+        "views": {},
+    }
+    for name, url in urls:
+        report["views"][name] = {
+            "wsgi": throughput(
+                lambda: run_wsgi(
+                    url, cookie, requests=args.requests, workers=args.workers
+                ),
+                requests=args.requests,
+            ),
+            "asgi": throughput(
+                lambda: run_asgi(
+                    url, cookie, requests=args.requests, concurrency=args.concurrency
+                ),
+                requests=args.requests,
+            ),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
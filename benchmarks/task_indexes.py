@@ -0,0 +1,143 @@
+"""Compare the Task hot path query plans before and after the composite indexes.
+
+Seeds a throwaway SQLite database, migrates it to the state before the task
+indexes, prints the query plan and latency of each hot filter, then applies
+the index migration and repeats the measurements::
+
+    $ python -m benchmarks.task_indexes --rows 1000000
+"""
+
+import argparse
+import json
+import random
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.utils import setup_django, time_call
+
+BEFORE_MIGRATION = "0002_task_statistics"
+AFTER_MIGRATION = "0003_task_indexes"
+
+
+def seed(*, rows: int, users: int, chunk_size: int = 50000) -> None:
+    """Insert the lookup rows, users and tasks with plain executemany calls."""
+
+    from django.db import connection, transaction
+
+    now = datetime.now(timezone.utc)
+    today = date.today()
+    names = ["PENDING", "IN_PROGRESS", "COMPLETED", "CANCELLED"]
+    levels = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO tasktrack_status (id, name, created_at) VALUES (%s, %s, %s)",
+            [(pk, name, now) for pk, name in enumerate(names, start=1)],
+        )
+        cursor.executemany(
+            "INSERT INTO tasktrack_priority (id, name, created_at) VALUES (%s, %s, %s)",
+            [(pk, name, now) for pk, name in enumerate(levels, start=1)],
+        )
+        cursor.executemany(
+            "INSERT INTO accounts_customuser (id, username, email, password, "
+            "is_superuser, is_staff, is_active, date_joined) "
+            "VALUES (%s, %s, %s, '!', 0, 0, 1, %s)",
+            [
+                (pk, f"bench-{pk}", f"bench-{pk}@example.com", now)
+                for pk in range(1, users + 1)
+            ],
+        )
+
+        generator = random.Random(1)
+        for offset in range(0, rows, chunk_size):
+            batch: List[Any] = []
+            for _ in range(min(chunk_size, rows - offset)):
+                updated_at = now - timedelta(minutes=generator.randint(0, 525600))
+                batch.append(
+                    (
+                        "Benchmark task",
+                        today + timedelta(days=generator.randint(-365, 365)),
+                        generator.randint(1, 4),
+                        generator.choices([1, 2, 3, 4], weights=[2, 1, 6, 1])[0],
+                        generator.randint(1, users),
+                        updated_at,
+                        updated_at,
+                    )
+                )
+            cursor.executemany(
+                "INSERT INTO tasktrack_task (title, due_date, priority_id, "
+                "status_id, assigned_to_id, created_by_id, updated_by_id, "
+                "created_at, updated_at) VALUES (%s, %s, %s, %s, %s, 1, 1, %s, %s)",
+                batch,
+            )
+
+
+def measure(*, repeat: int) -> Dict[str, Any]:
+    """Return the query plan and latency of each Task hot path query."""
+
+    from webapp.tasktrack.models import Task
+
+    today = date.today()
+    now = datetime.now(timezone.utc)
+    queries = {
+        "assignee_status_count": Task.objects.filter(assigned_to_id=1, status_id=1),
+        "completed_month_count": Task.objects.filter(
+            status_id=3,
+            updated_at__gte=now - timedelta(days=30),
+            updated_at__lt=now,
+        ),
+        "calendar_window": Task.objects.filter(
+            due_date__gte=today, due_date__lt=today + timedelta(days=35)
+        ).values("id", "title", "due_date", "priority__name", "status__name"),
+    }
+
+    results = {}
+    for name, queryset in queries.items():
+        if name.endswith("_count"):
+            run = lambda queryset=queryset: queryset.all().count()  # noqa: E731
+        else:
+            run = lambda queryset=queryset: len(queryset.all())  # noqa: E731
+        results[name] = {
+            "plan": queryset.explain(),
+            **time_call(run, repeat=repeat),
+        }
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a JSON report."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database", type=Path, default=None)
+    args = parser.parse_args()
+
+    database = args.database or Path(tempfile.mkdtemp()) / "task_indexes.sqlite3"
+    setup_django(database)
+
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+    call_command("migrate", "tasktrack", BEFORE_MIGRATION, verbosity=0)
+    seed(rows=args.rows, users=args.users)
+
+    before = measure(repeat=args.repeat)
+    call_command("migrate", "tasktrack", AFTER_MIGRATION, verbosity=0)
+    after = measure(repeat=args.repeat)
+
+    report = {
+        "rows": args.rows,
+        "database": str(database),
+        "queries": {
+            name: {"before": before[name], "after": after[name]} for name in before
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Compare the FTS5 task search with the admin's icontains search.
+
+Seeds a throwaway SQLite database with tasks built from a small vocabulary,
+builds the search index by applying its migration, then times the admin
+search and the ranked FTS5 search for a few terms::
+
+    $ python -m benchmarks.task_search --rows 1000000
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.utils import setup_django, time_call
+
+BEFORE_MIGRATION = "0003_task_indexes"
+AFTER_MIGRATION = "0004_task_search"
+
+WORDS = (
+    "invoice report budget release deploy review customer contract audit "
+    "backup meeting roadmap migration security onboarding payroll refund "
+    "newsletter inventory shipment warranty renewal training forecast"
+).split()
+FIRST_NAMES = ["Ada", "Grace", "Alan", "Linus", "Barbara", "Ken", "Margaret"]
+LAST_NAMES = ["Lovelace", "Hopper", "Turing", "Torvalds", "Liskov", "Thompson"]
+TERMS = ["invoice", "renewal forecast", "hopper", "missing"]
+
+
+def seed(*, rows: int, users: int, chunk_size: int = 50000) -> None:
+    """Insert the lookup rows, users and tasks with plain executemany calls."""
+
+    from django.db import connection, transaction
+
+    now = datetime.now(timezone.utc)
+    generator = random.Random(1)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            "INSERT INTO tasktrack_status (id, name, created_at) VALUES (%s, %s, %s)",
+            [(1, "PENDING", now)],
+        )
+        cursor.executemany(
+            "INSERT INTO tasktrack_priority (id, name, created_at) VALUES (%s, %s, %s)",
+            [(1, "LOW", now)],
+        )
+        cursor.executemany(
+            "INSERT INTO accounts_customuser (id, username, email, first_name, "
+            "last_name, password, is_superuser, is_staff, is_active, date_joined) "
+            "VALUES (%s, %s, %s, %s, %s, '!', 0, 0, 1, %s)",
+            [
+                (
+                    pk,
+                    f"bench-{pk}",
+                    f"bench-{pk}@example.com",
+                    generator.choice(FIRST_NAMES),
+                    generator.choice(LAST_NAMES),
+                    now,
+                )
+                for pk in range(1, users + 1)
+            ],
+        )
+
+        for offset in range(0, rows, chunk_size):
+            batch: List[Any] = []
+            for _ in range(min(chunk_size, rows - offset)):
+                batch.append(
+                    (
+                        " ".join(generator.sample(WORDS, 3)).capitalize(),
+                        " ".join(generator.choices(WORDS, k=12)),
+                        generator.randint(1, users),
+                        now,
+                        now,
+                    )
+                )
+            cursor.executemany(
+                "INSERT INTO tasktrack_task (title, description, priority_id, "
+                "status_id, assigned_to_id, created_by_id, updated_by_id, "
+                "created_at, updated_at) VALUES (%s, %s, 1, 1, %s, 1, 1, %s, %s)",
+                batch,
+            )
+
+
+def measure(*, repeat: int, limit: int) -> Dict[str, Any]:
+    """Return the latency of the admin search and the FTS5 search per term."""
+
+    from django.contrib import admin
+    from django.test import RequestFactory
+
+    from webapp.tasktrack.models import Task
+
+    model_admin = admin.site._registry[Task]
+    request = RequestFactory().get("/admin/tasktrack/task/")
+
+    def admin_search(term: str) -> int:
+        """Search like the changelist: count every match, then load one page."""
+
+        queryset, _ = model_admin.get_search_results(request, Task.objects.all(), term)
+        queryset.count()
+        return len(queryset.order_by("-pk")[:limit])
+
+    def fts_search(term: str) -> int:
+        return len(Task.objects.all().search(term, limit=limit))
+
+    results = {}
+    for term in TERMS:
+        results[term] = {
+            "admin_icontains": time_call(partial(admin_search, term), repeat=repeat),
+            "fts5": time_call(partial(fts_search, term), repeat=repeat),
+            "admin_rows": admin_search(term),
+            "fts5_rows": fts_search(term),
+        }
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print a JSON report."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--database", type=Path, default=None)
+    args = parser.parse_args()
+
+    database = args.database or Path(tempfile.mkdtemp()) / "task_search.sqlite3"
+    setup_django(database)
+
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+    call_command("migrate", "tasktrack", BEFORE_MIGRATION, verbosity=0)
+    seed(rows=args.rows, users=args.users)
+
+    started = time.perf_counter()
+    call_command("migrate", "tasktrack", AFTER_MIGRATION, verbosity=0)
+    index_build_s = round(time.perf_counter() - started, 3)
+
+    report = {
+        "rows": args.rows,
+        "database": str(database),
+        "index_build_s": index_build_s,
+        "terms": measure(repeat=args.repeat, limit=args.limit),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Throughput of the authentication backends and password hashers."""
+
+import time
+from typing import Any, Callable, Dict
+
+import pytest
+from django.contrib.auth import authenticate
+from django.test import Client
+from django.urls import reverse
+
+Bench = Callable[[str, Callable[[], Any]], Dict[str, Any]]
+
+PASSWORD = "storm-password"
+
+HASHERS = {
+    "scrypt": "webapp.accounts.auth.hashers.ScryptPasswordHasher",
+    "pbkdf2_sha256": "webapp.accounts.auth.hashers.PBKDF2PasswordHasher",
+    "argon2": "webapp.accounts.auth.hashers.Argon2PasswordHasher",
+}
+
+
+def per_second(func: Callable[[], Any], *, calls: int) -> float:
+    """Return how many calls per second one run of func makes."""
+
+    started = time.perf_counter()
+    func()
+    return round(calls / (time.perf_counter() - started), 2)
+
+
+def test_login_storm(bench: Bench, bench_data: Dict[str, Any]) -> None:
+    from tests.accounts.factories import CustomUserFactory
+
+    user = CustomUserFactory(
+        username="storm-user", email="storm@example.com", password=PASSWORD
+    )
+    attempts = [
+        (user.username, PASSWORD, user),
+        (user.email, PASSWORD, user),
+        (user.email, "wrong-password", None),
+        ("nobody@example.com", PASSWORD, None),
+    ]
+
+    def storm() -> None:
+        for username, password, expected in attempts:
+            assert authenticate(None, username=username, password=password) == expected
+
+    result = bench("login_storm", storm)
+    result["logins_per_second"] = per_second(storm, calls=len(attempts))
+
+
+@pytest.mark.parametrize("algorithm", HASHERS)
+def test_login_view(
+    bench: Bench, bench_data: Dict[str, Any], settings: Any, algorithm: str
+) -> None:
+    if algorithm == "argon2":
+        pytest.importorskip("argon2")
+
+    from tests.accounts.factories import CustomUserFactory
+
+    settings.PASSWORD_HASHERS = [HASHERS[algorithm]]
+    user = CustomUserFactory(username=f"login-{algorithm}", password=PASSWORD)
+    client = Client()
+    data = {"username": user.email, "password": PASSWORD}
+
+    def login() -> None:
+        response = client.post(reverse("login"), data=data)
+        assert response.status_code == 302
+
+    result = bench(f"login_view[{algorithm}]", login)
+    result["logins_per_second_per_core"] = per_second(login, calls=1)
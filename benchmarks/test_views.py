@@ -0,0 +1,108 @@
+"""Latency, query count and peak memory of the tasktrack views."""
+
+from datetime import timedelta
+from itertools import count
+from typing import Any, Callable, Dict
+
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+Bench = Callable[[str, Callable[[], Any]], Dict[str, Any]]
+
+
+def request(
+    client: Client, method: str, url: str, *, status: int = 200, **kwargs: Any
+) -> Callable[[], Any]:
+    """Return a callable sending the request and reading the whole response."""
+
+    def send() -> Any:
+        response = getattr(client, method)(url, **kwargs)
+        assert response.status_code == status
+        if response.streaming:
+            b"".join(response.streaming_content)
+        return response
+
+    return send
+
+
+def test_home_view(bench: Bench, superuser_client: Client) -> None:
+    bench("home_view", request(superuser_client, "get", reverse("home")))
+
+
+def test_dashboard_view(bench: Bench, superuser_client: Client) -> None:
+    bench("dashboard_view", request(superuser_client, "get", reverse("dashboard")))
+
+
+def test_task_view(bench: Bench, superuser_client: Client) -> None:
+    bench("task_view", request(superuser_client, "get", reverse("tasks")))
+
+
+def test_task_calendar_api(bench: Bench, superuser_client: Client) -> None:
+    today = timezone.localdate()
+    params = {
+        "start": (today - timedelta(days=7)).isoformat(),
+        "end": (today + timedelta(days=35)).isoformat(),
+    }
+
+    bench(
+        "task_calendar_api",
+        request(superuser_client, "get", reverse("task_calendar_api"), data=params),
+    )
+
+
+def test_task_table_api(bench: Bench, superuser_client: Client) -> None:
+    params = {
+        "draw": "2",
+        "start": "100",
+        "length": "50",
+        "columns[0][data]": "title",
+        "columns[1][data]": "assigned_to",
+        "order[0][column]": "1",
+        "order[0][dir]": "asc",
+    }
+
+    bench(
+        "task_table_api",
+        request(superuser_client, "get", reverse("task_table_api"), data=params),
+    )
+
+
+def test_task_update_view(
+    bench: Bench, superuser_client: Client, bench_data: Dict[str, Any]
+) -> None:
+    from webapp.tasktrack.models import Task
+
+    task = Task.objects.filter(assigned_to=bench_data["admin"]).latest("pk")
+    url = reverse("task_update", kwargs={"pk": task.pk})
+    revisions = count()
+
+    def update() -> Any:
+        data = {
+            "title": f"Benchmark revision {next(revisions)}",
+            "due_date": task.due_date or "",
+            "description": task.description,
+            "priority": task.priority_id,
+            "status": task.status_id,
+            "assigned_to": task.assigned_to_id,
+        }
+        return request(superuser_client, "post", url, status=302, data=data)()
+
+    bench("task_update_view", update)
+
+
+def test_create_task(
+    bench: Bench, superuser_client: Client, bench_data: Dict[str, Any]
+) -> None:
+    data = {
+        "title": "Benchmark calendar task",
+        "due_date": timezone.localdate().isoformat(),
+        "description": "Created by the benchmark",
+        "priority": bench_data["priorities"][0].pk,
+        "assigned_to": bench_data["users"][0].pk,
+    }
+
+    bench(
+        "create_task",
+        request(superuser_client, "post", reverse("calendar"), data=data),
+    )
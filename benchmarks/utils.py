@@ -0,0 +1,65 @@
+"""Shared helpers for the offline benchmarks."""
+
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import django
+
+
+def setup_django(database: Path) -> None:
+    """Configure Django to use the given SQLite file and initialise the apps."""
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    from django.conf import settings
+
+    settings.DATABASES["default"]["NAME"] = str(database)
+    django.setup()
+
+
+def time_call(func: Callable[[], Any], *, repeat: int) -> Dict[str, float]:
+    """Run the callable repeatedly and return its latency in milliseconds."""
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+    }
+
+
+def profile_call(func: Callable[[], Any], *, repeat: int) -> Dict[str, Any]:
+    """Time the callable and record its query count and peak memory.
+
+    The first call warms the caches and is not measured. Memory is traced on
+    a separate call so tracemalloc does not skew the timings.
+    """
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    func()
+    timings = time_call(func, repeat=repeat)
+
+    with CaptureQueriesContext(connection) as queries:
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        **timings,
+        "queries": len(queries),
+        "peak_memory_kb": round(peak / 1024, 1),
+    }
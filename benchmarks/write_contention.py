@@ -0,0 +1,249 @@
+"""Compare concurrent task writes with the default and the tuned SQLite profile.
+
+Seeds a SQLite database with the seed_tasks command, then starts several
+worker processes that create tasks with services.create_task and edit tasks
+through task_update_view at the same time. The run is repeated with django's
+default SQLite connection settings on a rollback journal, and with the
+profile configured in the settings::
+
+    $ python -m benchmarks.write_contention --processes 8 --operations 200
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import time
+import traceback
+from io import StringIO
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from benchmarks.utils import setup_django
+
+DEFAULT_PROFILE: Dict[str, Any] = {"CONN_MAX_AGE": 0, "OPTIONS": {}}
+
+
+def configure(database: Path, profile: str) -> None:
+    """Set up django in a worker with the given database profile."""
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    from django.conf import settings
+
+    settings.DEBUG = False
+    if profile == "default":
+        settings.DATABASES["default"].update(DEFAULT_PROFILE)
+    setup_django(database)
+
+
+def create_task_operation(index: int) -> Callable[[], None]:
+    """Return an operation creating a task with the task service."""
+
+    from webapp.accounts.models import CustomUser
+    from webapp.tasktrack import services
+    from webapp.tasktrack.models import Priority
+
+    user = CustomUser.objects.get(username="bench-admin")
+    priority = Priority.objects.first()
+    counter = iter(range(10**9))
+
+    def create() -> None:
+        services.create_task(
+            user=user,
+            title=f"Contention task {index}-{next(counter)}",
+            due_date=None,
+            description="Created by the write contention benchmark",
+            priority=priority,
+            assigned_to=user,
+        )
+
+    return create
+
+
+def task_update_operation(index: int) -> Callable[[], None]:
+    """Return an operation posting the task update form of a random task."""
+
+    from django.test import Client
+    from django.urls import reverse
+
+    from webapp.accounts.models import CustomUser
+    from webapp.tasktrack.models import Task
+
+    client = Client(HTTP_HOST="localhost")
+    client.force_login(CustomUser.objects.get(username="bench-admin"))
+    tasks = list(
+        Task.objects.values(
+            "pk", "priority_id", "status_id", "assigned_to_id", "description"
+        )[:500]
+    )
+    generator = random.Random(index)
+    counter = iter(range(10**9))
+
+    def update() -> None:
+        task = generator.choice(tasks)
+        response = client.post(
+            reverse("task_update", kwargs={"pk": task["pk"]}),
+            data={
+                "title": f"Contention revision {index}-{next(counter)}",
+                "due_date": "",
+                "description": task["description"],
+                "priority": task["priority_id"],
+                "status": task["status_id"],
+                "assigned_to": task["assigned_to_id"],
+            },
+        )
+        assert response.status_code == 302, response.status_code
+
+    return update
+
+
+OPERATIONS = {
+    "create_task": create_task_operation,
+    "task_update_view": task_update_operation,
+}
+
+
+def worker(
+    database: Path,
+    profile: str,
+    operation: str,
+    count: int,
+    index: int,
+    barrier: Any,
+    results: Any,
+) -> None:
+    """Run the operation count times once every worker is ready."""
+
+    try:
+        results.put(measure(database, profile, operation, count, index, barrier))
+    except Exception:
+        barrier.abort()
+        results.put({"error": traceback.format_exc()})
+
+
+def measure(
+    database: Path, profile: str, operation: str, count: int, index: int, barrier: Any
+) -> Dict[str, Any]:
+    """Time each run of the operation and count the ones that found the lock."""
+
+    configure(database, profile)
+
+    from django.db import OperationalError
+
+    run = OPERATIONS[operation](index)
+    barrier.wait()
+
+    done = locked = 0
+    timings: List[float] = []
+    started = time.perf_counter()
+    for _ in range(count):
+        call_started = time.perf_counter()
+        try:
+            run()
+        except OperationalError as error:
+            if "locked" not in str(error):
+                raise
+            locked += 1
+        else:
+            done += 1
+            timings.append(time.perf_counter() - call_started)
+    return {
+        "done": done,
+        "locked": locked,
+        "seconds": time.perf_counter() - started,
+        "timings": timings,
+    }
+
+
+def contend(
+    database: Path, *, profile: str, operation: str, processes: int, operations: int
+) -> Dict[str, Any]:
+    """Run the operation in several processes and summarise the results."""
+
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(processes)
+    results = context.Queue()
+    workers = [
+        context.Process(
+            target=worker,
+            args=(database, profile, operation, operations, index, barrier, results),
+        )
+        for index in range(processes)
+    ]
+    for process in workers:
+        process.start()
+    reports = [results.get() for _ in workers]
+    for process in workers:
+        process.join()
+    for report in reports:
+        if "error" in report:
+            raise RuntimeError(f"A {operation} worker failed:\n{report['error']}")
+
+    timings = sorted(timing for report in reports for timing in report["timings"])
+    done = sum(report["done"] for report in reports)
+    seconds = max(report["seconds"] for report in reports)
+    return {
+        "done": done,
+        "locked": sum(report["locked"] for report in reports),
+        "writes_per_second": round(done / seconds, 1),
+        "p95_ms": (
+            round(timings[int(len(timings) * 0.95)] * 1000, 2) if timings else None
+        ),
+    }
+
+
+def seed(database: Path, *, tasks: int) -> None:
+    """Seed the template database and leave it on a rollback journal."""
+
+    configure(database, "default")
+
+    from django.core.management import call_command
+    from django.db import connections
+
+    from webapp.accounts.models import CustomUser
+
+    call_command("migrate", verbosity=0)
+    call_command("seed_tasks", users=100, tasks=tasks, stdout=StringIO())
+    CustomUser.objects.create_superuser("bench-admin", email="bench@example.com")
+    connections.close_all()
+
+
+def main() -> None:
+    """Run the benchmark and print a JSON report."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--operations", type=int, default=200)
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp())
+    template = directory / "template.sqlite3"
+    seed(template, tasks=args.tasks)
+
+    report: Dict[str, Any] = {
+        "tasks": args.tasks,
+        "processes": args.processes,
+        "operations_per_process": args.operations,
+        "results": {},
+    }
+    for operation in OPERATIONS:
+        for profile in ("default", "tuned"):
+            database = directory / f"{operation}-{profile}.sqlite3"
+            shutil.copyfile(template, database)
+            report["results"].setdefault(operation, {})[profile] = contend(
+                database,
+                profile=profile,
+                operation=operation,
+                processes=args.processes,
+                operations=args.operations,
+            )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
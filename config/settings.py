@@ -9,7 +9,9 @@ https://docs.djangoproject.com/en/5.1/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
+
 import os
+import tempfile
 from pathlib import Path
 
 from django.urls import reverse_lazy
@@ -52,6 +54,7 @@ INSTALLED_APPS = [
 CRISPY_TEMPLATE_PACK = "bootstrap4"
 
 MIDDLEWARE = [
+    "webapp.tasktrack.middleware.QueryProfilerMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -59,11 +62,11 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "webapp.tasktrack.middleware.ReplicaStickinessMiddleware",
 ]
 
 AUTHENTICATION_BACKENDS = [
-    "django.contrib.auth.backends.ModelBackend",
-    "webapp.accounts.auth.backends.EmailBackend",
+    "webapp.accounts.auth.backends.UsernameOrEmailBackend",
 ]
 
 LOGIN_URL = reverse_lazy("login")
@@ -96,10 +99,75 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# Several workers write to the same SQLite file. The write-ahead log lets
+# readers run alongside a writer, and BEGIN IMMEDIATE takes the write lock
+# when a transaction starts, so a transaction that reads before writing waits
+# for the lock instead of failing with "database is locked" on the upgrade.
+
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,
+    "temp_store": "MEMORY",
+}
+
+SQLITE_OPTIONS = {
+    "transaction_mode": "IMMEDIATE",
+    "timeout": 20,
+    "init_command": ";".join(
+        f"PRAGMA {name}={value}" for name, value in SQLITE_PRAGMAS.items()
+    ),
+}
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        "CONN_MAX_AGE": int(os.environ.get("DATABASE_CONN_MAX_AGE", 600)),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": dict(SQLITE_OPTIONS),
+    }
+}
+
+# Read replicas
+# DATABASE_REPLICA_PATHS lists SQLite copies of the primary, separated by
+# commas. The dashboard, task list and calendar views read from them through
+# the router, and the sync_replicas command copies the primary into them.
+
+DATABASE_REPLICAS = []
+for index, path in enumerate(
+    filter(None, os.environ.get("DATABASE_REPLICA_PATHS", "").split(",")), start=1
+):
+    alias = f"replica{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "NAME": Path(path.strip()),
+        "OPTIONS": dict(SQLITE_OPTIONS),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["webapp.tasktrack.routers.PrimaryReplicaRouter"]
+
+# Seconds a client keeps reading from the primary after it writes, longer
+# than the interval between two sync_replicas runs.
+
+REPLICA_PIN_SECONDS = int(os.environ.get("REPLICA_PIN_SECONDS", 60))
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# The cache is shared through the file system, so a write in one worker or
+# management command invalidates the cached counters of every process.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get(
+            "CACHE_LOCATION", Path(tempfile.gettempdir()) / "task-list-app-cache"
+        ),
     }
 }
 
@@ -122,6 +190,33 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/5.1/topics/auth/passwords/
+# New passwords are hashed with the first hasher. Hashes made by the other
+# hashers, or with other costs, are rehashed on the next successful login.
+# Argon2 requires the argon2-cffi package.
+
+PASSWORD_HASHERS = [
+    "webapp.accounts.auth.hashers.ScryptPasswordHasher",
+    "webapp.accounts.auth.hashers.PBKDF2PasswordHasher",
+    "webapp.accounts.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+
+PASSWORD_HASHER_COSTS = {
+    "scrypt": {"work_factor": 2**14, "block_size": 8, "parallelism": 1},
+    "pbkdf2_sha256": {"iterations": 1_000_000},
+    "argon2": {"time_cost": 2, "memory_cost": 102400, "parallelism": 8},
+}
+
+# Usernames are allocated from blocks of this many numbers reserved per process
+
+USERNAME_BLOCK_SIZE = 100
+
+# Bulk user import
+
+USER_IMPORT_BATCH_SIZE = 1000
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
@@ -147,3 +242,53 @@ STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "accounts.CustomUser"
+
+# Task listing pagination
+
+TASK_LIST_PAGE_SIZE = 50
+TASK_LIST_MAX_PAGE_SIZE = 200
+
+# Bulk task creation
+
+TASK_BULK_CREATE_CHUNK_SIZE = 500
+
+# Task search
+
+TASK_SEARCH_LIMIT = 50
+
+# Assignee autocomplete
+
+USER_SEARCH_PAGE_SIZE = 20
+USER_SEARCH_CACHE_TIMEOUT = 60
+
+# Home page task counters
+
+TASK_HOME_COUNTS_CACHE_TIMEOUT = 60 * 60
+
+# Query profiling
+# QueryProfilerMiddleware only wraps the queries when QUERY_PROFILER_ENABLED
+# is set, which is opt-in through the environment and always on in tests.
+# Maximum queries per request by url name. Views over budget log their
+# duplicate queries, and raise when QUERY_BUDGET_RAISE is set (as in tests).
+
+QUERY_PROFILER_ENABLED = os.environ.get("QUERY_PROFILER_ENABLED", "") == "1"
+
+QUERY_BUDGETS = {
+    "home": 6,
+    "dashboard": 6,
+    "tasks": 10,
+    "task_details": 8,
+    "task_update": 20,
+    "create_task": 20,
+    "calendar": 20,
+    "delete_task": 15,
+    "delete_calendar_task": 15,
+    "task_calendar_api": 5,
+    "home_counts_api": 4,
+    "dashboard_stats_api": 9,
+    "task_search_api": 5,
+    "user_search_api": 3,
+    "task_table_api": 8,
+    "my_task_table_api": 8,
+}
+QUERY_BUDGET_RAISE = False
@@ -0,0 +1,24 @@
+"""Fixtures shared by the test suite and the view benchmarks."""
+
+from typing import Iterator
+
+import pytest
+from django.test import override_settings
+
+
+@pytest.fixture(scope="session", autouse=True)
+def process_local_cache() -> Iterator[None]:
+    """Cache in process memory, leaving the shared file cache of the project alone.
+
+    The tests clear the cache between tests and the benchmarks fill it with
+    counts of their own users, neither of which may reach a running server.
+    """
+
+    caches = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "tests",
+        }
+    }
+    with override_settings(CACHES=caches):
+        yield
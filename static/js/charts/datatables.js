@@ -1,4 +1,140 @@
 // Call the dataTables jQuery plugin
+//
+// Tables with a data-source attribute are paged, ordered and searched by the
+// server. Their first page is rendered by the template, search results
+// included, so loading it is deferred until the user pages, orders or
+// searches the table. Paging forward in the default order sends the id of the
+// last row shown, and the server reads the next page after it instead of
+// skipping the earlier rows; other page jumps and column orders use offsets.
 $(document).ready(function() {
-  $('#dataTable').DataTable();
+  var $table = $('#dataTable');
+  var source = $table.data('source');
+
+  if (!source) {
+    $table.DataTable();
+    return;
+  }
+
+  var escapeHtml = $.fn.dataTable.render.text().display;
+  var csrfToken = $table.data('csrf-token') || '';
+
+  // Rows rendered by the template hold the cell html instead of the JSON data.
+  function fromServer(row) {
+    return $.isPlainObject(row.urls);
+  }
+
+  var renderers = {
+    text: function(data, type, row) {
+      return fromServer(row) ? escapeHtml(data) : data;
+    },
+    badge: function(data, type, row) {
+      if (!fromServer(row)) {
+        return data;
+      }
+      return '<span class="badge badge-' + escapeHtml(data.colour || '') + '">' +
+        escapeHtml(data.name) + '</span>';
+    },
+    checkbox: function(data, type, row) {
+      if (!fromServer(row)) {
+        return data;
+      }
+      return '<input type="checkbox" name="task_ids" value="' + data + '" form="bulk-update-form">';
+    },
+    actions: function(data, type, row) {
+      if (!fromServer(row)) {
+        return data;
+      }
+      var html = '<a href="' + data.details + '"><i class="fa fa-eye"></i></a>';
+      if (data.update) {
+        html += '&nbsp;&nbsp;<a href="' + data.update + '"><i class="fas fa-edit"></i></a>';
+      }
+      if (data['delete']) {
+        html += '&nbsp;&nbsp;<form method="post" action="' + data['delete'] + '" class="d-inline">' +
+          '<input type="hidden" name="csrfmiddlewaretoken" value="' + escapeHtml(csrfToken) + '">' +
+          '<button type="submit" class="btn btn-link p-0 align-baseline" title="Delete">' +
+          '<i class="fas fa-trash-alt"></i></button></form>';
+      }
+      return html;
+    }
+  };
+
+  var columns = $table.find('thead th').map(function() {
+    var render = $(this).data('render') || 'text';
+    return {
+      data: $(this).data('data'),
+      render: renderers[render],
+      orderable: render === 'text' || render === 'badge',
+      searchable: render === 'text' || render === 'badge'
+    };
+  }).get();
+
+  // One filter input per searchable column, sent as the column search value.
+  var $footer = $('<tr>');
+  $.each(columns, function(index, column) {
+    var $cell = $('<th>');
+    if (column.searchable) {
+      $cell.append(
+        $('<input type="search" class="form-control form-control-sm">')
+          .attr('placeholder', 'Filter')
+          .attr('data-column', index)
+      );
+    }
+    $footer.append($cell);
+  });
+  $table.append($('<tfoot>').append($footer));
+
+  var recordsTotal = $table.data('records-total');
+  var recordsFiltered = $table.data('records-filtered');
+  var deferLoading = recordsTotal === undefined ? null : recordsTotal;
+  if (recordsFiltered !== undefined) {
+    deferLoading = [recordsFiltered, recordsTotal];
+  }
+
+  // The end and last row id of the page on display.
+  var shown = null;
+
+  var table = $table.DataTable({
+    serverSide: true,
+    processing: true,
+    ajax: {
+      url: source,
+      data: function(params) {
+        if (shown && shown.lastId && !params.order.length &&
+            params.start > 0 && params.start === shown.end &&
+            params.length === shown.length) {
+          params.after = shown.lastId;
+        }
+      }
+    },
+    columns: columns,
+    order: [],
+    pageLength: $table.data('page-length') || 50,
+    searchDelay: 400,
+    search: {search: $table.data('search') || ''},
+    deferLoading: deferLoading,
+    drawCallback: function() {
+      var api = this.api();
+      var info = api.page.info();
+      var nodes = api.rows({page: 'current'}).nodes();
+      var last = nodes.length ? nodes[nodes.length - 1] : null;
+      var lastId = null;
+      if (last) {
+        var row = api.row(last).data();
+        lastId = fromServer(row) ? row.id : $(last).data('id');
+      }
+      shown = {end: info.end, length: info.length, lastId: lastId};
+    }
+  });
+
+  var timer = null;
+  $table.find('tfoot input').on('keyup change', function() {
+    var input = this;
+    clearTimeout(timer);
+    timer = setTimeout(function() {
+      var column = table.column($(input).data('column'));
+      if (column.search() !== input.value) {
+        column.search(input.value).draw();
+      }
+    }, 400);
+  });
 });
@@ -0,0 +1,70 @@
+// Refresh the task counters
+//
+// Pages with a data-counts-url element render their counters with the page.
+// When the user comes back to a page left open in the background, the
+// counters are read again from the async count endpoint, at most once a
+// minute, so they are current without reloading the page or polling it.
+$(document).ready(function() {
+  var $counters = $('[data-counts-url]');
+  var url = $counters.data('counts-url');
+  var minimumSeconds = 60;
+  var refreshedAt = Date.now();
+  var months = [
+    'jan', 'feb', 'mar', 'apr', 'may', 'jun',
+    'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
+  ];
+
+  if (!url) {
+    return;
+  }
+
+  function showCounts(counts) {
+    $('[data-count]').each(function() {
+      var count = counts[$(this).data('count')];
+      if (count !== undefined) {
+        $(this).text(count);
+      }
+    });
+  }
+
+  function updateChart(chart, values) {
+    if (chart) {
+      chart.data.datasets[0].data = values;
+      chart.update();
+    }
+  }
+
+  function showDashboard(data) {
+    var counts = data.task_counts;
+    showCounts(counts);
+    updateChart(window.myPieChart, [
+      counts.low_priority,
+      counts.medium_priority,
+      counts.high_priority,
+      counts.critical_priority
+    ]);
+    updateChart(window.myBarChart, $.map(months, function(month) {
+      return data.due_tasks_count_by_month[month + '_due_tasks'];
+    }));
+    updateChart(window.myLineChart, $.map(months, function(month) {
+      return data.completed_tasks_count_by_month[month + '_completed_tasks'];
+    }));
+  }
+
+  function refresh() {
+    if (document.hidden || Date.now() - refreshedAt < minimumSeconds * 1000) {
+      return;
+    }
+    refreshedAt = Date.now();
+    $.getJSON(url).done(function(data) {
+      if (data.task_counts) {
+        showDashboard(data);
+      } else {
+        showCounts(data);
+      }
+    });
+  }
+
+  $(document).on('visibilitychange', refresh);
+  $(window).on('focus', refresh);
+});
@@ -1,10 +1,11 @@
 from typing import Any, Optional
+from unittest import mock
 
 import pytest
 from django.test import RequestFactory
 
 from tests.accounts.factories import CustomUserFactory
-from webapp.accounts.auth.backends import EmailBackend
+from webapp.accounts.auth.backends import UsernameOrEmailBackend, dummy_password_hash
 
 
 @pytest.fixture
@@ -14,16 +15,16 @@ def mock_request(rf: RequestFactory) -> Any:
     return rf.post("some-url")
 
 
-class TestEmailBackend:
+class TestUsernameOrEmailBackend:
     @pytest.mark.parametrize("username", ["", None])
     def test_username_bad(self, username: Optional[str], mock_request: Any) -> None:
-        backend = EmailBackend()
+        backend = UsernameOrEmailBackend()
         result = backend.authenticate(mock_request, username=username, password="foo")
         assert result is None
 
     @pytest.mark.parametrize("password", ["", None])
     def test_password_bad(self, password: Optional[str], mock_request: Any) -> None:
-        backend = EmailBackend()
+        backend = UsernameOrEmailBackend()
         result = backend.authenticate(
             mock_request, username="foo@mail.com", password=password
         )
@@ -31,7 +32,7 @@ class TestEmailBackend:
 
     @pytest.mark.django_db
     def test_user_does_not_exist(self, mock_request: Any) -> None:
-        backend = EmailBackend()
+        backend = UsernameOrEmailBackend()
         result = backend.authenticate(
             mock_request, username="foo@mail.com", password="foo"
         )
@@ -42,7 +43,7 @@ class TestEmailBackend:
         password = "foo"
         email = "foo@mail.com"
         user = CustomUserFactory(email=email, password=password)
-        backend = EmailBackend()
+        backend = UsernameOrEmailBackend()
         expected_user = backend.authenticate(
             mock_request, username=email, password=password
         )
@@ -53,6 +54,65 @@ class TestEmailBackend:
         password = "foo"
         email = "foo"
         CustomUserFactory(email=email, password=password, is_active=False)
-        backend = EmailBackend()
+        backend = UsernameOrEmailBackend()
         result = backend.authenticate(mock_request, username=email, password=password)
         assert result is None
+
+    @pytest.mark.django_db
+    def test_user_exist_by_username(self, mock_request: Any) -> None:
+        user = CustomUserFactory(username="foo", password="foo")
+        backend = UsernameOrEmailBackend()
+        result = backend.authenticate(mock_request, username="foo", password="foo")
+        assert result == user
+
+    @pytest.mark.django_db
+    def test_wrong_password(self, mock_request: Any) -> None:
+        user = CustomUserFactory(password="foo")
+        backend = UsernameOrEmailBackend()
+        result = backend.authenticate(mock_request, username=user.email, password="bar")
+        assert result is None
+
+    @pytest.mark.django_db
+    def test_username_wins_over_email(self, mock_request: Any) -> None:
+        CustomUserFactory(email="foo@mail.com", password="foo")
+        user = CustomUserFactory(username="foo@mail.com", password="foo")
+        backend = UsernameOrEmailBackend()
+        result = backend.authenticate(
+            mock_request, username="foo@mail.com", password="foo"
+        )
+        assert result == user
+
+    @pytest.mark.django_db
+    def test_resolves_the_user_in_one_query(
+        self, mock_request: Any, django_assert_num_queries: Any
+    ) -> None:
+        user = CustomUserFactory(email="foo@mail.com", password="foo")
+        backend = UsernameOrEmailBackend()
+        with django_assert_num_queries(1):
+            result = backend.authenticate(
+                mock_request, username="foo@mail.com", password="foo"
+            )
+        assert result == user
+
+    @pytest.mark.django_db
+    def test_unknown_user_checks_the_dummy_hash(self, mock_request: Any) -> None:
+        backend = UsernameOrEmailBackend()
+        with mock.patch(
+            "webapp.accounts.auth.backends.check_password"
+        ) as check_password:
+            backend.authenticate(mock_request, username="foo@mail.com", password="foo")
+            backend.authenticate(mock_request, username="bar@mail.com", password="bar")
+
+        first, second = check_password.call_args_list
+        assert first.args[1] == second.args[1]
+        assert first.args[1] == dummy_password_hash()
+
+    def test_dummy_hash_follows_the_hasher_costs(self, settings: Any) -> None:
+        settings.PASSWORD_HASHERS = [
+            "webapp.accounts.auth.hashers.PBKDF2PasswordHasher"
+        ]
+        settings.PASSWORD_HASHER_COSTS = {"pbkdf2_sha256": {"iterations": 10}}
+        assert dummy_password_hash().startswith("pbkdf2_sha256$10$")
+
+        settings.PASSWORD_HASHER_COSTS = {"pbkdf2_sha256": {"iterations": 20}}
+        assert dummy_password_hash().startswith("pbkdf2_sha256$20$")
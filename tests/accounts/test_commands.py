@@ -0,0 +1,71 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from tests.accounts.factories import CustomUserFactory
+from webapp.accounts.models import CustomUser, Reference, Sequence
+
+
+@pytest.mark.django_db
+def test_prune_references() -> None:
+    for _ in range(3):
+        Reference.objects.create()
+    CustomUserFactory(username="user-000042")
+
+    out = StringIO()
+    call_command("prune_references", "--batch-size", "2", stdout=out)
+
+    assert "Pruned 3 references." in out.getvalue()
+    assert not Reference.objects.exists()
+    assert list(Sequence.objects.reserve("username", size=1)) == [43]
+
+
+@pytest.mark.django_db
+def test_import_users_from_csv(tmp_path: Path) -> None:
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "first_name,middle_name,last_name,email,password\n"
+        "Ada,,Lovelace,ada@example.com,@Mypassword123\n"
+        "Alan,Mathison,Turing,alan@example.com,\n"
+    )
+
+    out = StringIO()
+    call_command("import_users", str(path), stdout=out)
+
+    assert "Imported 2 users" in out.getvalue()
+    assert "rows/second" in out.getvalue()
+    user = CustomUser.objects.get(email="alan@example.com")
+    assert user.middle_name == "Mathison"
+
+
+@pytest.mark.django_db
+def test_import_users_from_jsonl(tmp_path: Path) -> None:
+    path = tmp_path / "users.jsonl"
+    path.write_text(
+        '{"first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.com"}\n'
+        "\n"
+        '{"first_name": "Alan", "last_name": "Turing", "email": "alan@example.com"}\n'
+    )
+
+    call_command("import_users", str(path), stdout=StringIO())
+
+    assert CustomUser.objects.filter(email__endswith="@example.com").count() == 2
+
+
+@pytest.mark.django_db
+def test_import_users_reports_the_invalid_lines(tmp_path: Path) -> None:
+    path = tmp_path / "users.jsonl"
+    path.write_text(
+        '{"first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.com"}\n'
+        "\n"
+        '{"first_name": "Alan", "last_name": "Turing", "email": "alan"}\n'
+    )
+
+    err = StringIO()
+    with pytest.raises(CommandError, match="Nothing was imported."):
+        call_command("import_users", str(path), stdout=StringIO(), stderr=err)
+
+    assert "Line 3 (email): Enter a valid email address." in err.getvalue()
+    assert not CustomUser.objects.exists()
@@ -0,0 +1,68 @@
+from typing import Any
+
+import pytest
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+
+from tests.accounts.factories import CustomUserFactory
+from webapp.accounts.auth.hashers import ScryptPasswordHasher
+
+SCRYPT = "webapp.accounts.auth.hashers.ScryptPasswordHasher"
+PBKDF2 = "webapp.accounts.auth.hashers.PBKDF2PasswordHasher"
+
+
+@pytest.fixture
+def cheap_costs(settings: Any) -> Any:
+    settings.PASSWORD_HASHER_COSTS = {
+        "scrypt": {"work_factor": 2**4, "block_size": 8, "parallelism": 1},
+        "pbkdf2_sha256": {"iterations": 10},
+    }
+    return settings
+
+
+class TestTunableHashers:
+    def test_costs_are_read_from_the_settings(self, cheap_costs: Any) -> None:
+        cheap_costs.PASSWORD_HASHERS = [SCRYPT]
+        encoded = get_hasher().encode("foo", "salt")
+        assert encoded.startswith("scrypt$16$salt$8$1$")
+
+    def test_missing_costs_fall_back_to_the_django_defaults(
+        self, settings: Any
+    ) -> None:
+        settings.PASSWORD_HASHER_COSTS = {}
+        assert ScryptPasswordHasher().parallelism == 5
+
+    @pytest.mark.django_db
+    def test_login_rehashes_with_new_costs(self, cheap_costs: Any) -> None:
+        cheap_costs.PASSWORD_HASHERS = [PBKDF2]
+        user = CustomUserFactory(password="foo")
+        assert user.password.startswith("pbkdf2_sha256$10$")
+
+        cheap_costs.PASSWORD_HASHER_COSTS = {"pbkdf2_sha256": {"iterations": 20}}
+        assert authenticate(None, username=user.username, password="foo") == user
+
+        user.refresh_from_db()
+        assert user.password.startswith("pbkdf2_sha256$20$")
+
+    @pytest.mark.django_db
+    def test_login_rehashes_with_the_preferred_hasher(self, cheap_costs: Any) -> None:
+        cheap_costs.PASSWORD_HASHERS = [PBKDF2]
+        user = CustomUserFactory(password="foo")
+
+        cheap_costs.PASSWORD_HASHERS = [SCRYPT, PBKDF2]
+        assert authenticate(None, username=user.email, password="foo") == user
+
+        user.refresh_from_db()
+        assert identify_hasher(user.password).algorithm == "scrypt"
+
+    @pytest.mark.django_db
+    def test_failed_login_keeps_the_hash(self, cheap_costs: Any) -> None:
+        cheap_costs.PASSWORD_HASHERS = [PBKDF2]
+        user = CustomUserFactory(password="foo")
+        encoded = user.password
+
+        cheap_costs.PASSWORD_HASHERS = [SCRYPT, PBKDF2]
+        assert authenticate(None, username=user.email, password="bar") is None
+
+        user.refresh_from_db()
+        assert user.password == encoded
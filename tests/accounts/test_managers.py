@@ -113,3 +113,16 @@ class TestCustomUserManager:
         permission = Permission.objects.filter(codename="view_customuser").first()
         with pytest.raises(TypeError):
             CustomUser.objects.with_perm(perm=permission, is_active=True, backend=True)  # type: ignore
+
+
+@pytest.mark.django_db
+def test_search_matches_each_word_on_a_name_username_or_email_prefix() -> None:
+    ada = CustomUserFactory(first_name="Ada", last_name="Lovelace", email="ada@a.com")
+    alan = CustomUserFactory(first_name="Alan", last_name="Turing", email="at@b.com")
+    CustomUserFactory(first_name="Grace", last_name="Hopper", email="gh@c.com")
+
+    assert list(CustomUser.objects.all().search("a")) == [ada, alan]
+    assert list(CustomUser.objects.all().search("ADA love")) == [ada]
+    assert list(CustomUser.objects.all().search("turing")) == [alan]
+    assert list(CustomUser.objects.all().search("at@")) == [alan]
+    assert list(CustomUser.objects.all().search("uring")) == []
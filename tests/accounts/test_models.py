@@ -1,7 +1,10 @@
+from typing import Any
+
 import pytest
+from django.db import transaction
 
 from tests.accounts.factories import CustomUserFactory
-from webapp.accounts.models import Reference
+from webapp.accounts.models import Reference, Sequence, SequenceAllocator
 
 
 def test_custom_user_str_() -> None:
@@ -35,3 +38,60 @@ def test_reference_generate_username() -> None:
     username = Reference.generate_username()
     assert isinstance(username, str)
     assert username.startswith("user-")
+
+
+@pytest.mark.django_db
+def test_reference_generate_username_does_not_insert_references() -> None:
+    first = Reference.generate_username()
+    second = Reference.generate_username()
+    assert first != second
+    assert not Reference.objects.exists()
+
+
+@pytest.mark.django_db
+def test_sequence_reserve() -> None:
+    first = Sequence.objects.reserve("test", size=3)
+    second = Sequence.objects.reserve("test", size=2)
+    assert list(first) == [1, 2, 3]
+    assert list(second) == [4, 5]
+
+
+@pytest.mark.django_db
+def test_sequence_advance() -> None:
+    Sequence.objects.advance("test", past=10)
+    Sequence.objects.advance("test", past=5)
+    assert list(Sequence.objects.reserve("test", size=1)) == [11]
+
+
+class TestSequenceAllocator:
+    @pytest.mark.django_db(transaction=True)
+    def test_writes_once_per_block(self, django_assert_num_queries: Any) -> None:
+        Sequence.objects.create(name="test")
+        allocator = SequenceAllocator("test", block_size=5)
+        with django_assert_num_queries(4):
+            values = [allocator.next_value() for _ in range(5)]
+        assert values == [1, 2, 3, 4, 5]
+        assert allocator.next_value() == 6
+
+    @pytest.mark.django_db
+    def test_reserves_per_call_until_the_transaction_commits(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        allocator = SequenceAllocator("test", block_size=5)
+        with django_capture_on_commit_callbacks(execute=True):
+            values = [allocator.next_value() for _ in range(2)]
+        assert values == [1, 6]
+        assert list(allocator.values) == [2, 3, 4, 5, 7, 8, 9, 10]
+
+    @pytest.mark.django_db
+    def test_rolled_back_block_is_not_reused(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        allocator = SequenceAllocator("test", block_size=5)
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    assert allocator.next_value() == 1
+                    raise RuntimeError
+        assert callbacks == []
+        assert not allocator.values
@@ -1,4 +1,8 @@
+from typing import Any
+
 import pytest
+from django.contrib.auth.hashers import check_password
+from django.core.exceptions import ValidationError
 
 from tests.accounts.factories import CustomUserFactory
 from webapp.accounts import services
@@ -42,3 +46,65 @@ def test_update_profile_details() -> None:
     user.refresh_from_db()
     assert user.first_name == "Ntuthuko"
     assert user.last_name == "Dlamini"
+
+
+def test_hash_passwords_in_worker_processes() -> None:
+    encoded = services.hash_passwords(["first", "second", None], workers=2)
+    assert check_password("first", encoded[0])
+    assert check_password("second", encoded[1])
+    assert encoded[2].startswith("!")
+
+
+@pytest.mark.django_db
+class TestBulkCreateUsers:
+    def test_creates_the_users(self, django_assert_num_queries: Any) -> None:
+        rows = [
+            {
+                "first_name": "Ada",
+                "last_name": "Lovelace",
+                "email": "ada@EXAMPLE.com",
+                "password": "@Mypassword123",
+            },
+            {"first_name": "Alan", "last_name": "Turing", "email": "alan@example.com"},
+        ]
+
+        with django_assert_num_queries(8):
+            users = services.bulk_create_users(users=rows)
+
+        ada, alan = CustomUser.objects.filter(
+            pk__in=[user.pk for user in users]
+        ).order_by("first_name")
+        assert ada.email == "ada@example.com"
+        assert ada.check_password("@Mypassword123")
+        assert not alan.has_usable_password()
+        assert ada.username.startswith("user-")
+        assert ada.username != alan.username
+
+    def test_invalid_rows_create_nothing(self) -> None:
+        CustomUserFactory(email="taken@example.com")
+        rows: Any = [
+            {"first_name": "Ada", "last_name": "Lovelace", "email": "not-an-email"},
+            {"first_name": "", "last_name": "Turing", "email": "TAKEN@example.com"},
+            {"first_name": "Grace", "last_name": "Hopper", "email": "g@example.com"},
+            {"first_name": "Grace", "last_name": "Hopper", "email": "G@example.com"},
+            {
+                "first_name": "Ken",
+                "last_name": "Thompson",
+                "email": "ken@example.com",
+                "password": "123",
+            },
+            "not a row",
+        ]
+
+        with pytest.raises(ValidationError) as error:
+            services.bulk_create_users(users=rows)
+
+        assert sorted(error.value.message_dict) == [
+            "0.email",
+            "1.email",
+            "1.first_name",
+            "3.email",
+            "4.password",
+            "5",
+        ]
+        assert CustomUser.objects.count() == 1
@@ -0,0 +1,25 @@
+from typing import Any, Iterator
+
+import pytest
+from django.core.cache import cache
+
+from webapp.tasktrack.managers import clear_lookup_caches
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches() -> Iterator[None]:
+    """Keep the lookup and django caches from leaking rows between tests."""
+
+    clear_lookup_caches()
+    cache.clear()
+    yield
+    clear_lookup_caches()
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def enforce_query_budgets(settings: Any) -> None:
+    """Fail any test whose request runs more queries than its view's budget."""
+
+    settings.QUERY_PROFILER_ENABLED = True
+    settings.QUERY_BUDGET_RAISE = True
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import F
+from django.utils import timezone
+
+from tests.tasktrack.factories import PriorityFactory, StatusFactory, TaskFactory
+from webapp.accounts.models import CustomUser
+from webapp.tasktrack.enums import PriorityLevel, StatusType
+from webapp.tasktrack.models import Task, TaskArchive, TaskStatistics
+from webapp.tasktrack.seeding import generate_tasks
+
+
+@pytest.mark.django_db
+def test_rebuild_task_stats() -> None:
+
+    task = TaskFactory(due_date=None)
+    TaskStatistics.objects.all().delete()
+
+    out = StringIO()
+    call_command("rebuild_task_stats", stdout=out)
+
+    assert "Rebuilt 4 task statistics." in out.getvalue()
+    assert TaskStatistics.status_counts()[task.status.name.lower()] == 1
+
+
+@pytest.mark.django_db
+def test_seed_tasks() -> None:
+
+    out = StringIO()
+    call_command(
+        "seed_tasks", users=5, tasks=120, chunk_size=50, password="secret", stdout=out
+    )
+
+    assert "Seeded 120 tasks" in out.getvalue()
+    assert CustomUser.objects.filter(username__startswith="seed-").count() == 5
+    assert CustomUser.objects.latest("pk").check_password("secret")
+    assert Task.objects.count() == 120
+    assert sum(TaskStatistics.status_counts().values()) == 120
+    assert not Task.objects.filter(due_date__lt=F("created_at__date")).exists()
+
+
+@pytest.mark.django_db
+def test_archive_tasks() -> None:
+
+    old = timezone.now() - timedelta(days=100)
+    recent = timezone.now() - timedelta(days=5)
+    priority = PriorityFactory(name=PriorityLevel.LOW)
+    statuses = {name: StatusFactory(name=name) for name in StatusType.values}
+    archived = [
+        TaskFactory(
+            status=statuses[name],
+            priority=priority,
+            due_date=None,
+            created_at=old,
+            updated_at=old,
+        )
+        for name in (StatusType.COMPLETED, StatusType.CANCELLED)
+    ]
+    kept = [
+        TaskFactory(
+            status=statuses[name],
+            priority=priority,
+            due_date=None,
+            created_at=old,
+            updated_at=updated_at,
+        )
+        for name, updated_at in (
+            (StatusType.COMPLETED, recent),
+            (StatusType.PENDING, old),
+            (StatusType.IN_PROGRESS, old),
+        )
+    ]
+
+    out = StringIO()
+    call_command("archive_tasks", older_than=30, batch_size=1, stdout=out)
+
+    assert "Archived 2 tasks in total." in out.getvalue()
+    assert set(TaskArchive.objects.values_list("pk", flat=True)) == {
+        task.pk for task in archived
+    }
+    assert set(Task.objects.values_list("pk", flat=True)) == {task.pk for task in kept}
+
+
+def test_archive_tasks_requires_a_positive_batch_size() -> None:
+
+    with pytest.raises(CommandError, match="--batch-size must be positive"):
+        call_command("archive_tasks", older_than=30, batch_size=0)
+
+
+def test_sync_replicas_requires_replicas() -> None:
+
+    with pytest.raises(CommandError, match="No replicas are configured"):
+        call_command("sync_replicas", stdout=StringIO())
+
+
+def test_generate_tasks_is_deterministic() -> None:
+
+    now = timezone.now()
+    arguments = {
+        "count": 20,
+        "user_ids": [1, 2, 3],
+        "status_ids": {name: index for index, name in enumerate(StatusType.values)},
+        "priority_ids": {
+            name: index for index, name in enumerate(PriorityLevel.values)
+        },
+        "now": now,
+    }
+
+    assert generate_tasks(seed=1, **arguments) == generate_tasks(seed=1, **arguments)
+    assert generate_tasks(seed=1, **arguments) != generate_tasks(seed=2, **arguments)
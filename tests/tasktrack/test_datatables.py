@@ -0,0 +1,207 @@
+import datetime
+
+import pytest
+from django.db.models.expressions import OrderBy
+from django.http import QueryDict
+
+from tests.accounts.factories import CustomUserFactory
+from tests.tasktrack.factories import PriorityFactory, StatusFactory, TaskFactory
+from webapp.tasktrack.datatables import column_searches, ordering, task_table
+from webapp.tasktrack.enums import PriorityLevel, StatusType
+from webapp.tasktrack.models import Task
+
+
+def _params(**values: str) -> QueryDict:
+    params = QueryDict(mutable=True)
+    for index, column in enumerate(["title", "priority", "assigned_to", "urls"]):
+        params[f"columns[{index}][data]"] = column
+    params.update(values)
+    return params
+
+
+def test_ordering() -> None:
+    params = _params(
+        **{
+            "order[0][column]": "2",
+            "order[0][dir]": "desc",
+            "order[1][column]": "1",
+            "order[1][dir]": "asc",
+        }
+    )
+
+    fields = ordering(params)
+
+    assert fields[:2] == ["-assigned_to__first_name", "-assigned_to__last_name"]
+    assert isinstance(fields[2], OrderBy) and not fields[2].descending
+    assert fields[3:] == ["-pk"]
+
+
+def test_ordering_ignores_unknown_columns() -> None:
+    params = _params(**{"order[0][column]": "3", "order[0][dir]": "asc"})
+
+    assert ordering(params) == ["-pk"]
+
+
+def test_column_searches() -> None:
+    params = _params(
+        **{
+            "columns[0][search][value]": " report ",
+            "columns[1][search][value]": "",
+            "columns[3][search][value]": "ignored",
+        }
+    )
+
+    assert column_searches(params) == {"title": "report"}
+
+
+@pytest.mark.django_db
+class TestTaskTable:
+    def setup_method(self) -> None:
+        self.user = CustomUserFactory(is_superuser=True)
+        self.pending = StatusFactory(name=StatusType.PENDING)
+        self.completed = StatusFactory(name=StatusType.COMPLETED)
+        self.low = PriorityFactory(name=PriorityLevel.LOW)
+        self.high = PriorityFactory(name=PriorityLevel.HIGH)
+
+    def _task(self, **kwargs: object) -> Task:
+        kwargs.setdefault("status", self.pending)
+        kwargs.setdefault("priority", self.low)
+        kwargs.setdefault("due_date", None)
+        return TaskFactory(**kwargs)
+
+    def _table(self, **values: str) -> dict:
+        return task_table(
+            _params(**values), Task.objects.all(), user=self.user, total=lambda: 99
+        )
+
+    def test_pages_newest_first(self) -> None:
+        tasks = [self._task(title=f"Task {index}") for index in range(3)]
+
+        table = self._table(draw="4", start="1", length="1")
+
+        assert table["draw"] == 4
+        assert table["recordsTotal"] == 99
+        assert table["recordsFiltered"] == 99
+        assert [row["id"] for row in table["data"]] == [tasks[1].pk]
+
+    def test_pages_after_the_last_row_shown(self) -> None:
+        tasks = [self._task(title=f"Task {index}") for index in range(4)]
+
+        table = self._table(start="2", length="2", after=str(tasks[2].pk))
+        ordered = self._table(
+            start="2",
+            length="2",
+            after=str(tasks[2].pk),
+            **{"order[0][column]": "0", "order[0][dir]": "asc"},
+        )
+
+        assert [row["id"] for row in table["data"]] == [tasks[1].pk, tasks[0].pk]
+        assert [row["id"] for row in ordered["data"]] == [tasks[2].pk, tasks[3].pk]
+
+    def test_orders_statuses_by_level(self) -> None:
+        in_progress = StatusFactory(name=StatusType.IN_PROGRESS)
+        completed = self._task(status=self.completed)
+        started = self._task(status=in_progress)
+        pending = self._task(status=self.pending)
+        params = _params(**{"order[0][column]": "0", "order[0][dir]": "desc"})
+        params["columns[0][data]"] = "status"
+
+        table = task_table(params, Task.objects.all(), user=self.user, total=int)
+
+        assert [row["id"] for row in table["data"]] == [
+            completed.pk,
+            started.pk,
+            pending.pk,
+        ]
+
+    def test_length_is_capped(self, settings: object) -> None:
+        settings.TASK_LIST_MAX_PAGE_SIZE = 2  # type: ignore
+        for index in range(3):
+            self._task(title=f"Task {index}")
+
+        assert len(self._table(length="-1")["data"]) == 2
+        assert len(self._table(length="500")["data"]) == 2
+
+    def test_global_search(self) -> None:
+        match = self._task(title="Renew domain")
+        self._task(title="Order lunch")
+
+        table = self._table(**{"search[value]": "doma"})
+
+        assert table["recordsFiltered"] == 1
+        assert [row["id"] for row in table["data"]] == [match.pk]
+
+    def test_global_search_keeps_the_search_rank(self) -> None:
+        best = self._task(title="Renew domain", description="domain")
+        other = self._task(title="Renew certificate", description="domain")
+        params = {"search[value]": "renew domain", "start": "0", "length": "1"}
+
+        first = task_table(
+            _params(**params),
+            Task.objects.all(),
+            user=self.user,
+            total=lambda: 99,
+            rank_search=True,
+        )
+        params["start"] = "1"
+        second = task_table(
+            _params(**params),
+            Task.objects.all(),
+            user=self.user,
+            total=lambda: 99,
+            rank_search=True,
+        )
+
+        assert first["recordsFiltered"] == 2
+        assert [row["id"] for row in first["data"]] == [best.pk]
+        assert [row["id"] for row in second["data"]] == [other.pk]
+
+    def test_column_filters(self) -> None:
+        ada = CustomUserFactory(first_name="Ada", last_name="Lovelace")
+        match = self._task(title="Report", priority=self.high, assigned_to=ada)
+        self._task(title="Report", priority=self.low, assigned_to=ada)
+        self._task(title="Report", priority=self.high)
+
+        table = self._table(
+            **{
+                "columns[0][search][value]": "repo",
+                "columns[1][search][value]": "high",
+                "columns[2][search][value]": "ada love",
+            }
+        )
+
+        assert [row["id"] for row in table["data"]] == [match.pk]
+
+    def test_date_filters(self) -> None:
+        match = self._task(due_date=datetime.date(2030, 5, 2))
+        self._task(due_date=datetime.date(2030, 6, 1))
+        params = _params(
+            **{
+                "columns[0][data]": "due_date",
+                "columns[0][search][value]": "2030-05-01,2030-05-31",
+            }
+        )
+
+        table = task_table(params, Task.objects.all(), user=self.user, total=int)
+
+        assert [row["id"] for row in table["data"]] == [match.pk]
+
+        params["columns[0][search][value]"] = "not a date"
+        table = task_table(params, Task.objects.all(), user=self.user, total=int)
+
+        assert table["data"] == []
+
+    def test_row(self) -> None:
+        task = self._task(
+            title="<b>Report</b>", status=self.completed, assigned_to=self.user
+        )
+
+        row = self._table()["data"][0]
+
+        assert row["title"] == "<b>Report</b>"
+        assert row["priority"] == {"name": "LOW", "colour": "warning"}
+        assert row["status"]["name"] == "COMPLETED"
+        assert row["assigned_to"] == "Me"
+        assert row["urls"]["details"].endswith(f"{task.pk}/")
+        assert row["urls"]["update"] is None
+        assert row["urls"]["delete"] is None
@@ -127,3 +127,16 @@ class TestCreateCalendarTaskForm:
         assert "title" in form.errors
         assert "priority" in form.errors
         assert "assigned_to" in form.errors
+
+
+@pytest.mark.django_db
+def test_assignee_widget_renders_only_the_selected_user() -> None:
+    selected = CustomUserFactory(first_name="Ada", last_name="Lovelace")
+    CustomUserFactory(first_name="Alan", last_name="Turing")
+
+    form = CreateTaskForm(initial={"assigned_to": selected.pk})
+    html = str(form["assigned_to"])
+
+    assert "Ada Lovelace" in html
+    assert "Alan Turing" not in html
+    assert 'data-ajax--url="/api/users/search/"' in html
@@ -0,0 +1,232 @@
+import datetime
+from typing import Any
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tests.accounts.factories import CustomUserFactory
+from tests.tasktrack.factories import PriorityFactory, StatusFactory, TaskFactory
+from webapp.tasktrack.enums import PriorityLevel, StatusType
+from webapp.tasktrack.models import Priority, Status, Task
+
+
+@pytest.mark.django_db
+class TestTaskQuerySetAggregation:
+    def setup_method(self) -> None:
+        self.year = timezone.now().year
+        self.created_at = datetime.datetime(
+            self.year, 1, 1, tzinfo=timezone.get_current_timezone()
+        )
+
+    def test_status_counts(self) -> None:
+        priority = PriorityFactory()
+        pending = StatusFactory(name=StatusType.PENDING)
+        completed = StatusFactory(name=StatusType.COMPLETED)
+
+        TaskFactory.create_batch(2, status=pending, priority=priority, due_date=None)
+        TaskFactory(status=completed, priority=priority, due_date=None)
+
+        assert Task.objects.all().status_counts() == {
+            "pending": 2,
+            "in_progress": 0,
+            "completed": 1,
+            "cancelled": 0,
+        }
+
+    def test_priority_counts(self) -> None:
+        status = StatusFactory()
+        low = PriorityFactory(name=PriorityLevel.LOW)
+        critical = PriorityFactory(name=PriorityLevel.CRITICAL)
+
+        TaskFactory(status=status, priority=low, due_date=None)
+        TaskFactory.create_batch(3, status=status, priority=critical, due_date=None)
+
+        assert Task.objects.all().priority_counts() == {
+            "low_priority": 1,
+            "medium_priority": 0,
+            "high_priority": 0,
+            "critical_priority": 3,
+        }
+
+    def test_counts_by_month(self) -> None:
+        priority = PriorityFactory()
+        completed = StatusFactory(name=StatusType.COMPLETED)
+        pending = StatusFactory(name=StatusType.PENDING)
+
+        TaskFactory.create_batch(
+            2,
+            status=completed,
+            priority=priority,
+            due_date=datetime.date(self.year, 2, 1),
+            created_at=self.created_at,
+            updated_at=self.created_at.replace(month=3, day=10),
+        )
+        TaskFactory(
+            status=pending,
+            priority=priority,
+            due_date=datetime.date(self.year, 2, 20),
+            created_at=self.created_at,
+            updated_at=self.created_at.replace(month=3, day=10),
+        )
+
+        due_counts = Task.objects.all().due_counts_by_month(year=self.year)
+        completed_counts = Task.objects.all().completed_counts_by_month(year=self.year)
+
+        assert due_counts["feb_due_tasks"] == 3
+        assert sum(due_counts.values()) == 3
+        assert completed_counts["mar_completed_tasks"] == 2
+        assert sum(completed_counts.values()) == 2
+
+    def test_counts_by(self) -> None:
+        priority = PriorityFactory()
+        pending = StatusFactory(name=StatusType.PENDING)
+        user = CustomUserFactory()
+        TaskFactory.create_batch(
+            2, status=pending, priority=priority, assigned_to=user, due_date=None
+        )
+        TaskFactory(
+            status=pending,
+            priority=priority,
+            due_date=datetime.date(self.year, 4, 9),
+            created_at=self.created_at,
+        )
+
+        assert Task.objects.all().counts_by("status_id") == {(pending.pk,): 3}
+        assert Task.objects.filter(assigned_to=user).counts_by(
+            "assigned_to_id", "status_id"
+        ) == {(user.pk, pending.pk): 2}
+        assert Task.objects.all().counts_by_month("due_date") == {
+            (datetime.date(self.year, 4, 1),): 1
+        }
+
+    def test_dashboard_counts_uses_a_single_query(self) -> None:
+        priority = PriorityFactory(name=PriorityLevel.HIGH)
+        status = StatusFactory(name=StatusType.IN_PROGRESS)
+        TaskFactory.create_batch(
+            3,
+            status=status,
+            priority=priority,
+            due_date=datetime.date(self.year, 12, 1),
+            created_at=self.created_at,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            counts = Task.objects.all().dashboard_counts(year=self.year)
+
+        assert len(queries) == 1
+        assert counts["task_counts"]["in_progress"] == 3
+        assert counts["task_counts"]["high_priority"] == 3
+        assert counts["due_tasks_count_by_month"]["dec_due_tasks"] == 3
+        assert set(counts["completed_tasks_count_by_month"]) == {
+            f"{month}_completed_tasks"
+            for month in [
+                "jan",
+                "feb",
+                "mar",
+                "apr",
+                "may",
+                "jun",
+                "jul",
+                "aug",
+                "sep",
+                "oct",
+                "nov",
+                "dec",
+            ]
+        }
+
+
+@pytest.mark.django_db
+class TestLookupCache:
+    def test_cached_rows_are_served_without_queries(
+        self, django_assert_num_queries: Any
+    ) -> None:
+        pending = StatusFactory(name=StatusType.PENDING)
+        Status.objects.cached(StatusType.PENDING)
+
+        with django_assert_num_queries(0):
+            assert Status.objects.cached(StatusType.PENDING) == pending
+            assert Status.objects.cached_by_pk(pending.pk) == pending
+            assert Status.objects.cached_all() == [pending]
+
+    def test_cache_is_cleared_on_save_and_delete(self) -> None:
+        low = PriorityFactory(name=PriorityLevel.LOW)
+        assert Priority.objects.cached(PriorityLevel.LOW) == low
+
+        low.name = PriorityLevel.HIGH
+        low.save()
+
+        assert Priority.objects.cached(PriorityLevel.LOW) is None
+        assert Priority.objects.cached(PriorityLevel.HIGH) == low
+
+        low.delete()
+
+        assert Priority.objects.cached(PriorityLevel.HIGH) is None
+        assert Priority.objects.cached_all() == []
+
+    def test_cache_miss_reloads_rows_created_elsewhere(self) -> None:
+        assert Status.objects.cached_all() == []
+
+        Status.objects.bulk_create([Status(name=StatusType.CANCELLED)])
+
+        assert Status.objects.cached(StatusType.CANCELLED).name == StatusType.CANCELLED
+
+
+@pytest.mark.django_db
+class TestTaskSearch:
+    def setup_method(self) -> None:
+        self.status = StatusFactory(name=StatusType.PENDING)
+        self.priority = PriorityFactory(name=PriorityLevel.LOW)
+
+    def _task(self, **kwargs: Any) -> Task:
+        return TaskFactory(
+            status=self.status, priority=self.priority, due_date=None, **kwargs
+        )
+
+    def _search(self, query: str) -> list:
+        return list(Task.objects.all().search(query, limit=10))
+
+    def test_search_ranks_and_prefix_matches(self) -> None:
+        weak = self._task(title="Quarterly report", description="Mention invoices")
+        strong = self._task(title="Invoice invoice run", description="Invoices")
+        self._task(title="Unrelated", description="Nothing to see")
+
+        assert self._search("invoice") == [strong, weak]
+        assert self._search("quart rep") == [weak]
+        assert self._search("  ") == []
+
+    def test_search_follows_task_and_assignee_changes(self) -> None:
+        assignee = CustomUserFactory(first_name="Ada", last_name="Lovelace")
+        task = self._task(title="Engine notes", assigned_to=assignee)
+
+        assert self._search("lovelace") == [task]
+
+        task.title = "Analytical engine"
+        task.save()
+        assignee.last_name = "Byron"
+        assignee.save()
+
+        assert self._search("notes") == []
+        assert self._search("analytical byron") == [task]
+
+        task.delete()
+
+        assert self._search("analytical") == []
+
+    def test_matching_filters_without_ranking(self) -> None:
+        first = self._task(title="Invoice run")
+        second = self._task(title="Quarterly report", description="Invoices")
+        self._task(title="Unrelated")
+
+        matching = Task.objects.all().matching("invoice").order_by("pk")
+
+        assert list(matching) == [first, second]
+        assert Task.objects.all().matching(" ").count() == 3
+
+    def test_search_limit(self) -> None:
+        for _ in range(3):
+            self._task(title="Repeated title")
+
+        assert len(Task.objects.all().search("repeated", limit=2)) == 2
@@ -0,0 +1,138 @@
+import logging
+from typing import Any
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from django.urls import reverse
+
+from tests.accounts.factories import CustomUserFactory
+from tests.tasktrack.factories import PriorityFactory, StatusFactory
+from webapp.tasktrack.enums import StatusType
+from webapp.tasktrack.middleware import (
+    PRIMARY_PIN_COOKIE,
+    QueryBudgetExceeded,
+    fingerprint,
+)
+
+
+def test_fingerprint_collapses_literals() -> None:
+
+    assert fingerprint(
+        'SELECT * FROM "t" WHERE "id" IN (%s, %s, %s) AND "name" = \'x\' LIMIT 21'
+    ) == fingerprint(
+        'SELECT * FROM "t" WHERE "id" IN (%s, %s) AND "name" = \'y\' LIMIT 5'
+    )
+    assert fingerprint('SAVEPOINT "s1404_x4"') == fingerprint('SAVEPOINT "s99_x12"')
+
+
+@pytest.mark.django_db
+class TestQueryProfilerMiddleware:
+    def test_server_timing_header(self, client: Client) -> None:
+
+        client.force_login(CustomUserFactory())
+
+        response = client.get(reverse("home"))
+
+        assert response.status_code == 200
+        assert "db;dur=" in response["Server-Timing"]
+        assert 'queries"' in response["Server-Timing"]
+        assert "total;dur=" in response["Server-Timing"]
+
+    def test_disabled_profiler_is_skipped(self, client: Client, settings: Any) -> None:
+
+        settings.QUERY_PROFILER_ENABLED = False
+        settings.QUERY_BUDGETS = {"home": 1}
+        client.force_login(CustomUserFactory())
+
+        response = client.get(reverse("home"))
+
+        assert response.status_code == 200
+        assert "Server-Timing" not in response
+
+    def test_over_budget_raises(self, client: Client, settings: Any) -> None:
+
+        settings.QUERY_BUDGETS = {"home": 1}
+        client.force_login(CustomUserFactory())
+
+        with pytest.raises(QueryBudgetExceeded, match="home ran"):
+            client.get(reverse("home"))
+
+    def test_over_budget_logs(self, client: Client, settings: Any, caplog: Any) -> None:
+
+        settings.QUERY_BUDGETS = {"home": 1}
+        settings.QUERY_BUDGET_RAISE = False
+        client.force_login(CustomUserFactory())
+
+        with caplog.at_level(logging.WARNING, logger="webapp.tasktrack.middleware"):
+            response = client.get(reverse("home"))
+
+        assert response.status_code == 200
+        assert "over its budget of 1" in caplog.text
+
+    def test_streaming_responses_are_counted(
+        self, client: Client, settings: Any
+    ) -> None:
+
+        settings.QUERY_BUDGETS = {"task_calendar_api": 1}
+        client.force_login(CustomUserFactory(is_superuser=True))
+
+        response = client.get(reverse("task_calendar_api"))
+
+        with pytest.raises(QueryBudgetExceeded):
+            b"".join(response.streaming_content)
+
+    def test_async_requests_are_counted(
+        self, async_client: AsyncClient, settings: Any
+    ) -> None:
+
+        settings.QUERY_BUDGETS = {"home_counts_api": 0}
+        async_client.force_login(CustomUserFactory())
+
+        with pytest.raises(QueryBudgetExceeded, match="home_counts_api ran"):
+            async_to_sync(async_client.get)(reverse("home_counts_api"))
+
+
+@pytest.mark.django_db
+class TestReplicaStickinessMiddleware:
+    def test_writes_pin_the_client_to_the_primary(
+        self, client: Client, settings: Any
+    ) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        user = CustomUserFactory(is_superuser=True)
+        client.force_login(user)
+        StatusFactory(name=StatusType.PENDING)
+
+        response = client.post(
+            reverse("create_task"),
+            data={
+                "title": "Pinned",
+                "due_date": "",
+                "description": "Read back from the primary",
+                "priority": PriorityFactory().pk,
+                "assigned_to": user.pk,
+            },
+        )
+
+        assert response.status_code == 302
+        assert response.cookies[PRIMARY_PIN_COOKIE]["max-age"] == 60
+        # replica1 is not a configured database, so only a pinned read succeeds.
+        assert client.get(reverse("task_table_api")).json()["recordsTotal"] == 1
+
+    def test_reads_do_not_pin(self, client: Client, settings: Any) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        client.force_login(CustomUserFactory())
+
+        response = client.get(reverse("home"))
+
+        assert PRIMARY_PIN_COOKIE not in response.cookies
+
+    def test_without_replicas_writes_do_not_pin(self, client: Client) -> None:
+
+        client.force_login(CustomUserFactory(is_superuser=True))
+
+        response = client.post(reverse("create_task"), data={})
+
+        assert PRIMARY_PIN_COOKIE not in response.cookies
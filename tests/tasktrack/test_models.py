@@ -1,7 +1,16 @@
+import datetime
+from typing import Any
+
 import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 
+from tests.accounts.factories import CustomUserFactory
 from tests.tasktrack.factories import PriorityFactory, StatusFactory, TaskFactory
 from webapp.tasktrack.enums import PriorityLevel, StatusType
+from webapp.tasktrack.models import Task, TaskStatistics
 
 
 @pytest.mark.django_db
@@ -49,3 +58,271 @@ def test_status_str_() -> None:
 def test_task_str_() -> None:
     instance = TaskFactory.build()
     assert str(instance) == instance.title
+
+
+@pytest.mark.django_db
+class TestTaskStatistics:
+    def test_counts_follow_task_writes(self) -> None:
+        user = CustomUserFactory()
+        priority = PriorityFactory(name=PriorityLevel.HIGH)
+        pending = StatusFactory(name=StatusType.PENDING)
+        completed = StatusFactory(name=StatusType.COMPLETED)
+
+        task = TaskFactory(
+            status=pending, priority=priority, assigned_to=user, due_date=None
+        )
+        TaskFactory(status=pending, priority=priority, due_date=None)
+
+        assert TaskStatistics.status_counts()["pending"] == 2
+        assert TaskStatistics.status_counts(assigned_to=user)["pending"] == 1
+        assert TaskStatistics.priority_counts()["high_priority"] == 2
+
+        task = Task.objects.get(pk=task.pk)
+        task.status = completed
+        task.save()
+
+        assert TaskStatistics.status_counts()["pending"] == 1
+        assert TaskStatistics.status_counts()["completed"] == 1
+        assert TaskStatistics.status_counts(assigned_to=user) == {
+            "pending": 0,
+            "in_progress": 0,
+            "completed": 1,
+            "cancelled": 0,
+        }
+
+        task.delete()
+
+        assert TaskStatistics.status_counts()["completed"] == 0
+        assert TaskStatistics.status_counts(assigned_to=user)["completed"] == 0
+        assert TaskStatistics.priority_counts()["high_priority"] == 1
+
+    def test_saves_through_stale_instances_are_counted(self) -> None:
+        priority = PriorityFactory(name=PriorityLevel.HIGH)
+        pending = StatusFactory(name=StatusType.PENDING)
+        in_progress = StatusFactory(name=StatusType.IN_PROGRESS)
+        completed = StatusFactory(name=StatusType.COMPLETED)
+        task = TaskFactory(status=pending, priority=priority, due_date=None)
+
+        first = Task.objects.get(pk=task.pk)
+        second = Task.objects.get(pk=task.pk)
+        first.status = in_progress
+        first.save()
+        second.status = completed
+        second.save()
+
+        assert TaskStatistics.status_counts() == {
+            "pending": 0,
+            "in_progress": 0,
+            "completed": 1,
+            "cancelled": 0,
+        }
+
+    def test_saves_of_other_fields_leave_the_counts_alone(
+        self, django_assert_num_queries: Any
+    ) -> None:
+        pending = StatusFactory(name=StatusType.PENDING)
+        completed = StatusFactory(name=StatusType.COMPLETED)
+        task = TaskFactory(status=pending, priority=PriorityFactory(), due_date=None)
+
+        task.title = "Renamed"
+        task.status = completed
+        with django_assert_num_queries(1):
+            task.save(update_fields=["title"])
+
+        assert TaskStatistics.status_counts()["pending"] == 1
+        assert TaskStatistics.status_counts()["completed"] == 0
+
+    def test_queryset_and_cascade_deletes_are_counted(self) -> None:
+        user = CustomUserFactory()
+        priority = PriorityFactory(name=PriorityLevel.LOW)
+        pending = StatusFactory(name=StatusType.PENDING)
+        TaskFactory.create_batch(
+            2, status=pending, priority=priority, assigned_to=user, due_date=None
+        )
+        TaskFactory(status=pending, priority=priority, due_date=None)
+
+        Task.objects.filter(assigned_to=user).delete()
+
+        assert TaskStatistics.status_counts()["pending"] == 1
+        assert TaskStatistics.status_counts(assigned_to=user)["pending"] == 0
+
+        pending.delete()
+
+        assert TaskStatistics.status_counts()["pending"] == 0
+        assert TaskStatistics.priority_counts()["low_priority"] == 0
+
+    def test_cascade_deletes_count_in_constant_queries(self) -> None:
+        priority = PriorityFactory(name=PriorityLevel.LOW)
+        pending = StatusFactory(name=StatusType.PENDING)
+        now = timezone.now()
+        queries = []
+        for size in (2, 6):
+            user = CustomUserFactory()
+            TaskFactory.create_batch(
+                size,
+                status=pending,
+                priority=priority,
+                assigned_to=user,
+                created_by=user,
+                updated_by=user,
+                due_date=None,
+                created_at=now,
+                updated_at=now,
+            )
+            with CaptureQueriesContext(connection) as captured:
+                user.delete()
+            queries.append(len(captured))
+
+        assert queries[0] == queries[1]
+        assert TaskStatistics.status_counts()["pending"] == 0
+        assert TaskStatistics.priority_counts()["low_priority"] == 0
+        assert TaskStatistics.objects.filter(count__lt=0).count() == 0
+
+    def test_async_counts_match_sync_counts(self) -> None:
+        user = CustomUserFactory()
+        completed = StatusFactory(name=StatusType.COMPLETED)
+        StatusFactory(name=StatusType.PENDING)
+        priority = PriorityFactory(name=PriorityLevel.HIGH)
+        TaskFactory(
+            status=completed, priority=priority, assigned_to=user, due_date=None
+        )
+        year = timezone.now().year
+
+        assert async_to_sync(TaskStatistics.astatus_counts)(
+            assigned_to=user
+        ) == TaskStatistics.status_counts(assigned_to=user)
+        assert async_to_sync(TaskStatistics.adashboard_counts)(
+            year=year
+        ) == TaskStatistics.dashboard_counts(year=year)
+
+    def test_monthly_counts(self) -> None:
+        year = timezone.now().year
+        created_at = datetime.datetime(
+            year, 1, 1, tzinfo=timezone.get_current_timezone()
+        )
+        completed = StatusFactory(name=StatusType.COMPLETED)
+
+        TaskFactory.create_batch(
+            2,
+            status=completed,
+            priority=PriorityFactory(),
+            due_date=datetime.date(year, 5, 1),
+            created_at=created_at,
+            updated_at=created_at.replace(month=6),
+        )
+
+        counts = TaskStatistics.dashboard_counts(year=year)
+
+        assert counts["due_tasks_count_by_month"]["may_due_tasks"] == 2
+        assert counts["completed_tasks_count_by_month"]["jun_completed_tasks"] == 2
+        assert counts["completed_tasks_count_by_month"]["may_completed_tasks"] == 0
+
+    def test_dashboard_counts_match_the_task_queryset(self) -> None:
+        year = timezone.now().year
+        created_at = datetime.datetime(
+            year, 1, 1, tzinfo=timezone.get_current_timezone()
+        )
+        priority = PriorityFactory(name=PriorityLevel.MEDIUM)
+        for status in StatusType.values:
+            TaskFactory(
+                status=StatusFactory(name=status),
+                priority=priority,
+                due_date=datetime.date(year, 3, 1),
+                created_at=created_at,
+                updated_at=created_at.replace(month=7),
+            )
+
+        assert TaskStatistics.dashboard_counts(
+            year=year
+        ) == Task.objects.all().dashboard_counts(year=year)
+
+    def test_rebuild_matches_incremental_counts(self) -> None:
+        year = timezone.now().year
+        created_at = datetime.datetime(
+            year, 1, 1, tzinfo=timezone.get_current_timezone()
+        )
+        TaskFactory.create_batch(
+            3,
+            status=StatusFactory(),
+            priority=PriorityFactory(),
+            due_date=datetime.date(year, 3, 1),
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        incremental = set(
+            TaskStatistics.objects.values_list("dimension", "key", "count")
+        )
+
+        TaskStatistics.objects.all().delete()
+        TaskStatistics.rebuild()
+
+        rebuilt = set(TaskStatistics.objects.values_list("dimension", "key", "count"))
+        assert rebuilt == incremental
+
+
+@pytest.mark.django_db
+class TestHomeCountsCache:
+    def test_assignee_counts_are_cached(self, django_assert_num_queries: Any) -> None:
+        user = CustomUserFactory()
+        pending = StatusFactory(name=StatusType.PENDING)
+        TaskFactory(
+            status=pending, priority=PriorityFactory(), assigned_to=user, due_date=None
+        )
+
+        assert TaskStatistics.status_counts(assigned_to=user)["pending"] == 1
+
+        with django_assert_num_queries(0):
+            assert TaskStatistics.status_counts(assigned_to=user)["pending"] == 1
+
+    def test_reassignment_refreshes_both_assignees(self) -> None:
+        user = CustomUserFactory()
+        other = CustomUserFactory()
+        pending = StatusFactory(name=StatusType.PENDING)
+        task = TaskFactory(
+            status=pending, priority=PriorityFactory(), assigned_to=user, due_date=None
+        )
+
+        assert TaskStatistics.status_counts(assigned_to=user)["pending"] == 1
+        assert TaskStatistics.status_counts(assigned_to=other)["pending"] == 0
+
+        task.assigned_to = other
+        task.save()
+
+        assert TaskStatistics.status_counts(assigned_to=user)["pending"] == 0
+        assert TaskStatistics.status_counts(assigned_to=other)["pending"] == 1
+
+    def test_title_changes_keep_the_cached_counts(
+        self, django_assert_num_queries: Any
+    ) -> None:
+        user = CustomUserFactory()
+        now = timezone.now()
+        task = TaskFactory(
+            status=StatusFactory(name=StatusType.PENDING),
+            priority=PriorityFactory(),
+            assigned_to=user,
+            due_date=None,
+            created_at=now,
+            updated_at=now,
+        )
+        TaskStatistics.status_counts(assigned_to=user)
+
+        task.title = "Renamed"
+        task.save()
+
+        with django_assert_num_queries(0):
+            assert TaskStatistics.status_counts(assigned_to=user)["pending"] == 1
+
+    def test_rebuild_refreshes_assignee_counts(self) -> None:
+        user = CustomUserFactory()
+        pending = StatusFactory(name=StatusType.PENDING)
+        TaskFactory(
+            status=pending, priority=PriorityFactory(), assigned_to=user, due_date=None
+        )
+        TaskStatistics.status_counts(assigned_to=user)
+
+        Task.objects.update(status=StatusFactory(name=StatusType.COMPLETED))
+        TaskStatistics.rebuild()
+
+        counts = TaskStatistics.status_counts(assigned_to=user)
+        assert counts["pending"] == 0
+        assert counts["completed"] == 1
@@ -0,0 +1,80 @@
+import pytest
+from django.test import Client, RequestFactory
+from django.urls import reverse
+
+from tests.accounts.factories import CustomUserFactory
+from tests.tasktrack.factories import PriorityFactory, StatusFactory, TaskFactory
+from webapp.tasktrack.models import Task
+from webapp.tasktrack.pagination import paginate_by_keyset, paginate_tasks
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def setup_method(self) -> None:
+        priority = PriorityFactory()
+        status = StatusFactory()
+        self.pks = sorted(
+            (
+                task.pk
+                for task in TaskFactory.create_batch(
+                    5, due_date=None, priority=priority, status=status
+                )
+            ),
+            reverse=True,
+        )
+
+    def test_first_page(self) -> None:
+        page = paginate_by_keyset(Task.objects.all(), page_size=2)
+
+        assert [task.pk for task in page] == self.pks[:2]
+        assert page.has_next is True
+        assert page.has_previous is False
+        assert page.next_cursor == self.pks[1]
+        assert page.previous_cursor is None
+
+    def test_after_cursor(self) -> None:
+        page = paginate_by_keyset(Task.objects.all(), page_size=2, after=self.pks[1])
+
+        assert [task.pk for task in page] == self.pks[2:4]
+        assert page.has_next is True
+        assert page.has_previous is True
+
+    def test_last_page(self) -> None:
+        page = paginate_by_keyset(Task.objects.all(), page_size=2, after=self.pks[3])
+
+        assert [task.pk for task in page] == self.pks[4:]
+        assert page.has_next is False
+        assert page.next_cursor is None
+
+    def test_before_cursor(self) -> None:
+        page = paginate_by_keyset(Task.objects.all(), page_size=2, before=self.pks[2])
+
+        assert [task.pk for task in page] == self.pks[:2]
+        assert page.has_previous is False
+        assert page.has_next is True
+
+    def test_paginate_tasks_reads_query_parameters(self, rf: RequestFactory) -> None:
+        request = rf.get("/", {"after": self.pks[0], "page_size": "3"})
+
+        page = paginate_tasks(request, Task.objects.all())
+
+        assert page.page_size == 3
+        assert [task.pk for task in page] == self.pks[1:4]
+
+    def test_paginate_tasks_ignores_invalid_parameters(
+        self, rf: RequestFactory
+    ) -> None:
+        request = rf.get("/", {"after": "abc", "page_size": "-1"})
+
+        page = paginate_tasks(request, Task.objects.all())
+
+        assert len(page) == 5
+        assert page.has_previous is False
+
+    def test_task_view_renders_requested_page(self, client: Client) -> None:
+        client.force_login(CustomUserFactory(is_superuser=True))
+
+        response = client.get(reverse("tasks"), {"after": self.pks[0], "page_size": 2})
+
+        assert [task.pk for task in response.context["task_list"]] == self.pks[1:3]
+        assert f"?after={self.pks[2]}&page_size=2" in response.content.decode()
@@ -0,0 +1,117 @@
+from typing import Any, Iterator
+
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template import engines
+from django.template.response import SimpleTemplateResponse
+
+from webapp.accounts.models import CustomUser
+from webapp.tasktrack.models import Task
+from webapp.tasktrack.routers import (
+    READ_REPLICA,
+    PrimaryReplicaRouter,
+    pinned_to_primary,
+    reading_from,
+    use_replica,
+)
+
+
+@use_replica
+def replica_view() -> HttpResponse:
+    return HttpResponse(READ_REPLICA.get() or "default")
+
+
+@use_replica
+async def async_replica_view() -> HttpResponse:
+    return HttpResponse(READ_REPLICA.get() or "default")
+
+
+@use_replica
+def template_replica_view() -> SimpleTemplateResponse:
+    template = engines["django"].from_string("{{ replica }}")
+    return SimpleTemplateResponse(
+        template, {"replica": lambda: READ_REPLICA.get() or "default"}
+    )
+
+
+@use_replica
+def streaming_replica_view() -> StreamingHttpResponse:
+    def rows() -> Iterator[str]:
+        yield READ_REPLICA.get() or "default"
+
+    return StreamingHttpResponse(rows())
+
+
+class TestPrimaryReplicaRouter:
+    def test_reads_go_to_the_primary_by_default(self) -> None:
+
+        assert PrimaryReplicaRouter().db_for_read(Task) == "default"
+
+    def test_reads_go_to_the_active_replica(self) -> None:
+
+        with reading_from("replica1"):
+            assert PrimaryReplicaRouter().db_for_read(Task) == "replica1"
+
+    def test_writes_go_to_the_primary(self) -> None:
+
+        task = Task()
+        task._state.db = "replica1"
+
+        with reading_from("replica1"):
+            assert PrimaryReplicaRouter().db_for_write(Task, instance=task) == "default"
+
+    def test_objects_of_both_databases_are_related(self, settings: Any) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        task, user = Task(), CustomUser()
+        task._state.db, user._state.db = "default", "replica1"
+
+        assert PrimaryReplicaRouter().allow_relation(task, user) is True
+
+    def test_replicas_are_not_migrated(self, settings: Any) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+        router = PrimaryReplicaRouter()
+
+        assert router.allow_migrate("default", "tasktrack") is True
+        assert router.allow_migrate("replica1", "tasktrack") is False
+
+
+class TestUseReplica:
+    def test_view_reads_from_a_replica(self, settings: Any) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+
+        assert replica_view().content == b"replica1"
+        assert READ_REPLICA.get() is None
+
+    def test_async_view_reads_from_a_replica(self, settings: Any) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+
+        assert async_to_sync(async_replica_view)().content == b"replica1"
+
+    def test_templates_are_rendered_from_the_replica(self, settings: Any) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+
+        assert template_replica_view().content == b"replica1"
+
+    def test_streamed_rows_are_read_from_the_replica(self, settings: Any) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+
+        response = streaming_replica_view()
+
+        assert b"".join(response.streaming_content) == b"replica1"
+
+    def test_pinned_requests_read_from_the_primary(self, settings: Any) -> None:
+
+        settings.DATABASE_REPLICAS = ["replica1"]
+
+        with pinned_to_primary():
+            assert replica_view().content == b"default"
+
+    def test_without_replicas_views_read_from_the_primary(self) -> None:
+
+        assert replica_view().content == b"default"
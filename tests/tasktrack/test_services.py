@@ -1,13 +1,15 @@
 import datetime
+from typing import Any
 
 import pytest
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from tests.accounts.factories import CustomUserFactory
 from tests.tasktrack.factories import PriorityFactory, StatusFactory, TaskFactory
 from webapp.tasktrack import services
-from webapp.tasktrack.enums import StatusType
-from webapp.tasktrack.models import Task
+from webapp.tasktrack.enums import PriorityLevel, StatusType
+from webapp.tasktrack.models import Task, TaskArchive, TaskStatistics
 
 
 @pytest.mark.django_db
@@ -41,10 +43,289 @@ def test_update_task_successful() -> None:
         created_at=timezone.now().date(),
     )
 
-    services.update_task(user=user, pk=task.pk)
+    previous_updated_at = task.updated_at
+
+    assert services.update_task(user=user, task=task, changes={"title": "Renamed"})
 
     updated_task = Task.objects.get(pk=task.pk)
 
+    assert updated_task.title == "Renamed"
     assert updated_task.updated_by == user
     assert updated_task.updated_at.date() == timezone.now().date()
-    assert updated_task.updated_at > task.updated_at
+    assert updated_task.updated_at > previous_updated_at
+
+
+@pytest.mark.django_db
+def test_update_task_without_changes_skips_the_write(
+    django_assert_num_queries: Any,
+) -> None:
+
+    user = CustomUserFactory()
+    task = TaskFactory(
+        status=StatusFactory(), priority=PriorityFactory(), due_date=None
+    )
+
+    with django_assert_num_queries(0):
+        assert not services.update_task(user=user, task=task, changes={})
+
+    task.refresh_from_db()
+    assert task.updated_by != user
+
+
+@pytest.mark.django_db
+class TestBulkCreateTasks:
+    def test_bulk_create_tasks(self, django_assert_max_num_queries: Any) -> None:
+
+        user = CustomUserFactory()
+        assignees = CustomUserFactory.create_batch(2)
+        PriorityFactory(name=PriorityLevel.HIGH)
+        PriorityFactory(name=PriorityLevel.LOW)
+        StatusFactory(name=StatusType.PENDING)
+        due_date = timezone.localdate() + datetime.timedelta(days=3)
+
+        payload = [
+            {
+                "title": f"Imported task {index}",
+                "due_date": due_date.isoformat(),
+                "description": "Imported",
+                "priority": PriorityLevel.HIGH if index % 2 else PriorityLevel.LOW,
+                "assigned_to": assignees[index % 2].pk,
+            }
+            for index in range(10)
+        ]
+
+        with django_assert_max_num_queries(20):
+            tasks = services.bulk_create_tasks(user=user, tasks=payload, chunk_size=3)
+
+        assert len(tasks) == 10
+        assert Task.objects.count() == 10
+        assert Task.objects.filter(status__name=StatusType.PENDING).count() == 10
+        assert TaskStatistics.status_counts()["pending"] == 10
+        assert TaskStatistics.priority_counts()["high_priority"] == 5
+        assert TaskStatistics.status_counts(assigned_to=assignees[0])["pending"] == 5
+
+    def test_bulk_create_tasks_validates_every_row(self) -> None:
+
+        user = CustomUserFactory()
+        assignee = CustomUserFactory()
+        PriorityFactory(name=PriorityLevel.HIGH)
+        StatusFactory(name=StatusType.PENDING)
+
+        payload: Any = [
+            {"title": "Valid", "priority": "HIGH", "assigned_to": assignee.pk},
+            {
+                "title": "   ",
+                "due_date": "2000-01-01",
+                "description": {"text": "not a string"},
+                "priority": "UNKNOWN",
+                "assigned_to": 0,
+            },
+            "not a task",
+            {"title": "x" * 251, "priority": "HIGH", "assigned_to": assignee.pk},
+            {"title": "Boolean", "priority": "HIGH", "assigned_to": True},
+        ]
+
+        with pytest.raises(ValidationError) as error:
+            services.bulk_create_tasks(user=user, tasks=payload)
+
+        assert set(error.value.message_dict) == {
+            "1.title",
+            "1.due_date",
+            "1.description",
+            "1.priority",
+            "1.assigned_to",
+            "2",
+            "3.title",
+            "4.assigned_to",
+        }
+        assert error.value.message_dict["3.title"] == [
+            "Ensure this value has at most 250 characters."
+        ]
+        assert Task.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestBulkUpdateTasks:
+    def _statistics(self) -> set:
+        return set(
+            TaskStatistics.objects.filter(count__gt=0).values_list(
+                "dimension", "key", "count"
+            )
+        )
+
+    def test_bulk_update_tasks(self, django_assert_max_num_queries: Any) -> None:
+
+        user = CustomUserFactory()
+        assignee = CustomUserFactory()
+        low = PriorityFactory(name=PriorityLevel.LOW)
+        high = PriorityFactory(name=PriorityLevel.HIGH)
+        pending = StatusFactory(name=StatusType.PENDING)
+        completed = StatusFactory(name=StatusType.COMPLETED)
+        owner = CustomUserFactory()
+        now = timezone.now()
+        common = {"assigned_to": owner, "created_at": now, "updated_at": now}
+        TaskFactory.create_batch(
+            3, status=pending, priority=low, due_date=timezone.localdate(), **common
+        )
+        TaskFactory.create_batch(
+            2, status=pending, priority=low, due_date=None, **common
+        )
+        untouched = TaskFactory(status=pending, priority=low, due_date=None, **common)
+
+        with django_assert_max_num_queries(12):
+            updated = services.bulk_update_tasks(
+                user=user,
+                tasks=Task.objects.exclude(pk=untouched.pk),
+                status=completed,
+                priority=high,
+                assigned_to=assignee,
+            )
+
+        assert updated == 5
+        assert (
+            Task.objects.filter(
+                status=completed, priority=high, assigned_to=assignee, updated_by=user
+            ).count()
+            == 5
+        )
+        untouched.refresh_from_db()
+        assert untouched.status == pending
+        assert TaskStatistics.status_counts()["completed"] == 5
+        assert TaskStatistics.status_counts(assigned_to=assignee)["completed"] == 5
+        assert TaskStatistics.priority_counts()["high_priority"] == 5
+
+        statistics = self._statistics()
+        TaskStatistics.rebuild()
+        assert self._statistics() == statistics
+
+    def test_bulk_update_tasks_without_changes(self) -> None:
+
+        user = CustomUserFactory()
+        TaskFactory(status=StatusFactory(), priority=PriorityFactory(), due_date=None)
+
+        assert services.bulk_update_tasks(user=user, tasks=Task.objects.all()) == 0
+        assert not Task.objects.filter(updated_by=user).exists()
+
+
+@pytest.mark.django_db
+def test_delete_tasks(django_assert_max_num_queries: Any) -> None:
+
+    now = timezone.now()
+    shared = {
+        "status": StatusFactory(name=StatusType.PENDING),
+        "priority": PriorityFactory(name=PriorityLevel.MEDIUM),
+        "assigned_to": CustomUserFactory(),
+        "due_date": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    TaskFactory.create_batch(20, **shared)
+    kept = TaskFactory(**shared)
+
+    with django_assert_max_num_queries(15):
+        deleted = services.delete_tasks(tasks=Task.objects.exclude(pk=kept.pk))
+
+    assert deleted == 20
+    assert list(Task.objects.all()) == [kept]
+    assert TaskStatistics.status_counts()["pending"] == 1
+    counted = set(
+        TaskStatistics.objects.exclude(count=0).values_list("dimension", "key", "count")
+    )
+    TaskStatistics.rebuild()
+    assert set(TaskStatistics.objects.values_list("dimension", "key", "count")) == (
+        counted
+    )
+
+
+@pytest.mark.django_db
+class TestArchiveTasks:
+    def archive_completed(self, year: int) -> Any:
+        updated_at = datetime.datetime(
+            year, 2, 1, tzinfo=timezone.get_current_timezone()
+        )
+        completed = StatusFactory(name=StatusType.COMPLETED)
+        priority = PriorityFactory(name=PriorityLevel.HIGH)
+        user = CustomUserFactory()
+        tasks = TaskFactory.create_batch(
+            2,
+            status=completed,
+            priority=priority,
+            assigned_to=user,
+            due_date=updated_at.date(),
+            created_at=updated_at,
+            updated_at=updated_at,
+        )
+        TaskFactory(
+            status=StatusFactory(name=StatusType.PENDING),
+            priority=priority,
+            assigned_to=user,
+            due_date=None,
+        )
+        dashboard = TaskStatistics.dashboard_counts(year=year)
+
+        archived = services.archive_tasks(tasks=Task.objects.filter(status=completed))
+
+        assert archived == 2
+        return user, tasks, dashboard
+
+    def test_archive_tasks_moves_the_rows(self) -> None:
+
+        user, tasks, _ = self.archive_completed(timezone.now().year)
+
+        assert list(Task.objects.values_list("status__name", flat=True)) == [
+            StatusType.PENDING
+        ]
+        archived = TaskArchive.objects.get(pk=tasks[0].pk)
+        assert archived.title == tasks[0].title
+        assert archived.assigned_to == user
+        assert archived.updated_at == tasks[0].updated_at
+
+    def test_archive_tasks_keeps_the_dashboard_counts(self) -> None:
+
+        year = timezone.now().year
+        user, _, dashboard = self.archive_completed(year)
+
+        assert TaskStatistics.dashboard_counts(year=year) == dashboard
+        assert TaskStatistics.status_counts()["completed"] == 0
+        assert TaskStatistics.status_counts(assigned_to=user)["completed"] == 0
+        assert TaskStatistics.status_counts(assigned_to=user)["pending"] == 1
+
+    def test_rebuild_counts_the_archive(self) -> None:
+
+        self.archive_completed(timezone.now().year)
+        incremental = set(
+            TaskStatistics.objects.exclude(count=0).values_list(
+                "dimension", "key", "count"
+            )
+        )
+
+        TaskStatistics.rebuild()
+
+        rebuilt = set(TaskStatistics.objects.values_list("dimension", "key", "count"))
+        assert rebuilt == incremental
+
+    def test_deleting_the_assignee_removes_the_archived_counts(self) -> None:
+
+        year = timezone.now().year
+        user, _, _ = self.archive_completed(year)
+
+        user.delete()
+
+        assert not TaskArchive.objects.exists()
+        dashboard = TaskStatistics.dashboard_counts(year=year)
+        assert not any(dashboard["task_counts"].values())
+        assert not any(dashboard["due_tasks_count_by_month"].values())
+        assert not any(dashboard["completed_tasks_count_by_month"].values())
+        incremental = set(
+            TaskStatistics.objects.exclude(count=0).values_list(
+                "dimension", "key", "count"
+            )
+        )
+        TaskStatistics.rebuild()
+        assert incremental == set()
+        assert not TaskStatistics.objects.exists()
+
+    def test_archive_tasks_without_tasks(self) -> None:
+
+        assert services.archive_tasks(tasks=Task.objects.none()) == 0
+        assert not TaskArchive.objects.exists()
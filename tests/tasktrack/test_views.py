@@ -1,12 +1,18 @@
 import datetime
+import json
+from typing import Any
 
 import pytest
-from django.test import Client, RequestFactory
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient, Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
 from tests.accounts.factories import CustomUserFactory
 from tests.tasktrack.factories import PriorityFactory, StatusFactory, TaskFactory
+from webapp.tasktrack import services
 from webapp.tasktrack.enums import PriorityLevel, StatusType
 from webapp.tasktrack.models import Task
 from webapp.tasktrack.views import DashboardView, HomeView
@@ -26,6 +32,8 @@ class TestHomeView:
         response = client.get(reverse("home"))
         assert response.status_code == 200
         assert "pages/index.html" in [template.name for template in response.templates]
+        url = reverse("home_counts_api")
+        assert f'data-counts-url="{url}"' in response.content.decode()
 
     def test_get_context_data(self, rf: RequestFactory) -> None:
 
@@ -80,7 +88,7 @@ class TestHomeView:
         assert context["task_counts"]["cancelled"] == 1
 
         assert "task_list" in context
-        assert context["task_list"].count() == 11
+        assert len(context["task_list"]) == 11
 
     def test_empty_task_list_context(self, rf: RequestFactory) -> None:
 
@@ -100,6 +108,36 @@ class TestHomeView:
         }
         assert list(context["task_list"]) == []
 
+    def test_home_view_query_count_is_constant(self, client: Client) -> None:
+
+        user = CustomUserFactory()
+        client.force_login(user)
+
+        priority = PriorityFactory(name=PriorityLevel.LOW)
+        status = StatusFactory(name=StatusType.PENDING)
+        TaskFactory(due_date=None, assigned_to=user, priority=priority, status=status)
+
+        client.get(reverse("home"))
+
+        with CaptureQueriesContext(connection) as single_row:
+            client.get(reverse("home"))
+
+        TaskFactory.create_batch(
+            4, due_date=None, assigned_to=user, priority=priority, status=status
+        )
+        client.get(reverse("home"))
+
+        with CaptureQueriesContext(connection) as many_rows:
+            response = client.get(reverse("home"))
+
+        assert len(response.context["task_list"]) == 5
+        assert response.context["task_counts"]["pending"] == 5
+        assert len(many_rows) == len(single_row)
+        assert not any(
+            "tasktrack_taskstatistics" in query["sql"]
+            for query in many_rows.captured_queries
+        )
+
 
 @pytest.mark.django_db
 class TestDashboardView:
@@ -121,6 +159,8 @@ class TestDashboardView:
         assert "pages/dashboard.html" in [
             template.name for template in response.templates
         ]
+        url = reverse("dashboard_stats_api")
+        assert f'data-counts-url="{url}"' in response.content.decode()
 
     def test_get_context_data(self, rf: RequestFactory) -> None:
 
@@ -289,6 +329,28 @@ class TestTaskView:
         assert response.context["task_counts"]["cancelled"] == 0
         assert len(response.context["task_list"]) == 2
 
+    def test_task_view_query_count_is_constant(self, client: Client) -> None:
+
+        user = CustomUserFactory(is_superuser=True)
+        client.force_login(user)
+
+        priority = PriorityFactory(name=PriorityLevel.LOW)
+        status = StatusFactory(name=StatusType.PENDING)
+        TaskFactory(due_date=None, priority=priority, status=status)
+
+        client.get(reverse("tasks"))
+
+        with CaptureQueriesContext(connection) as single_row:
+            client.get(reverse("tasks"))
+
+        TaskFactory.create_batch(4, due_date=None, priority=priority, status=status)
+
+        with CaptureQueriesContext(connection) as many_rows:
+            response = client.get(reverse("tasks"))
+
+        assert len(response.context["task_list"]) == 5
+        assert len(many_rows) == len(single_row)
+
 
 @pytest.mark.django_db
 class TestCreateTaskView:
@@ -405,6 +467,34 @@ class TestTaskDetailsView:
         assert response.status_code == 200
         assert task.title in response.content.decode()
 
+    def test_task_details_view_falls_back_to_the_archive(self, client: Client) -> None:
+
+        user = CustomUserFactory(is_superuser=True)
+        client.force_login(user)
+        task = TaskFactory(
+            status=StatusFactory(name=StatusType.CANCELLED),
+            assigned_to=user,
+            due_date=None,
+        )
+        services.archive_tasks(tasks=Task.objects.filter(pk=task.pk))
+
+        response = client.get(reverse("task_details", kwargs={"pk": task.pk}))
+
+        assert response.status_code == 200
+        assert response.context["archived"] is True
+        assert task.title in response.content.decode()
+        assert reverse("task_update", kwargs={"pk": task.pk}) not in (
+            response.content.decode()
+        )
+
+    def test_task_details_view_not_found(self, client: Client) -> None:
+
+        client.force_login(CustomUserFactory())
+
+        response = client.get(reverse("task_details", kwargs={"pk": 999999}))
+
+        assert response.status_code == 404
+
 
 @pytest.mark.django_db
 class TestTaskUpdateView:
@@ -502,6 +592,84 @@ class TestTaskUpdateView:
         assert response.status_code == 302
         assert response.url == reverse("task_details", kwargs={"pk": task.pk})
 
+    def test_task_update_view_saves_once(
+        self, client: Client, django_assert_num_queries: Any
+    ) -> None:
+
+        user = CustomUserFactory()
+        client.force_login(user)
+
+        task = TaskFactory(
+            title="Old Task Title",
+            due_date=timezone.localdate() + datetime.timedelta(days=7),
+            assigned_to=user,
+            status=StatusFactory(),
+            priority=PriorityFactory(),
+            created_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        url = reverse("task_update", kwargs={"pk": task.pk})
+        form_data = {
+            "title": "Updated Task Title",
+            "due_date": task.due_date,
+            "description": task.description,
+            "priority": task.priority.id,
+            "status": task.status.id,
+            "assigned_to": task.assigned_to.id,
+        }
+
+        with django_assert_num_queries(10) as queries:
+            response = client.post(url, data=form_data)
+
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('UPDATE "tasktrack_task"')
+        ]
+        assert response.status_code == 302
+        assert not any(
+            query["sql"].startswith('SELECT 1 AS "a"')
+            for query in queries.captured_queries
+        )
+        assert len(updates) == 1
+        assert '"title"' in updates[0]
+        assert '"description"' not in updates[0]
+
+        task.refresh_from_db()
+        assert task.title == "Updated Task Title"
+        assert task.updated_by == user
+
+    def test_task_update_view_without_changes_skips_the_write(
+        self, client: Client
+    ) -> None:
+
+        user = CustomUserFactory()
+        client.force_login(user)
+
+        task = TaskFactory(
+            due_date=None,
+            assigned_to=user,
+            status=StatusFactory(),
+            priority=PriorityFactory(),
+        )
+        url = reverse("task_update", kwargs={"pk": task.pk})
+        form_data = {
+            "title": task.title,
+            "due_date": "",
+            "description": task.description,
+            "priority": task.priority.id,
+            "status": task.status.id,
+            "assigned_to": task.assigned_to.id,
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(url, data=form_data)
+
+        assert response.status_code == 302
+        assert not any(
+            query["sql"].startswith("UPDATE") for query in queries.captured_queries
+        )
+
     def test_task_update_view_form_submission_invalid(self, client: Client) -> None:
 
         user = CustomUserFactory()
@@ -563,6 +731,16 @@ class TestDeleteTaskView:
         assert response.status_code == 302
         assert response.url == reverse("tasks")
 
+    def test_delete_task_view_rejects_get(self, client: Client) -> None:
+
+        client.force_login(CustomUserFactory(is_superuser=True))
+        task = TaskFactory(due_date=None)
+
+        response = client.get(reverse("delete_task", kwargs={"pk": task.pk}))
+
+        assert response.status_code == 405
+        assert Task.objects.filter(pk=task.pk).exists()
+
     def test_authenticated_user_cannot_delete_non_existent_task(
         self, client: Client
     ) -> None:
@@ -599,6 +777,245 @@ class TestDeleteTaskView:
         assert response.url == reverse("tasks")
 
 
+@pytest.mark.django_db
+class TestTaskSearch:
+    def test_tasks_page_search(self, client: Client) -> None:
+
+        client.force_login(CustomUserFactory(is_superuser=True))
+        status = StatusFactory(name=StatusType.PENDING)
+        priority = PriorityFactory(name=PriorityLevel.LOW)
+        match = TaskFactory(
+            title="Renew domain", status=status, priority=priority, due_date=None
+        )
+        TaskFactory(
+            title="Order lunch", status=status, priority=priority, due_date=None
+        )
+
+        response = client.get(reverse("tasks"), data={"q": "domain"})
+
+        assert response.status_code == 200
+        assert response.context["task_list"] == [match]
+        assert response.context["search_query"] == "domain"
+        assert response.context["records_filtered"] == 1
+        assert 'data-records-filtered="1"' in response.content.decode()
+
+    def test_search_api(self, client: Client) -> None:
+
+        client.force_login(CustomUserFactory(is_superuser=True))
+        task = TaskFactory(
+            title="Renew domain",
+            status=StatusFactory(name=StatusType.PENDING),
+            priority=PriorityFactory(name=PriorityLevel.LOW),
+            due_date=None,
+        )
+
+        response = client.get(reverse("task_search_api"), data={"q": "renew"})
+        empty = client.get(reverse("task_search_api"), data={"q": ""})
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {
+                "id": task.pk,
+                "title": "Renew domain",
+                "due_date": None,
+                "priority": "LOW",
+                "status": "PENDING",
+                "assigned_to": str(task.assigned_to),
+                "url": reverse("task_details", kwargs={"pk": task.pk}),
+            }
+        ]
+        assert empty.json()["results"] == []
+
+    def test_search_api_requires_superuser(self, client: Client) -> None:
+
+        anonymous = client.get(reverse("task_search_api"), data={"q": "renew"})
+        client.force_login(CustomUserFactory())
+        regular = client.get(reverse("task_search_api"), data={"q": "renew"})
+
+        assert "/login/" in anonymous.url
+        assert regular.url == reverse("home")
+
+
+@pytest.mark.django_db
+class TestUserSearchAPI:
+    def test_returns_a_page_of_active_users(
+        self, client: Client, settings: Any
+    ) -> None:
+        settings.USER_SEARCH_PAGE_SIZE = 2
+        client.force_login(CustomUserFactory(first_name="Zed", last_name="Admin"))
+        users = [
+            CustomUserFactory(first_name="Ada", last_name=f"Lovelace {index}")
+            for index in range(3)
+        ]
+        CustomUserFactory(first_name="Ada", last_name="Inactive", is_active=False)
+
+        first = client.get(reverse("user_search_api"), data={"term": "ada"}).json()
+        second = client.get(
+            reverse("user_search_api"), data={"term": "ada", "page": 2}
+        ).json()
+
+        assert first["results"] == [
+            {"id": user.pk, "text": str(user)} for user in users[:2]
+        ]
+        assert first["pagination"] == {"more": True}
+        assert second["results"] == [{"id": users[2].pk, "text": str(users[2])}]
+        assert second["more"] is False
+
+    def test_pages_are_cached(
+        self, client: Client, django_assert_num_queries: Any
+    ) -> None:
+        client.force_login(CustomUserFactory(first_name="Ada"))
+        url = reverse("user_search_api")
+        client.get(url, data={"term": "ada"})
+
+        CustomUserFactory(first_name="Ada", last_name="Later")
+        with django_assert_num_queries(2):
+            response = client.get(url, data={"term": " ADA "})
+
+        assert len(response.json()["results"]) == 1
+
+    def test_requires_login(self, client: Client) -> None:
+        response = client.get(reverse("user_search_api"), data={"term": "ada"})
+        assert "/login/" in response.url
+
+
+@pytest.mark.django_db
+class TestStatisticsAPI:
+    def test_home_counts(self, client: Client) -> None:
+        user = CustomUserFactory()
+        client.force_login(user)
+        TaskFactory(
+            assigned_to=user,
+            status=StatusFactory(name=StatusType.PENDING),
+            priority=PriorityFactory(name=PriorityLevel.LOW),
+            due_date=None,
+        )
+
+        response = client.get(reverse("home_counts_api"))
+
+        assert response.json() == {
+            "pending": 1,
+            "in_progress": 0,
+            "completed": 0,
+            "cancelled": 0,
+        }
+
+    def test_dashboard_stats(self, client: Client) -> None:
+        client.force_login(CustomUserFactory(is_superuser=True))
+        TaskFactory(
+            status=StatusFactory(name=StatusType.PENDING),
+            priority=PriorityFactory(name=PriorityLevel.HIGH),
+            due_date=None,
+        )
+
+        data = client.get(reverse("dashboard_stats_api")).json()
+
+        assert data["task_counts"]["pending"] == 1
+        assert data["task_counts"]["high_priority"] == 1
+        assert set(data) == {
+            "task_counts",
+            "due_tasks_count_by_month",
+            "completed_tasks_count_by_month",
+        }
+
+    def test_dashboard_stats_requires_superuser(self, client: Client) -> None:
+        client.force_login(CustomUserFactory())
+
+        response = client.get(reverse("dashboard_stats_api"))
+
+        assert response.status_code == 302
+        assert response.url == reverse("home")
+
+    def test_calendar_api_serves_async_clients(self, async_client: AsyncClient) -> None:
+        async_client.force_login(CustomUserFactory(is_superuser=True))
+        task = TaskFactory(
+            due_date=timezone.localdate(),
+            status=StatusFactory(name=StatusType.PENDING),
+            priority=PriorityFactory(name=PriorityLevel.LOW),
+        )
+
+        async def fetch() -> Any:
+            response = await async_client.get(reverse("task_calendar_api"))
+            return json.loads(b"".join([chunk async for chunk in response]))
+
+        assert [event["id"] for event in async_to_sync(fetch)()] == [task.pk]
+
+
+@pytest.mark.django_db
+class TestTaskTableAPI:
+    def setup_method(self) -> None:
+        self.status = StatusFactory(name=StatusType.PENDING)
+        self.priority = PriorityFactory(name=PriorityLevel.LOW)
+
+    def _task(self, **kwargs: Any) -> Task:
+        return TaskFactory(
+            status=self.status, priority=self.priority, due_date=None, **kwargs
+        )
+
+    def test_returns_a_draw_of_all_tasks(
+        self, client: Client, django_assert_max_num_queries: Any
+    ) -> None:
+        client.force_login(CustomUserFactory(is_superuser=True))
+        tasks = [self._task(title=f"Task {index}") for index in range(3)]
+
+        with django_assert_max_num_queries(8):
+            response = client.get(
+                reverse("task_table_api"),
+                data={"draw": "1", "start": "0", "length": "2"},
+            )
+
+        data = response.json()
+        assert data["draw"] == 1
+        assert data["recordsTotal"] == 3
+        assert data["recordsFiltered"] == 3
+        assert [row["id"] for row in data["data"]] == [tasks[2].pk, tasks[1].pk]
+
+    def test_orders_by_column(self, client: Client) -> None:
+        client.force_login(CustomUserFactory(is_superuser=True))
+        second = self._task(title="Beta")
+        first = self._task(title="Alpha")
+
+        response = client.get(
+            reverse("task_table_api"),
+            data={
+                "columns[0][data]": "title",
+                "order[0][column]": "0",
+                "order[0][dir]": "asc",
+            },
+        )
+
+        assert [row["id"] for row in response.json()["data"]] == [first.pk, second.pk]
+
+    def test_requires_superuser(self, client: Client) -> None:
+        client.force_login(CustomUserFactory())
+
+        response = client.get(reverse("task_table_api"))
+
+        assert response.status_code == 302
+
+    def test_home_table_lists_own_tasks(self, client: Client) -> None:
+        user = CustomUserFactory()
+        client.force_login(user)
+        own = self._task(assigned_to=user)
+        self._task()
+
+        data = client.get(reverse("my_task_table_api")).json()
+
+        assert data["recordsTotal"] == 1
+        assert [row["id"] for row in data["data"]] == [own.pk]
+        assert data["data"][0]["urls"]["delete"] is None
+
+    def test_tables_defer_their_first_page(self, client: Client) -> None:
+        client.force_login(CustomUserFactory(is_superuser=True))
+        self._task()
+
+        response = client.get(reverse("tasks"))
+
+        content = response.content.decode()
+        assert f'data-source="{reverse("task_table_api")}"' in content
+        assert 'data-records-total="1"' in content
+
+
 @pytest.mark.django_db
 class TestTaskCalendarAPI:
     def test_task_calendar_api_redirects_for_anonymous_user(
@@ -628,7 +1045,7 @@ class TestTaskCalendarAPI:
 
         assert response.status_code == 200
 
-        data = response.json()
+        data = json.loads(b"".join(response.streaming_content))
         assert isinstance(data, list)
         assert len(data) == 1
 
@@ -653,7 +1070,167 @@ class TestTaskCalendarAPI:
         response = client.get(url)
 
         assert response.status_code == 200
-        assert response.json() == []
+        assert json.loads(b"".join(response.streaming_content)) == []
+
+    def test_calendar_api_filters_by_visible_range(self, client: Client) -> None:
+
+        user = CustomUserFactory(is_superuser=True)
+        client.force_login(user)
+
+        year = timezone.now().year + 1
+        priority = PriorityFactory(name=PriorityLevel.HIGH)
+        status = StatusFactory(name=StatusType.PENDING)
+        inside = TaskFactory(
+            due_date=datetime.date(year, 3, 10), priority=priority, status=status
+        )
+        TaskFactory(
+            due_date=datetime.date(year, 4, 10), priority=priority, status=status
+        )
+        TaskFactory(due_date=None, priority=priority, status=status)
+
+        url = reverse("task_calendar_api")
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(
+                url,
+                {"start": f"{year}-03-01T00:00:00+02:00", "end": f"{year}-04-01"},
+            )
+            data = json.loads(b"".join(response.streaming_content))
+
+        assert [event["id"] for event in data] == [inside.id]
+        assert data[0]["priority_level_colour"] == "success"
+        assert data[0]["status_colour"] == "warning"
+        assert (
+            len([query for query in queries if "tasktrack_task" in query["sql"]]) == 1
+        )
+
+    def test_calendar_api_rejects_invalid_range(self, client: Client) -> None:
+
+        user = CustomUserFactory(is_superuser=True)
+        client.force_login(user)
+
+        response = client.get(reverse("task_calendar_api"), {"start": "not-a-date"})
+
+        assert response.status_code == 400
+        assert response.json() == {"error": "Invalid date range"}
+
+
+@pytest.mark.django_db
+class TestTaskBulkCreateAPI:
+    def test_bulk_create_requires_superuser(self, client: Client) -> None:
+
+        client.force_login(CustomUserFactory())
+
+        response = client.post(
+            reverse("task_bulk_create_api"), data="[]", content_type="application/json"
+        )
+
+        assert response.status_code == 302
+
+    def test_superuser_can_bulk_create_tasks(self, client: Client) -> None:
+
+        user = CustomUserFactory(is_superuser=True)
+        client.force_login(user)
+        PriorityFactory(name=PriorityLevel.MEDIUM)
+        StatusFactory(name=StatusType.PENDING)
+
+        payload = [
+            {"title": "First", "priority": "MEDIUM", "assigned_to": user.pk},
+            {"title": "Second", "priority": "MEDIUM", "assigned_to": user.pk},
+        ]
+        response = client.post(
+            reverse("task_bulk_create_api"),
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 201
+        assert response.json()["success"] is True
+        assert sorted(response.json()["task_ids"]) == sorted(
+            Task.objects.values_list("pk", flat=True)
+        )
+
+    def test_bulk_create_rejects_invalid_payloads(self, client: Client) -> None:
+
+        user = CustomUserFactory(is_superuser=True)
+        client.force_login(user)
+        url = reverse("task_bulk_create_api")
+
+        not_json = client.post(url, data="{", content_type="application/json")
+        not_array = client.post(url, data="{}", content_type="application/json")
+        invalid = client.post(
+            url, data=json.dumps([{"title": ""}]), content_type="application/json"
+        )
+
+        assert not_json.status_code == 400
+        assert not_array.status_code == 400
+        assert invalid.status_code == 400
+        assert "0.title" in invalid.json()["errors"]
+        assert Task.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestTaskBulkUpdateView:
+    def test_bulk_update_requires_superuser(self, client: Client) -> None:
+
+        user = CustomUserFactory()
+        client.force_login(user)
+        task = TaskFactory(
+            status=StatusFactory(name=StatusType.PENDING),
+            priority=PriorityFactory(),
+            due_date=None,
+        )
+        completed = StatusFactory(name=StatusType.COMPLETED)
+
+        response = client.post(
+            reverse("tasks_bulk_update"),
+            data={"task_ids": [task.pk], "status": completed.pk},
+        )
+
+        assert response.status_code == 302
+        assert response.url == reverse("home")
+        task.refresh_from_db()
+        assert task.status != completed
+
+    def test_superuser_can_bulk_update_tasks(self, client: Client) -> None:
+
+        user = CustomUserFactory(is_superuser=True)
+        client.force_login(user)
+        pending = StatusFactory(name=StatusType.PENDING)
+        completed = StatusFactory(name=StatusType.COMPLETED)
+        priority = PriorityFactory()
+        selected = TaskFactory.create_batch(
+            2, status=pending, priority=priority, due_date=None
+        )
+        other = TaskFactory(status=pending, priority=priority, due_date=None)
+
+        response = client.post(
+            reverse("tasks_bulk_update"),
+            data={"task_ids": [task.pk for task in selected], "status": completed.pk},
+        )
+
+        assert response.status_code == 302
+        assert response.url == reverse("tasks")
+        assert set(Task.objects.filter(status=completed)) == set(selected)
+        other.refresh_from_db()
+        assert other.status == pending
+
+    def test_bulk_update_requires_a_change(self, client: Client) -> None:
+
+        client.force_login(CustomUserFactory(is_superuser=True))
+        task = TaskFactory(
+            status=StatusFactory(), priority=PriorityFactory(), due_date=None
+        )
+
+        response = client.post(
+            reverse("tasks_bulk_update"), data={"task_ids": [task.pk]}
+        )
+
+        assert response.status_code == 302
+        assert (
+            not Task.objects.filter(updated_by__isnull=False)
+            .exclude(updated_by=task.updated_by)
+            .exists()
+        )
 
 
 @pytest.mark.django_db
@@ -0,0 +1,16 @@
+import pytest
+from django.db import connection
+
+
+@pytest.mark.django_db
+def test_sqlite_connection_profile() -> None:
+
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA synchronous")
+        synchronous = cursor.fetchone()[0]
+        cursor.execute("PRAGMA temp_store")
+        temp_store = cursor.fetchone()[0]
+
+    assert connection.transaction_mode == "IMMEDIATE"
+    assert synchronous == 1
+    assert temp_store == 2
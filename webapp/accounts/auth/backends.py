@@ -1,16 +1,42 @@
 """Contains custom auth backends for the application."""
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import check_password, get_hasher, make_password
+from django.db.models import Q
 from django.http import HttpRequest
+from django.utils.crypto import get_random_string
 
 User = get_user_model()
 
 
-class EmailBackend(ModelBackend):
-    """Custom auth backend which authenticates a user on their email address."""
+DUMMY_PASSWORD_HASHES: Dict[str, str] = {}
+
+
+def dummy_password_hash() -> str:
+    """Return a hash of a random password made by the preferred hasher.
+
+    The hash is made once per algorithm, and made again when the costs of the
+    hasher change, so checking it costs as much as checking a real password.
+    """
+
+    hasher = get_hasher()
+    encoded = DUMMY_PASSWORD_HASHES.get(hasher.algorithm)
+    if encoded is None or hasher.must_update(encoded):
+        encoded = make_password(get_random_string(32), hasher=hasher)
+        DUMMY_PASSWORD_HASHES[hasher.algorithm] = encoded
+    return encoded
+
+
+class UsernameOrEmailBackend(ModelBackend):
+    """Custom auth backend which authenticates a user on their username or email.
+
+    The user is resolved with a single query on the unique username and email
+    columns. When no user matches, the password is checked against a dummy
+    hash so that unknown accounts cost as much time as known ones.
+    """
 
     def authenticate(
         self,
@@ -19,29 +45,37 @@ class EmailBackend(ModelBackend):
         password: Optional[str] = None,
         **kwargs: Any,
     ) -> Optional[Any]:
-        """Authenticate the user based on the provided email.
+        """Authenticate the user based on the provided username or email.
 
-        Note the username input must be the user's email address. This naming
-        convention allows the backend to integrate with the django login view
-        and form.
+        The username input may hold either the username or the email address.
+        This naming convention allows the backend to integrate with the django
+        login view and form.
         """
 
-        if any([username is None, username == "", password is None, password == ""]):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if not username or not password:
             return None
 
-        try:
-            user = User.objects.get(email=username)
-        except User.DoesNotExist:
-            User().set_password(password)
-        else:
-            conds = [
-                user.check_password(password) is True,
-                self.user_can_authenticate(user) is True,
-            ]
-
-            if all(conds):
-                return user
-            else:
-                return None
+        user = self.get_user_by_login(username)
+        if user is None:
+            check_password(password, dummy_password_hash())
+            return None
+
+        conds = [
+            user.check_password(password) is True,
+            self.user_can_authenticate(user) is True,
+        ]
+        return user if all(conds) else None
+
+    def get_user_by_login(self, login: str) -> Optional[Any]:
+        """Return the user whose username or email is the login, if any.
 
-        return None
+        A username match wins over another user's email address.
+        """
+
+        users = list(User.objects.filter(Q(username=login) | Q(email=login))[:2])
+        for user in users:
+            if user.username == login:
+                return user
+        return users[0] if users else None
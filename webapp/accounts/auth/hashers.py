@@ -0,0 +1,49 @@
+"""Password hashers whose cost parameters are read from the settings.
+
+The hashers keep the algorithm names of the django hashers they extend, so
+existing hashes still verify. Django rehashes a password on the next
+successful login when it was made by another hasher than the first one in
+PASSWORD_HASHERS, or with other costs than the ones configured in
+PASSWORD_HASHER_COSTS.
+"""
+
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+def cost(name: str, default: int) -> Any:
+    """Return a property reading a cost of the hasher from the settings."""
+
+    def get(hasher: hashers.BasePasswordHasher) -> int:
+        costs = getattr(settings, "PASSWORD_HASHER_COSTS", {})
+        return costs.get(hasher.algorithm, {}).get(name, default)
+
+    return property(get)
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """PBKDF2 with SHA256 and a configurable number of iterations."""
+
+    iterations = cost("iterations", hashers.PBKDF2PasswordHasher.iterations)
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    """Scrypt with a configurable work factor, block size and parallelism."""
+
+    work_factor = cost("work_factor", hashers.ScryptPasswordHasher.work_factor)
+    block_size = cost("block_size", hashers.ScryptPasswordHasher.block_size)
+    parallelism = cost("parallelism", hashers.ScryptPasswordHasher.parallelism)
+    maxmem = cost("maxmem", hashers.ScryptPasswordHasher.maxmem)
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """Argon2id with a configurable time cost, memory cost and parallelism.
+
+    Requires the argon2-cffi package.
+    """
+
+    time_cost = cost("time_cost", hashers.Argon2PasswordHasher.time_cost)
+    memory_cost = cost("memory_cost", hashers.Argon2PasswordHasher.memory_cost)
+    parallelism = cost("parallelism", hashers.Argon2PasswordHasher.parallelism)
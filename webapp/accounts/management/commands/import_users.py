@@ -0,0 +1,102 @@
+"""Import users from a CSV or JSON lines file."""
+
+import csv
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from webapp.accounts import services
+
+
+class Command(BaseCommand):
+    """Create the users listed in a CSV or JSON lines file."""
+
+    help = (
+        "Validate and create users from a CSV file with a header row, or a JSON "
+        "lines file, with first_name, middle_name, last_name, email and "
+        "password columns. Nothing is imported when any row is invalid."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add the file, format and performance options."""
+
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            default=None,
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes hashing the passwords.",
+        )
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Read the file, create the users and report the throughput."""
+
+        path = options["path"]
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format not in ("csv", "jsonl"):
+            raise CommandError("Use a .csv or .jsonl file, or pass --format.")
+        if not path.is_file():
+            raise CommandError(f"{path} does not exist.")
+
+        started = time.perf_counter()
+        read = self.read_csv if file_format == "csv" else self.read_jsonl
+        rows, lines = read(path)
+
+        try:
+            users = services.bulk_create_users(
+                users=rows,
+                workers=options["workers"],
+                batch_size=options["batch_size"],
+            )
+        except ValidationError as error:
+            for key, messages in sorted(error.message_dict.items()):
+                index, _, field = key.partition(".")
+                where = f"Line {lines[int(index)]}" + (f" ({field})" if field else "")
+                self.stderr.write(f"{where}: {' '.join(messages)}")
+            raise CommandError("Nothing was imported.")
+
+        elapsed = time.perf_counter() - started
+        rate = len(users) / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {len(users)} users in {elapsed:.2f}s "
+                f"({rate:.0f} rows/second)."
+            )
+        )
+
+    def read_csv(self, path: Path) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """Return the rows of a CSV file with a header row and their lines."""
+
+        rows, lines = [], []
+        with path.open(newline="", encoding="utf-8-sig") as handle:
+            reader = csv.DictReader(handle)
+            for row in reader:
+                rows.append(row)
+                lines.append(reader.line_num)
+        return rows, lines
+
+    def read_jsonl(self, path: Path) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """Return the objects of a JSON lines file and their lines."""
+
+        rows, lines = [], []
+        with path.open(encoding="utf-8") as handle:
+            for number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError as error:
+                    raise CommandError(f"Line {number}: {error.msg}.")
+                lines.append(number)
+        return rows, lines
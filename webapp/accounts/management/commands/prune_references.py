@@ -0,0 +1,57 @@
+"""Delete the reference rows left behind by the old username generator."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+
+from webapp.accounts.models import CustomUser, Reference, Sequence
+
+
+class Command(BaseCommand):
+    """Delete the reference rows once the username sequence is past them."""
+
+    help = (
+        "Move the username sequence past every issued username, then delete "
+        "the reference rows in batches."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add the batch size option."""
+
+        parser.add_argument("--batch-size", type=int, default=10000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Advance the username sequence and delete the reference rows."""
+
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        Sequence.objects.advance("username", past=self.last_issued_username())
+
+        deleted = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    Reference.objects.order_by("pk").values_list("pk", flat=True)[
+                        : options["batch_size"]
+                    ]
+                )
+                if not batch:
+                    break
+                deleted += Reference.objects.filter(pk__in=batch).delete()[0]
+            self.stdout.write(f"Deleted {deleted} references.")
+
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} references."))
+
+    def last_issued_username(self) -> int:
+        """Return the highest number used by a reference or a generated username."""
+
+        last = Reference.objects.aggregate(last=Max("pk"))["last"] or 0
+        usernames = CustomUser.objects.filter(username__startswith="user-")
+        for username in usernames.values_list("username", flat=True).iterator():
+            suffix = username[len("user-") :]
+            if suffix.isdigit():
+                last = max(last, int(suffix))
+        return last
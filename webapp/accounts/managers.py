@@ -5,15 +5,61 @@ from typing import Any, Optional
 from django.contrib import auth
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import BaseUserManager
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.utils.encoding import DjangoUnicodeDecodeError, force_str
 from django.utils.http import urlsafe_base64_decode
 
 
+class SequenceManager(models.Manager):
+    """Custom manager for the sequence model."""
+
+    def reserve(self, name: str, *, size: int) -> range:
+        """Reserve the next size values of the named sequence with one update."""
+
+        with transaction.atomic(using=self.db):
+            updated = self.filter(name=name).update(
+                next_value=models.F("next_value") + size
+            )
+            if not updated:
+                self.get_or_create(name=name)
+                self.filter(name=name).update(next_value=models.F("next_value") + size)
+            end = self.filter(name=name).values_list("next_value", flat=True).get()
+        return range(end - size, end)
+
+    def advance(self, name: str, *, past: int) -> None:
+        """Move the named sequence beyond the given value if it is not already."""
+
+        sequence, _ = self.get_or_create(name=name)
+        self.filter(pk=sequence.pk, next_value__lte=past).update(next_value=past + 1)
+
+
 class CustomUserQuerySet(models.QuerySet):
     """Custom queryset for the custom user model."""
 
-    pass
+    SEARCH_FIELDS = ("first_name", "last_name", "username", "email")
+
+    def search(self, term: str) -> Any:
+        """Filter the users having a name, username or email starting with each word.
+
+        Every word is matched as a range on the lowercased columns, so the
+        search uses their functional indexes instead of scanning the table.
+        """
+
+        queryset = self.annotate(
+            **{f"lower_{field}": Lower(field) for field in self.SEARCH_FIELDS}
+        )
+        for word in term.lower().split():
+            condition = models.Q()
+            for field in self.SEARCH_FIELDS:
+                condition |= models.Q(
+                    **{
+                        f"lower_{field}__gte": word,
+                        f"lower_{field}__lt": word + chr(0x10FFFF),
+                    }
+                )
+            queryset = queryset.filter(condition)
+        return queryset.order_by("lower_first_name", "lower_last_name", "pk")
 
 
 class CustomUserManager(BaseUserManager):
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.5 on 2026-10-18 14:10
+
+from typing import Any
+
+from django.db import migrations, models
+
+
+def start_username_sequence(apps: Any, schema_editor: Any) -> None:
+    """Start the username sequence after every username issued so far."""
+
+    Reference = apps.get_model("accounts", "Reference")
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    Sequence = apps.get_model("accounts", "Sequence")
+
+    last = Reference.objects.aggregate(last=models.Max("pk"))["last"] or 0
+    usernames = CustomUser.objects.filter(username__startswith="user-")
+    for username in usernames.values_list("username", flat=True).iterator():
+        suffix = username[len("user-") :]
+        if suffix.isdigit():
+            last = max(last, int(suffix))
+
+    Sequence.objects.create(name="username", next_value=last + 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Sequence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("next_value", models.PositiveBigIntegerField(default=1)),
+            ],
+            options={
+                "verbose_name": "sequence",
+                "verbose_name_plural": "sequences",
+            },
+        ),
+        migrations.RunPython(start_username_sequence, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,17 @@
 """Database models for the accounts application."""
 
+from collections import deque
+from typing import Deque
+
+from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
-from webapp.accounts.managers import CustomUserManager
+from webapp.accounts.managers import CustomUserManager, SequenceManager
 
 
 class Reference(models.Model):
@@ -28,9 +33,70 @@ class Reference(models.Model):
 
     @classmethod
     def generate_username(cls) -> str:
-        """Generate a unique reference number."""
+        """Generate a unique username from the username sequence."""
+
+        return cls.format_username(USERNAME_ALLOCATOR.next_value())
+
+    @staticmethod
+    def format_username(number: int) -> str:
+        """Return the username of the given username sequence number."""
+
+        suffix = f"{number}".zfill(6)
+        return f"user-{suffix}"
+
+
+class Sequence(models.Model):
+    """Named counter handing out blocks of unique numbers."""
+
+    name = models.CharField(unique=True, max_length=50)
+    next_value = models.PositiveBigIntegerField(default=1)
+
+    objects = SequenceManager()
+
+    class Meta:
+        verbose_name = "sequence"
+        verbose_name_plural = "sequences"
+
+    def __str__(self) -> str:
+        """Return the sequence name."""
+
+        return self.name
+
+
+class SequenceAllocator:
+    """Hand out the numbers of a sequence from blocks reserved in the database.
+
+    One update reserves a whole block (hi/lo allocation), so only one in
+    block_size calls writes to the database. Numbers left in a block when the
+    process exits are never used.
+
+    A block reserved inside a transaction is only kept for later calls once
+    that transaction commits. A rolled back reservation is never reused.
+    """
+
+    def __init__(self, name: str, *, block_size: int) -> None:
+        """Start without a reserved block."""
+
+        self.name = name
+        self.block_size = block_size
+        self.values: Deque[int] = deque()
+
+    def next_value(self) -> int:
+        """Return the next unused number of the sequence."""
+
+        try:
+            return self.values.popleft()
+        except IndexError:
+            pass
+
+        block = Sequence.objects.reserve(self.name, size=self.block_size)
+        transaction.on_commit(lambda: self.values.extend(block[1:]))
+        return block[0]
+
 
-        return cls.generate_reference(prefix="user")
+USERNAME_ALLOCATOR = SequenceAllocator(
+    "username", block_size=settings.USERNAME_BLOCK_SIZE
+)
 
 
 class CustomUser(AbstractBaseUser, PermissionsMixin):
@@ -70,6 +136,12 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         verbose_name = "user"
         verbose_name_plural = "users"
         default_manager_name = "objects"
+        indexes = [
+            models.Index(Lower("first_name"), name="user_lower_first_name_idx"),
+            models.Index(Lower("last_name"), name="user_lower_last_name_idx"),
+            models.Index(Lower("username"), name="user_lower_username_idx"),
+            models.Index(Lower("email"), name="user_lower_email_idx"),
+        ]
 
     def __str__(self) -> str:
         """Return the first and last name if they exist, else return the username."""
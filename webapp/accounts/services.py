@@ -1,8 +1,19 @@
 """Service layer for the core application."""
 
-from typing import Any
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional
 
-from webapp.accounts.models import CustomUser, Reference
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from webapp.accounts.models import CustomUser, Reference, Sequence
 
 
 def create_user(
@@ -45,3 +56,127 @@ def update_profile_details(
     user.last_name = last_name
     user.email = email
     user.save()
+
+
+def hash_passwords(passwords: List[Optional[str]], *, workers: int = 1) -> List[str]:
+    """Hash the passwords, in a pool of worker processes when asked.
+
+    Missing passwords are stored as unusable passwords.
+    """
+
+    if workers <= 1:
+        return [make_password(password) for password in passwords]
+
+    chunksize = max(1, len(passwords) // (workers * 4))
+    with Pool(workers, initializer=django.setup) as pool:
+        return pool.map(make_password, passwords, chunksize=chunksize)
+
+
+def bulk_create_users(
+    *,
+    users: List[Dict[str, Any]],
+    workers: int = 1,
+    batch_size: Optional[int] = None,
+) -> List[CustomUser]:
+    """Validate and create many active users at once.
+
+    Each user is a mapping with a first name, an optional middle name, a last
+    name, an email address and an optional password. Every row is validated
+    before anything is written; errors are raised as a single ValidationError
+    keyed by "<row index>.<field>". Users without a password are created with
+    an unusable one and can set it through the password reset form.
+    """
+
+    batch_size = batch_size or settings.USER_IMPORT_BATCH_SIZE
+    name_length = CustomUser._meta.get_field("first_name").max_length
+    email_length = CustomUser._meta.get_field("email").max_length
+
+    emails = [
+        CustomUser.objects.normalize_email(row.get("email")).lower()
+        for row in users
+        if isinstance(row, dict) and isinstance(row.get("email"), str)
+    ]
+    taken = set()
+    for start in range(0, len(emails), batch_size):
+        taken.update(
+            CustomUser.objects.annotate(lower_email=Lower("email"))
+            .filter(lower_email__in=emails[start : start + batch_size])
+            .values_list("lower_email", flat=True)
+        )
+
+    errors: Dict[str, List[str]] = {}
+    instances = []
+    passwords = []
+    seen = set()
+    now = timezone.now()
+
+    for index, row in enumerate(users):
+        if not isinstance(row, dict):
+            errors[f"{index}"] = ["Each user must be an object."]
+            continue
+
+        error_count = len(errors)
+
+        for field in ("first_name", "middle_name", "last_name"):
+            value = row.get(field) or ""
+            if not isinstance(value, str):
+                errors[f"{index}.{field}"] = ["Enter a valid name."]
+            elif not value and field != "middle_name":
+                errors[f"{index}.{field}"] = ["This field is required."]
+            elif len(value) > name_length:
+                errors[f"{index}.{field}"] = [
+                    f"Ensure this value has at most {name_length} characters."
+                ]
+
+        email = row.get("email")
+        try:
+            if not email or not isinstance(email, str):
+                raise ValidationError("This field is required.")
+            validate_email(email)
+            if len(email) > email_length:
+                raise ValidationError(
+                    f"Ensure this value has at most {email_length} characters."
+                )
+            email = CustomUser.objects.normalize_email(email)
+            if email.lower() in taken or email.lower() in seen:
+                raise ValidationError("A user with that email address already exists.")
+        except ValidationError as error:
+            errors[f"{index}.email"] = error.messages
+        else:
+            seen.add(email.lower())
+
+        if len(errors) > error_count:
+            continue
+
+        user = CustomUser(
+            first_name=row["first_name"],
+            middle_name=row.get("middle_name") or "",
+            last_name=row["last_name"],
+            email=email,
+            date_joined=now,
+        )
+
+        password = row.get("password") or None
+        if password is not None:
+            try:
+                validate_password(password, user=user)
+            except ValidationError as error:
+                errors[f"{index}.password"] = error.messages
+                continue
+
+        instances.append(user)
+        passwords.append(password)
+
+    if errors:
+        raise ValidationError(errors)
+    if not instances:
+        return []
+
+    for user, encoded in zip(instances, hash_passwords(passwords, workers=workers)):
+        user.password = encoded
+
+    with transaction.atomic():
+        numbers = Sequence.objects.reserve("username", size=len(instances))
+        for user, number in zip(instances, numbers):
+            user.username = Reference.format_username(number)
+        return CustomUser.objects.bulk_create(instances, batch_size=batch_size)
@@ -6,9 +6,16 @@ from django import forms
 from django.contrib import admin
 from django.http import HttpRequest
 from django.utils import timezone
-from django_select2.forms import Select2Widget
 
-from webapp.tasktrack.models import Priority, Status, Task
+from webapp.tasktrack import services
+from webapp.tasktrack.forms import UserSelect2Widget
+from webapp.tasktrack.models import (
+    Priority,
+    Status,
+    Task,
+    TaskArchive,
+    TaskStatistics,
+)
 
 
 class TaskAdminForm(forms.ModelForm):
@@ -18,7 +25,8 @@ class TaskAdminForm(forms.ModelForm):
         model = Task
         fields = "__all__"
         widgets = {
-            "assigned_to": Select2Widget,
+            "assigned_to": UserSelect2Widget,
+            "created_by": UserSelect2Widget,
         }
 
 
@@ -104,3 +112,62 @@ class TaskAdmin(admin.ModelAdmin):
         obj.updated_by = request.user
         obj.updated_at = timezone.now()
         obj.save()
+
+    def delete_queryset(self, request: HttpRequest, queryset: Any) -> None:
+        """Delete the selected tasks and remove them from the statistics."""
+
+        services.delete_tasks(tasks=queryset)
+
+
+@admin.register(TaskArchive)
+class TaskArchiveAdmin(admin.ModelAdmin):
+    """Custom admin class for archived task model."""
+
+    list_display = (
+        "title",
+        "due_date",
+        "priority",
+        "status",
+        "assigned_to",
+        "updated_at",
+        "archived_at",
+    )
+
+    list_filter = (
+        "priority__name",
+        "status__name",
+    )
+
+    search_fields = ("title",)
+    ordering = ("-pk",)
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        """Archived tasks are only created by the archive_tasks command."""
+
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: Any = None) -> bool:
+        """Archived tasks are read only."""
+
+        return False
+
+
+@admin.register(TaskStatistics)
+class TaskStatisticsAdmin(admin.ModelAdmin):
+    """Custom admin class for task statistics model."""
+
+    list_display = (
+        "dimension",
+        "key",
+        "count",
+    )
+    readonly_fields = (
+        "dimension",
+        "key",
+        "count",
+    )
+
+    list_filter = ("dimension",)
+
+    search_fields = ("key",)
+    ordering = ("dimension", "key")
@@ -8,3 +8,8 @@ class TasktrackConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "webapp.tasktrack"
+
+    def ready(self) -> None:
+        """Connect the application signal receivers."""
+
+        from webapp.tasktrack import signals  # noqa: F401
@@ -0,0 +1,241 @@
+"""Server-side processing for the DataTables task tables.
+
+Implements the request and response protocol described at
+https://datatables.net/manual/server-side for the tasks and home tables:
+paging, ordering by any column, the global search box and per-column
+filters. Every filter and ordering maps to an indexed column or to one of
+the task or user search indexes.
+"""
+
+import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from webapp.accounts.models import CustomUser
+from webapp.tasktrack.enums import PriorityLevel, StatusType
+from webapp.tasktrack.managers import search_words
+from webapp.tasktrack.models import Priority, Status
+from webapp.tasktrack.templatetags.custom_tags import user_display
+
+USER_COLUMNS = ("assigned_to", "created_by", "updated_by")
+DATE_COLUMNS = ("due_date", "created_at", "updated_at")
+
+
+def _level(field: str, names: Iterable[str]) -> Case:
+    """Return the position of the related row's name among the names, for ordering."""
+
+    return Case(
+        *[
+            When(**{f"{field}__name": name}, then=Value(index))
+            for index, name in enumerate(names)
+        ],
+        output_field=IntegerField(),
+    )
+
+
+# Priorities and statuses are ordered by level, as the enums list them.
+ORDERING: Dict[str, Tuple[Any, ...]] = {
+    "title": ("title",),
+    "due_date": ("due_date",),
+    "priority": (_level("priority", PriorityLevel.values),),
+    "status": (_level("status", StatusType.values),),
+    "assigned_to": ("assigned_to__first_name", "assigned_to__last_name"),
+    "created_by": ("created_by__first_name", "created_by__last_name"),
+    "updated_by": ("updated_by__first_name", "updated_by__last_name"),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+}
+
+
+def _parse_int(value: Optional[str], default: int) -> int:
+    """Convert a query string value to an integer, falling back to the default."""
+
+    try:
+        return int(value)  # type: ignore
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_date_range(value: str) -> Optional[Tuple[datetime.date, datetime.date]]:
+    """Parse "YYYY-MM-DD" or "YYYY-MM-DD,YYYY-MM-DD" into an inclusive range."""
+
+    parts = [part.strip() for part in value.split(",", 1)]
+    try:
+        dates = [parse_date(part) for part in parts]
+    except ValueError:
+        return None
+    if not all(dates):
+        return None
+    return dates[0], dates[-1]  # type: ignore
+
+
+def _date_filter(column: str, value: str) -> Q:
+    """Return a filter on a date or datetime column, as a range on its index."""
+
+    dates = _parse_date_range(value)
+    if dates is None:
+        return Q(pk__in=[])
+
+    start, end = dates
+    if column == "due_date":
+        return Q(due_date__gte=start, due_date__lte=end)
+
+    tz = timezone.get_current_timezone()
+    start_at = datetime.datetime.combine(start, datetime.time.min, tzinfo=tz)
+    end_at = datetime.datetime.combine(
+        end + datetime.timedelta(days=1), datetime.time.min, tzinfo=tz
+    )
+    return Q(**{f"{column}__gte": start_at, f"{column}__lt": end_at})
+
+
+def _lookup_filter(column: str, value: str) -> Q:
+    """Return a filter on the priority or status with the given name."""
+
+    model: Any = Priority if column == "priority" else Status
+    lookup = model.objects.cached(value.strip().upper())
+    return Q(**{f"{column}_id": lookup.pk if lookup else None})
+
+
+def column_filter(column: str, value: str) -> Q:
+    """Return the filter applied by the search box of one column."""
+
+    if column == "title":
+        return Q(title__icontains=value)
+    if column in ("priority", "status"):
+        return _lookup_filter(column, value)
+    if column in USER_COLUMNS:
+        return Q(**{f"{column}__in": CustomUser.objects.all().search(value)})
+    if column in DATE_COLUMNS:
+        return _date_filter(column, value)
+    return Q()
+
+
+def ordering(params: QueryDict) -> List[Any]:
+    """Return the order_by fields and expressions requested by the order parameters."""
+
+    fields: List[Any] = []
+    index = 0
+    while f"order[{index}][column]" in params:
+        column_index = params.get(f"order[{index}][column]")
+        column = params.get(f"columns[{column_index}][data]", "")
+        descending = params.get(f"order[{index}][dir]") == "desc"
+        for field in ORDERING.get(column, ()):
+            if not isinstance(field, str):
+                fields.append(field.desc() if descending else field.asc())
+            else:
+                fields.append(f"-{field}" if descending else field)
+        index += 1
+
+    fields.append("-pk")
+    return fields
+
+
+def column_searches(params: QueryDict) -> Dict[str, str]:
+    """Return the non-empty per-column search values by column name."""
+
+    searches = {}
+    index = 0
+    while f"columns[{index}][data]" in params:
+        column = params.get(f"columns[{index}][data]", "")
+        value = params.get(f"columns[{index}][search][value]", "").strip()
+        if value and column in ORDERING:
+            searches[column] = value
+        index += 1
+    return searches
+
+
+def task_row(task: Any, user: Any) -> Dict[str, Any]:
+    """Return the JSON representation of a task table row."""
+
+    completed = task.status.name == StatusType.COMPLETED
+    return {
+        "id": task.pk,
+        "title": task.title,
+        "due_date": task.due_date.isoformat() if task.due_date else "",
+        "priority": {
+            "name": task.priority.name,
+            "colour": task.priority.priority_level_colour,
+        },
+        "status": {"name": task.status.name, "colour": task.status.status_colour},
+        "assigned_to": user_display(task.assigned_to, user),
+        "created_by": user_display(task.created_by, user),
+        "updated_by": user_display(task.updated_by, user),
+        "created_at": timezone.localtime(task.created_at).strftime("%Y-%m-%d %H:%M:%S"),
+        "updated_at": timezone.localtime(task.updated_at).strftime("%Y-%m-%d %H:%M:%S"),
+        "urls": {
+            "details": reverse("task_details", kwargs={"pk": task.pk}),
+            "update": (
+                None if completed else reverse("task_update", kwargs={"pk": task.pk})
+            ),
+            "delete": (
+                None
+                if completed or not user.is_superuser
+                else reverse("delete_task", kwargs={"pk": task.pk})
+            ),
+        },
+    }
+
+
+def task_table(
+    params: QueryDict,
+    queryset: Any,
+    *,
+    user: Any,
+    total: Callable[[], int],
+    rank_search: bool = False,
+) -> Dict[str, Any]:
+    """Return the DataTables response for one draw of a task table.
+
+    total returns the number of rows before filtering; the views read it from
+    the task statistics instead of counting the table. With rank_search, a
+    global search without column orders or filters keeps the matches in
+    search rank order, as on the search page rendered by the view; the
+    queryset must then hold every task.
+
+    In the default order, an after parameter holding the last id shown pages
+    forward from that row on the primary key index instead of skipping start
+    rows, as the keyset pagination of the rendered pages does.
+    """
+
+    start = max(_parse_int(params.get("start"), 0), 0)
+    length = _parse_int(params.get("length"), settings.TASK_LIST_PAGE_SIZE)
+    if length < 1 or length > settings.TASK_LIST_MAX_PAGE_SIZE:
+        length = settings.TASK_LIST_MAX_PAGE_SIZE
+    ordered = "order[0][column]" in params
+    after = _parse_int(params.get("after"), 0)
+
+    records_total = total()
+    filtered = queryset
+    search = params.get("search[value]", "").strip()
+    if search:
+        filtered = filtered.matching(search)
+    searches = column_searches(params)
+    for column, value in searches.items():
+        filtered = filtered.filter(column_filter(column, value))
+
+    if filtered is queryset:
+        records_filtered = records_total
+    else:
+        records_filtered = filtered.count()
+
+    if rank_search and search_words(search) and not ordered and not searches:
+        tasks = queryset.search(search, limit=start + length).for_listing()[start:]
+    elif after > 0 and not ordered:
+        tasks = filtered.filter(pk__lt=after).for_listing().order_by("-pk")[:length]
+    else:
+        tasks = filtered.for_listing().order_by(*ordering(params))[
+            start : start + length
+        ]
+
+    return {
+        "draw": _parse_int(params.get("draw"), 0),
+        "recordsTotal": records_total,
+        "recordsFiltered": records_filtered,
+        "data": [task_row(task, user) for task in tasks],
+    }
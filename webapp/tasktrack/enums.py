@@ -21,3 +21,14 @@ class StatusType(models.TextChoices):
     IN_PROGRESS: Any = "IN_PROGRESS", "In Progress"
     COMPLETED: Any = "COMPLETED", "Completed"
     CANCELLED: Any = "CANCELLED", "Cancelled"
+
+
+class StatisticDimension(models.TextChoices):
+    """Enumeration class for task statistic dimensions."""
+
+    STATUS: Any = "STATUS", "Status"
+    PRIORITY: Any = "PRIORITY", "Priority"
+    ASSIGNEE_STATUS: Any = "ASSIGNEE_STATUS", "Assignee status"
+    DUE_MONTH: Any = "DUE_MONTH", "Due month"
+    STATUS_MONTH: Any = "STATUS_MONTH", "Status month"
+    ARCHIVED_STATUS: Any = "ARCHIVED_STATUS", "Archived status"
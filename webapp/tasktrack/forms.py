@@ -1,14 +1,39 @@
 """Form classes for the tasktrack application."""
 
 import datetime
+from typing import Any, Dict, List
 
 from django import forms
-from django_select2.forms import Select2Widget
+from django_select2.forms import ModelSelect2Widget
 
 from webapp.accounts.models import CustomUser
 from webapp.tasktrack.models import Priority, Status, Task
 
 
+class UserSelect2Widget(ModelSelect2Widget):
+    """Select2 widget loading the active users from the user search endpoint.
+
+    Only the selected user is rendered into the page; the other choices are
+    fetched page by page while the user types.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Point the widget at the user search endpoint."""
+
+        kwargs.setdefault("data_view", "user_search_api")
+        super().__init__(*args, **kwargs)
+
+    def build_attrs(self, base_attrs: Any, extra_attrs: Any = None) -> Any:
+        """Start searching from the first typed character."""
+
+        return super().build_attrs(
+            {"data-minimum-input-length": 0, **base_attrs}, extra_attrs=extra_attrs
+        )
+
+    def set_to_cache(self) -> None:
+        """Skip the django-select2 widget registry, the endpoint does not use it."""
+
+
 class CreateTaskForm(forms.Form):
     """Create task form."""
 
@@ -30,7 +55,7 @@ class CreateTaskForm(forms.Form):
         queryset=Priority.objects.all(),
     )
     assigned_to = forms.ModelChoiceField(
-        queryset=CustomUser.objects.filter(is_active=True), widget=Select2Widget
+        queryset=CustomUser.objects.filter(is_active=True), widget=UserSelect2Widget
     )
 
     def clean_due_date(self) -> str:
@@ -68,7 +93,7 @@ class TaskUpdateForm(forms.ModelForm):
         queryset=Status.objects.all(),
     )
     assigned_to = forms.ModelChoiceField(
-        queryset=CustomUser.objects.filter(is_active=True), widget=Select2Widget
+        queryset=CustomUser.objects.filter(is_active=True), widget=UserSelect2Widget
     )
 
     class Meta:
@@ -87,6 +112,10 @@ class TaskUpdateForm(forms.ModelForm):
 class CreateCalendarTaskForm(forms.ModelForm):
     """Create task form."""
 
+    assigned_to = forms.ModelChoiceField(
+        queryset=CustomUser.objects.filter(is_active=True), widget=UserSelect2Widget
+    )
+
     class Meta:
         model = Task
         fields = ["title", "due_date", "description", "priority", "assigned_to"]
@@ -110,3 +139,56 @@ class CreateCalendarTaskForm(forms.ModelForm):
                 "Due date cannot be earlier than the creation date."
             )
         return due_date
+
+
+class TaskIdListField(forms.Field):
+    """A list of task ids posted as repeated hidden or checkbox inputs."""
+
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value: Any) -> List[int]:
+        """Convert the posted values to a list of integers."""
+
+        if not value:
+            return []
+        try:
+            return [int(task_id) for task_id in value]
+        except (TypeError, ValueError):
+            raise forms.ValidationError("Enter a valid list of tasks.")
+
+    def validate(self, value: List[int]) -> None:
+        """Require at least one task when the field is required."""
+
+        if self.required and not value:
+            raise forms.ValidationError("Select at least one task.")
+
+
+class BulkTaskUpdateForm(forms.Form):
+    """Bulk task update form."""
+
+    task_ids = TaskIdListField()
+    status = forms.ModelChoiceField(
+        queryset=Status.objects.all(),
+        required=False,
+    )
+    priority = forms.ModelChoiceField(
+        queryset=Priority.objects.all(),
+        required=False,
+    )
+    assigned_to = forms.ModelChoiceField(
+        queryset=CustomUser.objects.filter(is_active=True),
+        widget=UserSelect2Widget,
+        required=False,
+    )
+
+    def clean(self) -> Dict[str, Any]:
+        """Require at least one field to change."""
+
+        cleaned_data = super().clean()
+        if not any(
+            cleaned_data.get(field) for field in ("status", "priority", "assigned_to")
+        ):
+            raise forms.ValidationError(
+                "Choose a status, priority or assignee to apply."
+            )
+        return cleaned_data
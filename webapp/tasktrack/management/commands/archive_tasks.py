@@ -0,0 +1,58 @@
+"""Move old completed and cancelled tasks into the task archive."""
+
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from webapp.tasktrack import services
+from webapp.tasktrack.enums import StatusType
+from webapp.tasktrack.models import Status, Task
+
+
+class Command(BaseCommand):
+    """Archive the finished tasks that have not changed for a while."""
+
+    help = (
+        "Move the completed and cancelled tasks not updated for --older-than "
+        "days into the task archive, in batches."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add the age and batch size options."""
+
+        parser.add_argument("--older-than", type=int, required=True)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Archive the finished tasks in batches."""
+
+        if options["older_than"] < 0:
+            raise CommandError("--older-than must not be negative.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        statuses = [
+            status.pk
+            for status in Status.objects.cached_all()
+            if status.name in (StatusType.COMPLETED, StatusType.CANCELLED)
+        ]
+        cutoff = timezone.now() - timedelta(days=options["older_than"])
+        finished = Task.objects.filter(status__in=statuses, updated_at__lt=cutoff)
+
+        archived = 0
+        while True:
+            batch = list(
+                finished.order_by("pk").values_list("pk", flat=True)[
+                    : options["batch_size"]
+                ]
+            )
+            if not batch:
+                break
+            # The batch is filtered again inside the archive transaction, so a
+            # task reopened in the meantime stays in the task table.
+            archived += services.archive_tasks(tasks=finished.filter(pk__in=batch))
+            self.stdout.write(f"Archived {archived} tasks.")
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} tasks in total."))
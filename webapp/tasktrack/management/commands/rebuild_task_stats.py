@@ -0,0 +1,19 @@
+"""Recompute the task statistics rollup from the task table."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from webapp.tasktrack.models import TaskStatistics
+
+
+class Command(BaseCommand):
+    """Rebuild the task statistics rollup from scratch."""
+
+    help = "Recompute every task statistics bucket from the task table."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild the task statistics."""
+
+        buckets = TaskStatistics.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {buckets} task statistics."))
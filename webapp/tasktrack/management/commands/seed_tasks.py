@@ -0,0 +1,187 @@
+"""Generate synthetic users and tasks for load testing."""
+
+import random
+from multiprocessing import Pool
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from webapp.accounts.models import CustomUser
+from webapp.tasktrack.enums import PriorityLevel, StatusType
+from webapp.tasktrack.models import Priority, Status, Task, TaskStatistics
+from webapp.tasktrack.seeding import (
+    FIRST_NAMES,
+    LAST_NAMES,
+    TaskRow,
+    generate_chunk,
+    generate_tasks,
+)
+
+
+class Command(BaseCommand):
+    """Seed the database with synthetic users and tasks."""
+
+    help = (
+        "Generate realistic users, priorities, statuses and tasks with "
+        "bulk_create, optionally generating the rows in worker processes."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add the volume and performance options."""
+
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--tasks", type=int, default=100000)
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes generating task rows; inserts stay in this process.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--password",
+            default=None,
+            help="Password of the seeded users; they cannot log in without one.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Seed the lookup rows, users and tasks, then rebuild the statistics."""
+
+        if options["users"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--users and --chunk-size must be positive.")
+
+        status_ids = self.seed_lookups(Status, StatusType.values)
+        priority_ids = self.seed_lookups(Priority, PriorityLevel.values)
+        user_ids = self.seed_users(
+            count=options["users"],
+            password=options["password"],
+            seed=options["seed"],
+            chunk_size=options["chunk_size"],
+        )
+        self.stdout.write(f"Seeded {len(user_ids)} users.")
+
+        chunks = self.chunk_arguments(
+            total=options["tasks"],
+            chunk_size=options["chunk_size"],
+            seed=options["seed"],
+            user_ids=user_ids,
+            status_ids=status_ids,
+            priority_ids=priority_ids,
+        )
+
+        created = 0
+        for rows in self.generate(chunks, workers=options["workers"]):
+            created += self.insert_tasks(rows, creator_id=user_ids[0])
+            self.stdout.write(f"Seeded {created} of {options['tasks']} tasks.")
+
+        buckets = TaskStatistics.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {created} tasks and rebuilt {buckets} task statistics."
+            )
+        )
+
+    def seed_lookups(self, model: Any, names: List[str]) -> Dict[str, int]:
+        """Create any missing lookup rows and return their ids by name."""
+
+        for name in names:
+            if model.objects.cached(name) is None:
+                model.objects.create(name=name)
+        return {name: model.objects.cached(name).pk for name in names}
+
+    def seed_users(
+        self, *, count: int, password: Optional[str], seed: int, chunk_size: int
+    ) -> List[int]:
+        """Insert count active users and return their ids."""
+
+        generator = random.Random(seed)
+        encoded = make_password(password)
+        offset = (CustomUser.objects.aggregate(last=Max("pk"))["last"] or 0) + 1
+        now = timezone.now()
+
+        users = []
+        for number in range(offset, offset + count):
+            first_name = generator.choice(FIRST_NAMES)
+            last_name = generator.choice(LAST_NAMES)
+            users.append(
+                CustomUser(
+                    username=f"seed-{number}",
+                    email=f"{first_name}.{last_name}.{number}@example.com".lower(),
+                    first_name=first_name,
+                    last_name=last_name,
+                    password=encoded,
+                    date_joined=now,
+                )
+            )
+
+        with transaction.atomic():
+            CustomUser.objects.bulk_create(users, batch_size=chunk_size)
+        return list(
+            CustomUser.objects.filter(
+                username__in=[user.username for user in users]
+            ).values_list("pk", flat=True)
+        )
+
+    def chunk_arguments(
+        self, *, total: int, chunk_size: int, seed: int, **shared: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the generate_tasks arguments of each chunk."""
+
+        # Local time, so due dates are computed from the local creation date.
+        now = timezone.localtime()
+        for index, start in enumerate(range(0, total, chunk_size)):
+            yield {
+                "seed": seed * 1000003 + index,
+                "count": min(chunk_size, total - start),
+                "now": now,
+                **shared,
+            }
+
+    def generate(
+        self, chunks: Iterator[Dict[str, Any]], *, workers: int
+    ) -> Iterator[List[TaskRow]]:
+        """Generate the chunks in order, using worker processes when asked."""
+
+        if workers <= 1:
+            for arguments in chunks:
+                yield generate_tasks(**arguments)
+            return
+
+        with Pool(workers) as pool:
+            yield from pool.imap(generate_chunk, chunks)
+
+    def insert_tasks(self, rows: List[TaskRow], *, creator_id: int) -> int:
+        """Insert one chunk of generated rows and return how many were inserted."""
+
+        tasks = [
+            Task(
+                title=title,
+                due_date=due_date,
+                description=description,
+                priority_id=priority_id,
+                status_id=status_id,
+                assigned_to_id=assigned_to_id,
+                created_by_id=creator_id,
+                updated_by_id=creator_id,
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+            for (
+                title,
+                due_date,
+                description,
+                priority_id,
+                status_id,
+                assigned_to_id,
+                created_at,
+                updated_at,
+            ) in rows
+        ]
+        with transaction.atomic():
+            Task.objects.bulk_create(tasks)
+        return len(tasks)
@@ -0,0 +1,60 @@
+"""Copy the primary SQLite database into its read replicas."""
+
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    """Copy the primary database into every configured SQLite replica."""
+
+    help = (
+        "Copy the primary SQLite database into the DATABASE_REPLICA_PATHS "
+        "replicas, once or every --interval seconds."
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add the interval option."""
+
+        parser.add_argument("--interval", type=float, default=0)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Copy the primary into the replicas."""
+
+        if not settings.DATABASE_REPLICAS:
+            raise CommandError("No replicas are configured in DATABASE_REPLICA_PATHS.")
+        if options["interval"] < 0:
+            raise CommandError("--interval must not be negative.")
+        if connections[DEFAULT_DB_ALIAS].vendor != "sqlite":
+            raise CommandError("Only SQLite replicas are copied by this command.")
+
+        while True:
+            self.sync()
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
+
+    def sync(self) -> None:
+        """Copy the primary into each replica."""
+
+        primary = connections[DEFAULT_DB_ALIAS]
+        primary.ensure_connection()
+        for alias in settings.DATABASE_REPLICAS:
+            replica = connections[alias]
+            if replica.settings_dict["NAME"] == primary.settings_dict["NAME"]:
+                continue
+            started = time.perf_counter()
+            replica.ensure_connection()
+            # The online backup copies one snapshot of the primary in a single
+            # step: on the write-ahead log it does not block the writers, and
+            # readers of the replica see either the old or the new copy.
+            primary.connection.backup(replica.connection)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Copied the primary into {alias} in "
+                    f"{time.perf_counter() - started:.2f}s."
+                )
+            )
@@ -1,11 +1,138 @@
 """Custom managers/query layer for the tasktrack application."""
 
-from typing import Any
+import re
+from typing import Any, Counter, Dict, Iterable, List, Tuple
 
 from django.contrib.auth.models import BaseUserManager
-from django.db import models
+from django.core.cache import cache
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import TruncMonth
 
-from webapp.tasktrack.enums import PriorityLevel, StatusType
+from webapp.tasktrack.enums import PriorityLevel, StatisticDimension, StatusType
+
+MONTHS = (
+    "jan",
+    "feb",
+    "mar",
+    "apr",
+    "may",
+    "jun",
+    "jul",
+    "aug",
+    "sep",
+    "oct",
+    "nov",
+    "dec",
+)
+
+_LOOKUP_CACHE: Dict[str, Dict[str, Dict[Any, Any]]] = {}
+
+
+SEARCH_TABLE = "tasktrack_task_search"
+
+
+def search_words(query: str) -> List[str]:
+    """Split a free text search query into words."""
+
+    return re.findall(r"\w+", query)
+
+
+def status_count_name(status: str) -> str:
+    """Return the name the tasks with the given status are counted under."""
+
+    return status.lower()
+
+
+def priority_count_name(priority: str) -> str:
+    """Return the name the tasks with the given priority are counted under."""
+
+    return f"{priority.lower()}_priority"
+
+
+def clear_lookup_caches() -> None:
+    """Drop every cached lookup table."""
+
+    _LOOKUP_CACHE.clear()
+
+
+class LookupManager(BaseUserManager):
+    """Manager serving the rows of a small lookup table from a process-local cache.
+
+    The whole table is loaded on first use. The cache is dropped whenever a row
+    is saved or deleted in this process; rows created by another process are
+    picked up when a name misses the cache.
+    """
+
+    def _store_lookup_cache(self, rows: List[Any]) -> Dict[str, Dict[Any, Any]]:
+        """Cache the rows keyed by name and by primary key."""
+
+        cache = {
+            "name": {row.name: row for row in rows},
+            "pk": {row.pk: row for row in rows},
+        }
+        _LOOKUP_CACHE[self.model._meta.label] = cache
+        return cache
+
+    def _lookup_cache(self) -> Dict[str, Dict[Any, Any]]:
+        """Return the cached rows keyed by name and by primary key."""
+
+        cache = _LOOKUP_CACHE.get(self.model._meta.label)
+        if cache is None:
+            cache = self._store_lookup_cache(list(self.get_queryset()))
+        return cache
+
+    async def _alookup_cache(self) -> Dict[str, Dict[Any, Any]]:
+        """Return the cached rows, loading them with the async ORM."""
+
+        cache = _LOOKUP_CACHE.get(self.model._meta.label)
+        if cache is None:
+            cache = self._store_lookup_cache([row async for row in self.get_queryset()])
+        return cache
+
+    def cached(self, name: str) -> Any:
+        """Return the row with the given name from the cache."""
+
+        if name not in self._lookup_cache()["name"]:
+            self.clear_cache()
+        return self._lookup_cache()["name"].get(name)
+
+    async def acached(self, name: str) -> Any:
+        """Return the row with the given name from the cache."""
+
+        if name not in (await self._alookup_cache())["name"]:
+            self.clear_cache()
+        return (await self._alookup_cache())["name"].get(name)
+
+    def cached_by_pk(self, pk: int) -> Any:
+        """Return the row with the given primary key from the cache."""
+
+        if pk not in self._lookup_cache()["pk"]:
+            self.clear_cache()
+        return self._lookup_cache()["pk"].get(pk)
+
+    async def acached_by_pk(self, pk: int) -> Any:
+        """Return the row with the given primary key from the cache."""
+
+        if pk not in (await self._alookup_cache())["pk"]:
+            self.clear_cache()
+        return (await self._alookup_cache())["pk"].get(pk)
+
+    def cached_all(self) -> List[Any]:
+        """Return every row from the cache."""
+
+        return list(self._lookup_cache()["pk"].values())
+
+    async def acached_all(self) -> List[Any]:
+        """Return every row from the cache."""
+
+        return list((await self._alookup_cache())["pk"].values())
+
+    def clear_cache(self) -> None:
+        """Drop the cached rows so the next lookup reloads them."""
+
+        _LOOKUP_CACHE.pop(self.model._meta.label, None)
 
 
 class PriorityQuerySet(models.QuerySet):
@@ -14,7 +141,7 @@ class PriorityQuerySet(models.QuerySet):
     pass
 
 
-class PriorityManager(BaseUserManager):
+class PriorityManager(LookupManager):
     """Custom manager for the priority model."""
 
     def get_queryset(self) -> Any:
@@ -29,7 +156,7 @@ class StatusQuerySet(models.QuerySet):
     pass
 
 
-class StatusManager(BaseUserManager):
+class StatusManager(LookupManager):
     """Custom manager for the priority model."""
 
     def get_queryset(self) -> Any:
@@ -38,7 +165,112 @@ class StatusManager(BaseUserManager):
         return StatusQuerySet(self.model, using=self._db)
 
 
-class TaskQuerySet(models.QuerySet):
+class TaskCountQuerySet(models.QuerySet):
+    """Task counts shared by the task and archived task querysets."""
+
+    def counts_by(self, *fields: str) -> Dict[Tuple[Any, ...], int]:
+        """Return the number of rows for each combination of the field values."""
+
+        rows = self.values_list(*fields).annotate(total=Count("pk"))
+        return {tuple(row[:-1]): row[-1] for row in rows}
+
+    def counts_by_month(self, field: str, *fields: str) -> Dict[Tuple[Any, ...], int]:
+        """Return the number of rows per month of a date field and field values.
+
+        The month is the last item of each key. Rows without a date are left
+        out.
+        """
+
+        rows = (
+            self.exclude(**{field: None})
+            .annotate(month=TruncMonth(field))
+            .values_list(*fields, "month")
+            .annotate(total=Count("pk"))
+        )
+        return {tuple(row[:-1]): row[-1] for row in rows}
+
+    def status_counts(self) -> Dict[str, int]:
+        """Return the number of tasks per status in a single query."""
+
+        return self.aggregate(**self._status_aggregates())
+
+    def priority_counts(self) -> Dict[str, int]:
+        """Return the number of tasks per priority level in a single query."""
+
+        return self.aggregate(**self._priority_aggregates())
+
+    def due_counts_by_month(self, *, year: int) -> Dict[str, int]:
+        """Return the number of tasks due in each month of the year."""
+
+        return self.aggregate(**self._due_month_aggregates(year=year))
+
+    def completed_counts_by_month(self, *, year: int) -> Dict[str, int]:
+        """Return the number of tasks completed in each month of the year."""
+
+        return self.aggregate(**self._completed_month_aggregates(year=year))
+
+    def dashboard_counts(self, *, year: int) -> Dict[str, Dict[str, int]]:
+        """Return every dashboard bucket using one conditional aggregation."""
+
+        task_counts = {**self._status_aggregates(), **self._priority_aggregates()}
+        due_counts = self._due_month_aggregates(year=year)
+        completed_counts = self._completed_month_aggregates(year=year)
+
+        result = self.aggregate(**task_counts, **due_counts, **completed_counts)
+
+        return {
+            "task_counts": {key: result[key] for key in task_counts},
+            "due_tasks_count_by_month": {key: result[key] for key in due_counts},
+            "completed_tasks_count_by_month": {
+                key: result[key] for key in completed_counts
+            },
+        }
+
+    def _status_aggregates(self) -> Dict[str, Count]:
+        """Build a conditional count per status."""
+
+        return {
+            status_count_name(status): Count("pk", filter=Q(status__name=status))
+            for status in StatusType.values
+        }
+
+    def _priority_aggregates(self) -> Dict[str, Count]:
+        """Build a conditional count per priority level."""
+
+        return {
+            priority_count_name(priority): Count(
+                "pk", filter=Q(priority__name=priority)
+            )
+            for priority in PriorityLevel.values
+        }
+
+    def _due_month_aggregates(self, *, year: int) -> Dict[str, Count]:
+        """Build a conditional count per due date month."""
+
+        return {
+            f"{month}_due_tasks": Count(
+                "pk", filter=Q(due_date__year=year, due_date__month=number)
+            )
+            for number, month in enumerate(MONTHS, start=1)
+        }
+
+    def _completed_month_aggregates(self, *, year: int) -> Dict[str, Count]:
+        """Build a conditional count per completion month."""
+
+        return {
+            f"{month}_completed_tasks": Count(
+                "pk",
+                filter=Q(
+                    status__name=StatusType.COMPLETED,
+                    updated_at__year=year,
+                    updated_at__month=number,
+                ),
+            )
+            for number, month in enumerate(MONTHS, start=1)
+        }
+
+
+class TaskQuerySet(TaskCountQuerySet):
     """Custom queryset for the task model."""
 
     def low_priority_tasks(self) -> Any:
@@ -81,6 +313,101 @@ class TaskQuerySet(models.QuerySet):
 
         return self.filter(status__name=StatusType.CANCELLED)
 
+    def for_listing(self) -> Any:
+        """Return the tasks with every relation rendered by the task tables joined."""
+
+        return self.select_related(
+            "priority",
+            "status",
+            "assigned_to",
+            "created_by",
+            "updated_by",
+        ).defer("description")
+
+    def search(self, query: str, *, limit: int) -> Any:
+        """Return up to limit tasks matching every word of the query, best first.
+
+        On SQLite the FTS5 index maintained by the task search triggers ranks
+        the matches, and the limit applies before any filters already on the
+        queryset. Other databases fall back to substring filters.
+        """
+
+        words = search_words(query)
+        if not words:
+            return self.none()
+
+        if connections[self.db].vendor == "sqlite":
+            ids = self._search_index(words, limit=limit)
+        else:
+            ids = self._search_by_substring(words, limit=limit)
+
+        position = Case(
+            *[When(pk=pk, then=Value(index)) for index, pk in enumerate(ids)],
+            output_field=models.IntegerField(),
+        )
+        return (
+            self.filter(pk__in=ids)
+            .annotate(search_rank=position)
+            .order_by("search_rank")
+        )
+
+    def _search_index(self, words: List[str], *, limit: int) -> List[int]:
+        """Return the ids of the best FTS5 matches for the words."""
+
+        expression = " ".join(f'"{word}"*' for word in words)
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s "
+                "ORDER BY rank LIMIT %s",
+                [expression, limit],
+            )
+            return [pk for pk, in cursor.fetchall()]
+
+    def _search_by_substring(self, words: List[str], *, limit: int) -> List[int]:
+        """Return the ids of the newest tasks containing every word."""
+
+        ids = self.filter(self._substring_matches(words)).order_by("-pk")
+        return list(ids.values_list("pk", flat=True)[:limit])
+
+    def _substring_matches(self, words: List[str]) -> Q:
+        """Return a filter matching the tasks containing every word."""
+
+        matches = Q()
+        for word in words:
+            matches &= (
+                Q(title__icontains=word)
+                | Q(description__icontains=word)
+                | Q(assigned_to__first_name__icontains=word)
+                | Q(assigned_to__middle_name__icontains=word)
+                | Q(assigned_to__last_name__icontains=word)
+                | Q(assigned_to__username__icontains=word)
+                | Q(assigned_to__email__icontains=word)
+            )
+        return matches
+
+    def matching(self, query: str) -> Any:
+        """Filter the tasks matching every word of the query, without ranking.
+
+        Unlike search, every match is kept, so the result can be counted,
+        ordered and paginated. On SQLite the FTS5 index is read through a
+        subquery.
+        """
+
+        words = search_words(query)
+        if not words:
+            return self
+
+        if connections[self.db].vendor != "sqlite":
+            return self.filter(self._substring_matches(words))
+
+        expression = " ".join(f'"{word}"*' for word in words)
+        return self.filter(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s",
+                [expression],
+            )
+        )
+
 
 class TaskManager(BaseUserManager):
     """Custom manager for the task model."""
@@ -89,3 +416,119 @@ class TaskManager(BaseUserManager):
         """Return custom query set based on self.model."""
 
         return TaskQuerySet(self.model, using=self._db)
+
+
+class TaskArchiveManager(BaseUserManager):
+    """Custom manager for the archived task model."""
+
+    def get_queryset(self) -> Any:
+        """Return custom query set based on self.model."""
+
+        return TaskCountQuerySet(self.model, using=self._db)
+
+
+def home_counts_cache_key(user_id: Any) -> str:
+    """Return the cache key of a user's home page task counts."""
+
+    return f"tasktrack:home-counts:{user_id}"
+
+
+def invalidate_home_counts(user_ids: Iterable[Any]) -> None:
+    """Drop the cached home page counts of the given users.
+
+    The entries are dropped straight away and again once the transaction
+    commits, so a request reading the old rows in between cannot keep them.
+    """
+
+    keys = [home_counts_cache_key(user_id) for user_id in set(user_ids)]
+    if not keys:
+        return
+
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+class TaskStatisticsQuerySet(models.QuerySet):
+    """Custom queryset for the task statistics model."""
+
+    def counts(self, *, dimension: str, keys: Any) -> Dict[str, int]:
+        """Return the stored count for each of the given dimension keys."""
+
+        return dict(
+            self.filter(dimension=dimension, key__in=keys).values_list("key", "count")
+        )
+
+    async def acounts(self, *, dimension: str, keys: Any) -> Dict[str, int]:
+        """Return the stored count for each of the given dimension keys."""
+
+        rows = self.filter(dimension=dimension, key__in=keys).values_list(
+            "key", "count"
+        )
+        return {key: count async for key, count in rows}
+
+    def apply_deltas(self, deltas: Counter) -> None:
+        """Add the given (dimension, key) deltas to the stored counts.
+
+        Missing buckets are inserted together; if a concurrent writer created
+        one of them first, each bucket falls back to an update or insert.
+        """
+
+        deltas = Counter({bucket: delta for bucket, delta in deltas.items() if delta})
+        if not deltas:
+            return
+
+        stored = self.filter(
+            dimension__in={dimension for dimension, _ in deltas},
+            key__in={key for _, key in deltas},
+        ).values_list("dimension", "key")
+        existing = set(stored) & set(deltas)
+
+        missing = {
+            bucket: delta for bucket, delta in deltas.items() if bucket not in existing
+        }
+        if missing:
+            try:
+                with transaction.atomic():
+                    self.bulk_create(
+                        [
+                            self.model(dimension=dimension, key=key, count=delta)
+                            for (dimension, key), delta in missing.items()
+                        ]
+                    )
+            except IntegrityError:
+                for bucket, delta in missing.items():
+                    self._apply_delta(bucket, delta)
+
+        for bucket in existing:
+            self.filter(dimension=bucket[0], key=bucket[1]).update(
+                count=F("count") + deltas[bucket]
+            )
+
+        invalidate_home_counts(
+            key.split(":")[0]
+            for dimension, key in deltas
+            if dimension == StatisticDimension.ASSIGNEE_STATUS
+        )
+
+    def _apply_delta(self, bucket: Any, delta: int) -> None:
+        """Add a delta to a single bucket, creating it when it does not exist."""
+
+        dimension, key = bucket
+        rows = self.filter(dimension=dimension, key=key)
+        if rows.update(count=F("count") + delta):
+            return
+
+        try:
+            with transaction.atomic():
+                self.create(dimension=dimension, key=key, count=delta)
+        except IntegrityError:
+            rows.update(count=F("count") + delta)
+
+
+class TaskStatisticsManager(BaseUserManager):
+    """Custom manager for the task statistics model."""
+
+    def get_queryset(self) -> Any:
+        """Return custom query set based on self.model."""
+
+        return TaskStatisticsQuerySet(self.model, using=self._db)
@@ -0,0 +1,302 @@
+"""Request level SQL query profiling and read replica stickiness."""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.http import HttpRequest
+
+from webapp.tasktrack.routers import pinned_to_primary
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_PROFILE: ContextVar[Optional["QueryProfile"]] = ContextVar(
+    "active_query_profile", default=None
+)
+
+PRIMARY_PIN_COOKIE = "pin_primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+NUMBER = re.compile(r"\b\d+(\.\d+)?\b")
+STRING = re.compile(r"'(?:[^']|'')*'")
+PLACEHOLDERS = re.compile(r"%s(?:\s*,\s*%s)+")
+SAVEPOINT = re.compile(r'"s\d+_x\d+"')
+WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when a view runs more queries than its budget allows."""
+
+
+def fingerprint(sql: str) -> str:
+    """Return the SQL with literals and placeholder lists collapsed."""
+
+    sql = SAVEPOINT.sub('"?"', sql)
+    sql = STRING.sub("?", sql)
+    sql = NUMBER.sub("?", sql)
+    sql = PLACEHOLDERS.sub("%s, ...", sql)
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryProfile:
+    """Count the queries run through the database connections and their time."""
+
+    def __init__(self) -> None:
+        """Start with no recorded queries."""
+
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def __call__(
+        self, execute: Callable, sql: str, params: Any, many: bool, context: Any
+    ) -> Any:
+        """Run the query and record it."""
+
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.statements[sql] += 1
+
+    @contextmanager
+    def installed(self) -> Iterator["QueryProfile"]:
+        """Record the queries of every connection while the block runs.
+
+        The profile is active in the current context, so the queries that the
+        async ORM runs in worker threads are recorded too.
+        """
+
+        for connection in connections.all():
+            install_query_recorder(connection=connection)
+        token = ACTIVE_PROFILE.set(self)
+        try:
+            yield self
+        finally:
+            ACTIVE_PROFILE.reset(token)
+
+    def duplicates(self, limit: int = 5) -> List[Tuple[str, int]]:
+        """Return the most repeated query fingerprints.
+
+        The statements are only fingerprinted here, once a view is over its
+        budget, rather than on every query.
+        """
+
+        fingerprints: Counter = Counter()
+        for sql, count in self.statements.items():
+            fingerprints[fingerprint(sql)] += count
+        return [
+            (sql, count) for sql, count in fingerprints.most_common(limit) if count > 1
+        ]
+
+
+def record_query(
+    execute: Callable, sql: str, params: Any, many: bool, context: Any
+) -> Any:
+    """Run the query, recording it in the active profile if there is one."""
+
+    profile = ACTIVE_PROFILE.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    return profile(execute, sql, params, many, context)
+
+
+@receiver(connection_created)
+def install_query_recorder(connection: Any, **kwargs: Any) -> None:
+    """Wrap the queries of the connection with the query recorder."""
+
+    if not settings.QUERY_PROFILER_ENABLED:
+        return
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class QueryProfilerMiddleware:
+    """Count the queries of each request and enforce the per-view budgets.
+
+    The counts are reported in a Server-Timing header. Views listed in the
+    QUERY_BUDGETS setting by url name log their duplicate queries when they
+    exceed the budget, and raise QueryBudgetExceeded when QUERY_BUDGET_RAISE
+    is set. The middleware is skipped unless QUERY_PROFILER_ENABLED is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        """Store the next handler, unless query profiling is disabled."""
+
+        if not settings.QUERY_PROFILER_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """Profile the request and annotate the response."""
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        profile = QueryProfile()
+        started = time.perf_counter()
+
+        with profile.installed():
+            response = self.get_response(request)
+
+        return self.process_profile(request, response, profile, started)
+
+    async def __acall__(self, request: HttpRequest) -> Any:
+        """Profile the request and annotate the response."""
+
+        profile = QueryProfile()
+        started = time.perf_counter()
+
+        with profile.installed():
+            response = await self.get_response(request)
+
+        return self.process_profile(request, response, profile, started)
+
+    def process_profile(
+        self,
+        request: HttpRequest,
+        response: Any,
+        profile: QueryProfile,
+        started: float,
+    ) -> Any:
+        """Report the profile of the request and check its budget."""
+
+        elapsed = time.perf_counter() - started
+        response["Server-Timing"] = ", ".join(
+            value
+            for value in (
+                response.get("Server-Timing"),
+                f'db;dur={profile.duration * 1000:.2f};desc="{profile.count} queries"',
+                f"total;dur={elapsed * 1000:.2f}",
+            )
+            if value
+        )
+
+        if response.streaming and response.is_async:
+            response.streaming_content = self.aprofile_stream(
+                request, profile, response.streaming_content
+            )
+        elif response.streaming:
+            response.streaming_content = self.profile_stream(
+                request, profile, response.streaming_content
+            )
+        else:
+            self.check_budget(request, profile)
+
+        return response
+
+    def profile_stream(
+        self, request: HttpRequest, profile: QueryProfile, content: Iterator[Any]
+    ) -> Iterator[Any]:
+        """Keep counting while a streaming response is consumed."""
+
+        with profile.installed():
+            yield from content
+        self.check_budget(request, profile)
+
+    async def aprofile_stream(
+        self, request: HttpRequest, profile: QueryProfile, content: AsyncIterator[Any]
+    ) -> AsyncIterator[Any]:
+        """Keep counting while an async streaming response is consumed."""
+
+        with profile.installed():
+            async for chunk in content:
+                yield chunk
+        self.check_budget(request, profile)
+
+    def check_budget(self, request: HttpRequest, profile: QueryProfile) -> None:
+        """Log or raise when the view ran more queries than its budget."""
+
+        budget = self.budget(request)
+        if budget is None or profile.count <= budget:
+            return
+
+        view = request.resolver_match.url_name  # type: ignore
+        duplicates = "; ".join(f"{count}x {sql}" for sql, count in profile.duplicates())
+        message = (
+            f"{view} ran {profile.count} queries, over its budget of {budget}. "
+            f"Duplicate queries: {duplicates or 'none'}"
+        )
+        logger.warning(message)
+
+        if getattr(settings, "QUERY_BUDGET_RAISE", False):
+            raise QueryBudgetExceeded(message)
+
+    def budget(self, request: HttpRequest) -> Optional[int]:
+        """Return the query budget of the view that handled the request."""
+
+        match = request.resolver_match
+        if match is None:
+            return None
+        return getattr(settings, "QUERY_BUDGETS", {}).get(match.url_name)
+
+
+class ReplicaStickinessMiddleware:
+    """Keep the reads of a client on the primary for a while after it writes.
+
+    A successful POST, or any other unsafe request, sets a cookie that lasts
+    REPLICA_PIN_SECONDS. While the cookie is present the use_replica views
+    read from the primary, so the client sees its writes before they are
+    copied to the replicas.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        """Store the next handler."""
+
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """Pin the request to the primary when the client wrote recently."""
+
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        with pinned_to_primary(PRIMARY_PIN_COOKIE in request.COOKIES):
+            response = self.get_response(request)
+        return self.process_write(request, response)
+
+    async def __acall__(self, request: HttpRequest) -> Any:
+        """Pin the request to the primary when the client wrote recently."""
+
+        with pinned_to_primary(PRIMARY_PIN_COOKIE in request.COOKIES):
+            response = await self.get_response(request)
+        return self.process_write(request, response)
+
+    def process_write(self, request: HttpRequest, response: Any) -> Any:
+        """Start the pin when the request wrote to the primary."""
+
+        if (
+            settings.DATABASE_REPLICAS
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
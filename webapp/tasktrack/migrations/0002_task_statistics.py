@@ -0,0 +1,107 @@
+# Generated by Django 5.1.5 on 2026-10-18 11:54
+
+from collections import Counter
+from datetime import datetime
+from typing import Any
+
+from django.db import migrations, models
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+
+def month_key(value: Any) -> str:
+    """Return the year and month bucket of a date or datetime."""
+
+    if isinstance(value, datetime) and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.strftime("%Y-%m")
+
+
+def build_task_statistics(apps: Any, schema_editor: Any) -> None:
+    """Count the existing tasks into the new statistics rollup."""
+
+    Task = apps.get_model("tasktrack", "Task")
+    TaskStatistics = apps.get_model("tasktrack", "TaskStatistics")
+    tasks = Task.objects.all()
+    total = models.Count("pk")
+
+    keys: Counter = Counter()
+    for row in tasks.values("status_id").annotate(total=total):
+        keys[("STATUS", f"{row['status_id']}")] += row["total"]
+    for row in tasks.values("priority_id").annotate(total=total):
+        keys[("PRIORITY", f"{row['priority_id']}")] += row["total"]
+    for row in tasks.values("assigned_to_id", "status_id").annotate(total=total):
+        key = f"{row['assigned_to_id']}:{row['status_id']}"
+        keys[("ASSIGNEE_STATUS", key)] += row["total"]
+    for row in (
+        tasks.exclude(due_date=None)
+        .annotate(month=TruncMonth("due_date"))
+        .values("month")
+        .annotate(total=total)
+    ):
+        keys[("DUE_MONTH", month_key(row["month"]))] += row["total"]
+    for row in (
+        tasks.annotate(month=TruncMonth("updated_at"))
+        .values("status_id", "month")
+        .annotate(total=total)
+    ):
+        key = f"{row['status_id']}:{month_key(row['month'])}"
+        keys[("STATUS_MONTH", key)] += row["total"]
+
+    TaskStatistics.objects.bulk_create(
+        [
+            TaskStatistics(dimension=dimension, key=key, count=count)
+            for (dimension, key), count in keys.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasktrack", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskStatistics",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "dimension",
+                    models.CharField(
+                        choices=[
+                            ("STATUS", "Status"),
+                            ("PRIORITY", "Priority"),
+                            ("ASSIGNEE_STATUS", "Assignee status"),
+                            ("DUE_MONTH", "Due month"),
+                            ("STATUS_MONTH", "Status month"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("key", models.CharField(max_length=100)),
+                ("count", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "task statistic",
+                "verbose_name_plural": "task statistics",
+                "default_manager_name": "objects",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("dimension", "key"), name="unique_task_statistic"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_task_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.1.5 on 2026-10-18 12:30
+
+from typing import Any, Callable, List
+
+from django.conf import settings
+from django.db import migrations
+
+ASSIGNEE_NAME = (
+    "trim(coalesce({user}.first_name, '') || ' ' || coalesce({user}.middle_name, '') "
+    "|| ' ' || coalesce({user}.last_name, '') || ' ' || {user}.username "
+    "|| ' ' || coalesce({user}.email, ''))"
+)
+
+ASSIGNEE_OF_NEW_TASK = (
+    f"(SELECT {ASSIGNEE_NAME.format(user='u')} FROM accounts_customuser u "
+    "WHERE u.id = new.assigned_to_id)"
+)
+
+INDEX_NEW_TASK = (
+    "INSERT INTO tasktrack_task_search (rowid, title, description, assignee) "
+    "VALUES (new.id, new.title, coalesce(new.description, ''), "
+    f"{ASSIGNEE_OF_NEW_TASK});"
+)
+
+CREATE_SEARCH_INDEX = [
+    "CREATE VIRTUAL TABLE tasktrack_task_search USING fts5("
+    "title, description, assignee, tokenize = 'unicode61 remove_diacritics 2')",
+    "INSERT INTO tasktrack_task_search (rowid, title, description, assignee) "
+    "SELECT t.id, t.title, coalesce(t.description, ''), "
+    f"{ASSIGNEE_NAME.format(user='u')} "
+    "FROM tasktrack_task t JOIN accounts_customuser u ON u.id = t.assigned_to_id",
+    "CREATE TRIGGER tasktrack_task_search_insert AFTER INSERT ON tasktrack_task "
+    f"BEGIN {INDEX_NEW_TASK} END",
+    "CREATE TRIGGER tasktrack_task_search_delete AFTER DELETE ON tasktrack_task "
+    "BEGIN DELETE FROM tasktrack_task_search WHERE rowid = old.id; END",
+    "CREATE TRIGGER tasktrack_task_search_update "
+    "AFTER UPDATE OF title, description, assigned_to_id ON tasktrack_task "
+    "BEGIN DELETE FROM tasktrack_task_search WHERE rowid = old.id; "
+    f"{INDEX_NEW_TASK} END",
+    "CREATE TRIGGER tasktrack_task_search_assignee "
+    "AFTER UPDATE OF first_name, middle_name, last_name, username, email "
+    "ON accounts_customuser "
+    "BEGIN UPDATE tasktrack_task_search "
+    f"SET assignee = {ASSIGNEE_NAME.format(user='new')} "
+    "WHERE rowid IN (SELECT id FROM tasktrack_task WHERE assigned_to_id = new.id); "
+    "END",
+]
+
+DROP_SEARCH_INDEX = [
+    "DROP TRIGGER IF EXISTS tasktrack_task_search_assignee",
+    "DROP TRIGGER IF EXISTS tasktrack_task_search_update",
+    "DROP TRIGGER IF EXISTS tasktrack_task_search_delete",
+    "DROP TRIGGER IF EXISTS tasktrack_task_search_insert",
+    "DROP TABLE IF EXISTS tasktrack_task_search",
+]
+
+
+def run_statements(statements: List[str]) -> Callable[[Any, Any], None]:
+    """Return a migration function that runs the statements on SQLite only."""
+
+    def run(apps: Any, schema_editor: Any) -> None:
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        for statement in statements:
+            schema_editor.execute(statement, params=None)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasktrack", "0003_task_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_statements(CREATE_SEARCH_INDEX), run_statements(DROP_SEARCH_INDEX)
+        ),
+    ]
@@ -1,14 +1,48 @@
 """Database models for the tasktrack application."""
 
-from typing import Any, Optional
-
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from webapp.accounts.models import CustomUser
-from webapp.tasktrack.enums import PriorityLevel, StatusType
-from webapp.tasktrack.managers import PriorityManager, StatusManager, TaskManager
+from webapp.tasktrack.enums import PriorityLevel, StatisticDimension, StatusType
+from webapp.tasktrack.managers import (
+    MONTHS,
+    PriorityManager,
+    StatusManager,
+    TaskArchiveManager,
+    TaskManager,
+    TaskStatisticsManager,
+    home_counts_cache_key,
+    invalidate_home_counts,
+    priority_count_name,
+    status_count_name,
+)
+
+PRIORITY_LEVEL_COLOURS = {
+    PriorityLevel.LOW: "warning",
+    PriorityLevel.MEDIUM: "info",
+    PriorityLevel.HIGH: "success",
+    PriorityLevel.CRITICAL: "danger",
+}
+
+STATUS_COLOURS = {
+    StatusType.PENDING: "warning",
+    StatusType.IN_PROGRESS: "info",
+    StatusType.COMPLETED: "success",
+    StatusType.CANCELLED: "danger",
+}
+
+# A statistic dimension, the names its keys are counted under, and every name.
+Buckets = Tuple[str, Dict[str, str], List[str]]
 
 
 class Priority(models.Model):
@@ -31,12 +65,7 @@ class Priority(models.Model):
     def priority_level_colour(self) -> Optional[str]:
         """Set priority level color."""
 
-        return {
-            "LOW": "warning",
-            "MEDIUM": "info",
-            "HIGH": "success",
-            "CRITICAL": "danger",
-        }.get(self.name)
+        return PRIORITY_LEVEL_COLOURS.get(self.name)
 
     def clean(self) -> Any:
         """Ensure name is unique."""
@@ -76,12 +105,7 @@ class Status(models.Model):
     def status_colour(self) -> Optional[str]:
         """Set status color."""
 
-        return {
-            "PENDING": "warning",
-            "IN_PROGRESS": "info",
-            "COMPLETED": "success",
-            "CANCELLED": "danger",
-        }.get(self.name)
+        return STATUS_COLOURS.get(self.name)
 
     def __str__(self) -> str:
         """Return the name."""
@@ -101,6 +125,30 @@ class Status(models.Model):
         super().save(*args, **kwargs)
 
 
+# Set while the caller of a task delete adjusts the statistics itself.
+UNCOUNTED_DELETES: ContextVar[bool] = ContextVar("uncounted_deletes", default=False)
+
+
+@contextmanager
+def uncounted_deletes() -> Iterator[None]:
+    """Delete tasks in the block without removing them from the statistics."""
+
+    token = UNCOUNTED_DELETES.set(True)
+    try:
+        yield
+    finally:
+        UNCOUNTED_DELETES.reset(token)
+
+
+STATISTIC_FIELDS = (
+    "status_id",
+    "priority_id",
+    "assigned_to_id",
+    "due_date",
+    "updated_at",
+)
+
+
 class Task(models.Model):
     """Status model."""
 
@@ -131,6 +179,18 @@ class Task(models.Model):
         verbose_name = "task"
         verbose_name_plural = "tasks"
         default_manager_name = "objects"
+        indexes = [
+            models.Index(
+                fields=["assigned_to", "status"], name="task_assignee_status_idx"
+            ),
+            models.Index(
+                fields=["status", "updated_at"], name="task_status_updated_idx"
+            ),
+            models.Index(fields=["due_date"], name="task_due_date_idx"),
+            models.Index(fields=["title"], name="task_title_idx"),
+            models.Index(fields=["created_at"], name="task_created_at_idx"),
+            models.Index(fields=["updated_at"], name="task_updated_at_idx"),
+        ]
 
     def __str__(self) -> str:
         """Return the name."""
@@ -145,8 +205,463 @@ class Task(models.Model):
                 {"due_date": "Due date cannot be earlier than the creation date."}
             )
 
+    def clean_fields(self, exclude: Any = None) -> None:
+        """Validate the fields, without looking up the related rows already loaded.
+
+        Forms and services set the priority, status and users as objects read
+        from the database, so checking that they exist again is redundant.
+        """
+
+        exclude = set(exclude or ())
+        for field in self._meta.concrete_fields:
+            if not field.is_relation or not field.is_cached(self):
+                continue
+            related = field.get_cached_value(self)
+            if (
+                related is not None
+                and not related._state.adding
+                and related.pk == getattr(self, field.attname)
+            ):
+                exclude.add(field.name)
+        super().clean_fields(exclude=exclude)
+
+    def statistic_keys(self) -> Counter:
+        """Return the task statistic buckets this task is counted in."""
+
+        return TaskStatistics.keys_for(
+            **{field: getattr(self, field) for field in STATISTIC_FIELDS}
+        )
+
+    def stored_statistic_keys(self) -> Counter:
+        """Return the task statistic buckets of the row stored in the database.
+
+        The row is locked until the transaction ends, so call this inside the
+        transaction that changes it.
+        """
+
+        if self._state.adding:
+            return Counter()
+
+        values = (
+            Task.objects.select_for_update()
+            .filter(pk=self.pk)
+            .values(*STATISTIC_FIELDS)
+            .first()
+        )
+        return TaskStatistics.keys_for(**values) if values else Counter()
+
     def save(self, *args: Any, **kwargs: Any) -> None:
-        """Save method."""
+        """Save method.
+
+        When update_fields is given, only those fields are validated, and the
+        statistics are left alone unless one of their fields is saved.
+        """
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.full_clean()
+        else:
+            self.full_clean(
+                exclude=[
+                    field.name
+                    for field in self._meta.fields
+                    if field.name not in update_fields
+                    and field.attname not in update_fields
+                ]
+            )
 
-        self.full_clean()
-        super().save(*args, **kwargs)
+        counted = update_fields is None or any(
+            self._meta.get_field(field).attname in STATISTIC_FIELDS
+            for field in update_fields
+        )
+        if not counted:
+            super().save(*args, **kwargs)
+            return
+
+        with transaction.atomic():
+            previous_keys = self.stored_statistic_keys()
+            super().save(*args, **kwargs)
+
+            deltas = self.statistic_keys()
+            deltas.subtract(previous_keys)
+            TaskStatistics.objects.all().apply_deltas(deltas)
+
+
+class TaskArchive(models.Model):
+    """Completed or cancelled task moved out of the task table.
+
+    Archived tasks keep their id, and the task statistics keep counting them
+    in the priority and monthly buckets.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=250)
+    due_date = models.DateField(null=True, blank=True)
+    description = models.TextField(null=True, blank=True)
+    priority = models.ForeignKey(Priority, related_name="+", on_delete=models.CASCADE)
+    status = models.ForeignKey(Status, related_name="+", on_delete=models.CASCADE)
+    assigned_to = models.ForeignKey(
+        CustomUser, related_name="+", on_delete=models.CASCADE
+    )
+    created_by = models.ForeignKey(
+        CustomUser, related_name="+", on_delete=models.CASCADE
+    )
+    updated_by = models.ForeignKey(
+        CustomUser, related_name="+", on_delete=models.CASCADE
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    objects = TaskArchiveManager()
+
+    class Meta:
+        verbose_name = "archived task"
+        verbose_name_plural = "archived tasks"
+
+    def __str__(self) -> str:
+        """Return the name."""
+
+        return self.title
+
+    def statistic_keys(self) -> Counter:
+        """Return the task statistic buckets this archived task is counted in."""
+
+        keys = TaskStatistics.keys_for(
+            **{field: getattr(self, field) for field in STATISTIC_FIELDS}
+        )
+        del keys[(StatisticDimension.STATUS, f"{self.status_id}")]
+        del keys[
+            (
+                StatisticDimension.ASSIGNEE_STATUS,
+                f"{self.assigned_to_id}:{self.status_id}",
+            )
+        ]
+        keys[(StatisticDimension.ARCHIVED_STATUS, f"{self.status_id}")] += 1
+        return keys
+
+
+class TaskStatistics(models.Model):
+    """Task counts rolled up per bucket and maintained on every task write."""
+
+    dimension = models.CharField(choices=StatisticDimension.choices, max_length=50)
+    key = models.CharField(max_length=100)
+    count = models.BigIntegerField(default=0)
+
+    objects = TaskStatisticsManager()
+
+    class Meta:
+        verbose_name = "task statistic"
+        verbose_name_plural = "task statistics"
+        default_manager_name = "objects"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dimension", "key"], name="unique_task_statistic"
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Return the dimension and key."""
+
+        return f"{self.dimension}:{self.key}"
+
+    @staticmethod
+    def month_key(value: Any) -> str:
+        """Return the year and month bucket of a date or datetime."""
+
+        if isinstance(value, datetime) and timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return value.strftime("%Y-%m")
+
+    @classmethod
+    def keys_for(
+        cls,
+        *,
+        status_id: int,
+        priority_id: int,
+        assigned_to_id: int,
+        due_date: Optional[date],
+        updated_at: datetime,
+    ) -> Counter:
+        """Return the statistic buckets a task with the given values is counted in."""
+
+        keys = Counter(
+            {
+                (StatisticDimension.STATUS, f"{status_id}"): 1,
+                (StatisticDimension.PRIORITY, f"{priority_id}"): 1,
+                (
+                    StatisticDimension.ASSIGNEE_STATUS,
+                    f"{assigned_to_id}:{status_id}",
+                ): 1,
+                (
+                    StatisticDimension.STATUS_MONTH,
+                    f"{status_id}:{cls.month_key(updated_at)}",
+                ): 1,
+            }
+        )
+        if due_date:
+            keys[(StatisticDimension.DUE_MONTH, cls.month_key(due_date))] += 1
+        return keys
+
+    @classmethod
+    def count_keys(cls, tasks: Any, archive: Any = None) -> Counter:
+        """Count the buckets of the tasks, and archived tasks, in grouped reads."""
+
+        keys: Counter = Counter()
+
+        for (status_id,), total in tasks.counts_by("status_id").items():
+            keys[(StatisticDimension.STATUS, f"{status_id}")] += total
+
+        for (assigned_to_id, status_id), total in tasks.counts_by(
+            "assigned_to_id", "status_id"
+        ).items():
+            key = f"{assigned_to_id}:{status_id}"
+            keys[(StatisticDimension.ASSIGNEE_STATUS, key)] += total
+
+        if archive is not None:
+            for (status_id,), total in archive.counts_by("status_id").items():
+                keys[(StatisticDimension.ARCHIVED_STATUS, f"{status_id}")] += total
+
+        for rows in (tasks,) if archive is None else (tasks, archive):
+            for (priority_id,), total in rows.counts_by("priority_id").items():
+                keys[(StatisticDimension.PRIORITY, f"{priority_id}")] += total
+
+            for (month,), total in rows.counts_by_month("due_date").items():
+                keys[(StatisticDimension.DUE_MONTH, cls.month_key(month))] += total
+
+            for (status_id, month), total in rows.counts_by_month(
+                "updated_at", "status_id"
+            ).items():
+                key = f"{status_id}:{cls.month_key(month)}"
+                keys[(StatisticDimension.STATUS_MONTH, key)] += total
+
+        return keys
+
+    @classmethod
+    def rebuild(cls) -> int:
+        """Recompute every bucket from the task and archive tables.
+
+        Returns the bucket count.
+        """
+
+        keys = cls.count_keys(Task.objects.all(), TaskArchive.objects.all())
+
+        with transaction.atomic():
+            assignee_keys = set(
+                cls.objects.filter(
+                    dimension=StatisticDimension.ASSIGNEE_STATUS
+                ).values_list("key", flat=True)
+            )
+            assignee_keys.update(
+                key
+                for dimension, key in keys
+                if dimension == StatisticDimension.ASSIGNEE_STATUS
+            )
+
+            cls.objects.all().delete()
+            cls.objects.bulk_create(
+                [
+                    cls(dimension=dimension, key=key, count=count)
+                    for (dimension, key), count in keys.items()
+                ],
+                batch_size=1000,
+            )
+            invalidate_home_counts(key.split(":")[0] for key in assignee_keys)
+
+        return len(keys)
+
+    @classmethod
+    def status_counts(cls, *, assigned_to: Any = None) -> Dict[str, int]:
+        """Return the number of tasks per status, optionally for one assignee.
+
+        The counts of an assignee are cached until one of their tasks changes.
+        """
+
+        if assigned_to is not None:
+            cache_key = home_counts_cache_key(assigned_to.pk)
+            counts = cache.get(cache_key)
+            if counts is None:
+                counts = cls._status_counts(assigned_to=assigned_to)
+                cache.set(cache_key, counts, settings.TASK_HOME_COUNTS_CACHE_TIMEOUT)
+            return counts
+
+        return cls._status_counts()
+
+    @classmethod
+    async def astatus_counts(cls, *, assigned_to: Any = None) -> Dict[str, int]:
+        """Return the number of tasks per status, optionally for one assignee."""
+
+        statuses = await Status.objects.acached_all()
+        if assigned_to is None:
+            return await cls._aread(cls._status_buckets(statuses))
+
+        cache_key = home_counts_cache_key(assigned_to.pk)
+        counts = await cache.aget(cache_key)
+        if counts is None:
+            counts = await cls._aread(
+                cls._status_buckets(statuses, assigned_to=assigned_to)
+            )
+            await cache.aset(cache_key, counts, settings.TASK_HOME_COUNTS_CACHE_TIMEOUT)
+        return counts
+
+    @classmethod
+    def _status_counts(cls, *, assigned_to: Any = None) -> Dict[str, int]:
+        """Read the number of tasks per status from the stored buckets."""
+
+        return cls._read(
+            cls._status_buckets(Status.objects.cached_all(), assigned_to=assigned_to)
+        )
+
+    @classmethod
+    def priority_counts(cls) -> Dict[str, int]:
+        """Return the number of tasks per priority level."""
+
+        return cls._read(cls._priority_buckets(Priority.objects.cached_all()))
+
+    @classmethod
+    def due_counts_by_month(cls, *, year: int) -> Dict[str, int]:
+        """Return the number of tasks due in each month of the year."""
+
+        return cls._read(cls._due_month_buckets(year=year))
+
+    @classmethod
+    def completed_counts_by_month(cls, *, year: int) -> Dict[str, int]:
+        """Return the number of tasks completed in each month of the year."""
+
+        return cls._read(
+            cls._completed_month_buckets(
+                Status.objects.cached(StatusType.COMPLETED), year=year
+            )
+        )
+
+    @classmethod
+    def dashboard_counts(cls, *, year: int) -> Dict[str, Dict[str, int]]:
+        """Return every dashboard bucket in the shape used by the templates.
+
+        The status counters include the archived tasks.
+        """
+
+        statuses = Status.objects.cached_all()
+        status = cls._read(cls._status_buckets(statuses))
+        archived = cls._read(cls._status_buckets(statuses, archived=True))
+        return {
+            "task_counts": {
+                **cls._add_counts(status, archived),
+                **cls.priority_counts(),
+            },
+            "due_tasks_count_by_month": cls.due_counts_by_month(year=year),
+            "completed_tasks_count_by_month": cls.completed_counts_by_month(year=year),
+        }
+
+    @classmethod
+    async def adashboard_counts(cls, *, year: int) -> Dict[str, Dict[str, int]]:
+        """Return every dashboard bucket in the shape used by the templates.
+
+        The async ORM runs the queries of a request one after another in the
+        request's database thread, so the buckets are read in turn.
+        """
+
+        statuses = await Status.objects.acached_all()
+        priorities = await Priority.objects.acached_all()
+        completed_status = await Status.objects.acached(StatusType.COMPLETED)
+        status = await cls._aread(cls._status_buckets(statuses))
+        archived = await cls._aread(cls._status_buckets(statuses, archived=True))
+        priority = await cls._aread(cls._priority_buckets(priorities))
+        due = await cls._aread(cls._due_month_buckets(year=year))
+        completed = await cls._aread(
+            cls._completed_month_buckets(completed_status, year=year)
+        )
+        return {
+            "task_counts": {**cls._add_counts(status, archived), **priority},
+            "due_tasks_count_by_month": due,
+            "completed_tasks_count_by_month": completed,
+        }
+
+    @staticmethod
+    def _status_buckets(
+        statuses: List[Any], *, assigned_to: Any = None, archived: bool = False
+    ) -> Buckets:
+        """Return the buckets counting the tasks, or archived tasks, per status."""
+
+        if assigned_to is None:
+            dimension = (
+                StatisticDimension.ARCHIVED_STATUS
+                if archived
+                else StatisticDimension.STATUS
+            )
+            keys = {
+                f"{status.pk}": status_count_name(status.name) for status in statuses
+            }
+        else:
+            dimension = StatisticDimension.ASSIGNEE_STATUS
+            keys = {
+                f"{assigned_to.pk}:{status.pk}": status_count_name(status.name)
+                for status in statuses
+            }
+        names = [status_count_name(status) for status in StatusType.values]
+        return dimension, keys, names
+
+    @staticmethod
+    def _priority_buckets(priorities: List[Any]) -> Buckets:
+        """Return the buckets counting the tasks per priority level."""
+
+        keys = {
+            f"{priority.pk}": priority_count_name(priority.name)
+            for priority in priorities
+        }
+        names = [priority_count_name(priority) for priority in PriorityLevel.values]
+        return StatisticDimension.PRIORITY, keys, names
+
+    @staticmethod
+    def _due_month_buckets(*, year: int) -> Buckets:
+        """Return the buckets counting the tasks due in each month of the year."""
+
+        keys = {
+            f"{year}-{number:02d}": f"{month}_due_tasks"
+            for number, month in enumerate(MONTHS, start=1)
+        }
+        return StatisticDimension.DUE_MONTH, keys, list(keys.values())
+
+    @staticmethod
+    def _completed_month_buckets(completed: Any, *, year: int) -> Buckets:
+        """Return the buckets counting the tasks completed in each month."""
+
+        keys = {
+            f"{completed.pk}:{year}-{number:02d}": f"{month}_completed_tasks"
+            for number, month in enumerate(MONTHS, start=1)
+            if completed is not None
+        }
+        names = [f"{month}_completed_tasks" for month in MONTHS]
+        return StatisticDimension.STATUS_MONTH, keys, names
+
+    @classmethod
+    def _read(cls, buckets: Buckets) -> Dict[str, int]:
+        """Sum the stored counts of the buckets under their names."""
+
+        dimension, keys, names = buckets
+        stored = cls.objects.all().counts(dimension=dimension, keys=keys)
+        return cls._sum_by_name(buckets, stored)
+
+    @classmethod
+    async def _aread(cls, buckets: Buckets) -> Dict[str, int]:
+        """Sum the stored counts of the buckets under their names."""
+
+        dimension, keys, names = buckets
+        stored = await cls.objects.all().acounts(dimension=dimension, keys=keys)
+        return cls._sum_by_name(buckets, stored)
+
+    @staticmethod
+    def _add_counts(counts: Dict[str, int], more: Dict[str, int]) -> Dict[str, int]:
+        """Add two sets of counts with the same names."""
+
+        return {name: count + more[name] for name, count in counts.items()}
+
+    @staticmethod
+    def _sum_by_name(buckets: Buckets, stored: Dict[str, int]) -> Dict[str, int]:
+        """Add the stored counts to the names their bucket keys map to."""
+
+        _, keys, names = buckets
+        counts = {name: 0 for name in names}
+        for key, count in stored.items():
+            counts[keys[key]] += count
+        return counts
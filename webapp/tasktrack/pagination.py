@@ -0,0 +1,111 @@
+"""Keyset pagination for the task listing pages."""
+
+from typing import Any, Iterator, List, Optional
+
+from django.conf import settings
+from django.http import HttpRequest
+
+
+class KeysetPage:
+    """A page of tasks ordered by descending primary key."""
+
+    def __init__(
+        self,
+        object_list: List[Any],
+        *,
+        page_size: int,
+        has_next: bool,
+        has_previous: bool,
+    ) -> None:
+        """Store the page rows and whether neighbouring pages exist."""
+
+        self.object_list = object_list
+        self.page_size = page_size
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the page rows."""
+
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        """Return the number of rows on the page."""
+
+        return len(self.object_list)
+
+    @property
+    def next_cursor(self) -> Optional[int]:
+        """Return the cursor of the following page, if there is one."""
+
+        if self.has_next and self.object_list:
+            return self.object_list[-1].pk
+        return None
+
+    @property
+    def previous_cursor(self) -> Optional[int]:
+        """Return the cursor of the preceding page, if there is one."""
+
+        if self.has_previous and self.object_list:
+            return self.object_list[0].pk
+        return None
+
+
+def paginate_by_keyset(
+    queryset: Any,
+    *,
+    page_size: int,
+    after: Optional[int] = None,
+    before: Optional[int] = None,
+) -> KeysetPage:
+    """Return one page of the queryset ordered by descending primary key.
+
+    Rows are located with a primary key range instead of an OFFSET, so the cost
+    of a page does not depend on how deep into the listing it is.
+    """
+
+    if before is not None:
+        rows = list(queryset.filter(pk__gt=before).order_by("pk")[: page_size + 1])
+        has_previous = len(rows) > page_size
+        rows = rows[:page_size][::-1]
+        has_next = queryset.filter(pk__lte=before).exists()
+    else:
+        if after is not None:
+            queryset_page = queryset.filter(pk__lt=after)
+            has_previous = queryset.filter(pk__gte=after).exists()
+        else:
+            queryset_page = queryset
+            has_previous = False
+        rows = list(queryset_page.order_by("-pk")[: page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+
+    return KeysetPage(
+        rows, page_size=page_size, has_next=has_next, has_previous=has_previous
+    )
+
+
+def _parse_positive_int(value: Optional[str]) -> Optional[int]:
+    """Convert a query string value to a positive integer, ignoring bad input."""
+
+    try:
+        number = int(value)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def paginate_tasks(request: HttpRequest, queryset: Any) -> KeysetPage:
+    """Paginate the queryset using the after, before and page_size parameters."""
+
+    page_size = _parse_positive_int(request.GET.get("page_size"))
+    page_size = min(
+        page_size or settings.TASK_LIST_PAGE_SIZE, settings.TASK_LIST_MAX_PAGE_SIZE
+    )
+
+    return paginate_by_keyset(
+        queryset,
+        page_size=page_size,
+        after=_parse_positive_int(request.GET.get("after")),
+        before=_parse_positive_int(request.GET.get("before")),
+    )
@@ -3,6 +3,7 @@
 from functools import wraps
 from typing import Any
 
+from asgiref.sync import iscoroutinefunction
 from django.http import HttpRequest
 from django.shortcuts import redirect
 from django.urls import reverse
@@ -11,6 +12,18 @@ from django.urls import reverse
 def limit_access(view_func: Any) -> Any:
     """Restrict access to a view to superusers only."""
 
+    if iscoroutinefunction(view_func):
+
+        @wraps(view_func)
+        async def async_wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+            user = await request.auser()
+            if not user.is_superuser:
+                return redirect(reverse("home"))
+
+            return await view_func(request, *args, **kwargs)
+
+        return async_wrapper
+
     @wraps(view_func)
     def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
         if not request.user.is_superuser:
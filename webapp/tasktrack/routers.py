@@ -0,0 +1,142 @@
+"""Database routing between the primary database and its read replicas.
+
+Every query goes to the primary database unless it runs inside a view
+decorated with use_replica, which sends its reads to one of the aliases in
+the DATABASE_REPLICAS setting. Requests from a client that wrote recently are
+pinned to the primary by ReplicaStickinessMiddleware, so users always read
+their own writes.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+READ_REPLICA: ContextVar[Optional[str]] = ContextVar("read_replica", default=None)
+PINNED_TO_PRIMARY: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+
+
+def choose_replica() -> Optional[str]:
+    """Return a replica alias to read from, or None to stay on the primary."""
+
+    if PINNED_TO_PRIMARY.get() or not settings.DATABASE_REPLICAS:
+        return None
+    return random.choice(settings.DATABASE_REPLICAS)
+
+
+@contextmanager
+def reading_from(alias: Optional[str]) -> Iterator[None]:
+    """Send the reads of the block to the given replica."""
+
+    token = READ_REPLICA.set(alias)
+    try:
+        yield
+    finally:
+        READ_REPLICA.reset(token)
+
+
+@contextmanager
+def pinned_to_primary(pinned: bool = True) -> Iterator[None]:
+    """Keep the reads of the block on the primary."""
+
+    token = PINNED_TO_PRIMARY.set(pinned)
+    try:
+        yield
+    finally:
+        PINNED_TO_PRIMARY.reset(token)
+
+
+def _replica_stream(content: Iterator[Any], alias: Optional[str]) -> Iterator[Any]:
+    """Read the rows of a streamed response from the replica."""
+
+    with reading_from(alias):
+        yield from content
+
+
+async def _areplica_stream(
+    content: AsyncIterator[Any], alias: Optional[str]
+) -> AsyncIterator[Any]:
+    """Read the rows of a streamed async response from the replica."""
+
+    with reading_from(alias):
+        async for chunk in content:
+            yield chunk
+
+
+def _route_stream(response: Any, alias: Optional[str]) -> Any:
+    """Keep reading from the replica while the response is streamed."""
+
+    if alias and getattr(response, "streaming", False):
+        if response.is_async:
+            response.streaming_content = _areplica_stream(
+                response.streaming_content, alias
+            )
+        else:
+            response.streaming_content = _replica_stream(
+                response.streaming_content, alias
+            )
+    return response
+
+
+def use_replica(view_func: Callable) -> Callable:
+    """Send the reads of a read-only view to one of the replicas.
+
+    Template responses of sync views are rendered inside the view, so the
+    queries run by their templates read from the replica too.
+    """
+
+    if iscoroutinefunction(view_func):
+
+        @wraps(view_func)
+        async def _async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            alias = choose_replica()
+            with reading_from(alias):
+                response = await view_func(*args, **kwargs)
+            return _route_stream(response, alias)
+
+        return _async_wrapper
+
+    @wraps(view_func)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        alias = choose_replica()
+        with reading_from(alias):
+            response = view_func(*args, **kwargs)
+            # A TemplateResponse is otherwise rendered after the view returns,
+            # and the queries of its template would go to the primary.
+            if hasattr(response, "render"):
+                response.render()
+        return _route_stream(response, alias)
+
+    return _wrapper
+
+
+class PrimaryReplicaRouter:
+    """Route writes to the primary and the reads of replica views to a replica."""
+
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        """Return the replica of a use_replica view, otherwise the primary."""
+
+        return READ_REPLICA.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: Any, **hints: Any) -> Optional[str]:
+        """Write to the primary, including objects read from a replica."""
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        """Relate objects read from the primary and from its replicas."""
+
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> Optional[bool]:
+        """Migrate the primary only; replicas are copies of it."""
+
+        return db not in settings.DATABASE_REPLICAS
@@ -0,0 +1,101 @@
+"""Synthetic task data for load testing.
+
+This module only depends on the enums so the generator can run in worker
+processes that have not set up Django.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from webapp.tasktrack.enums import PriorityLevel, StatusType
+
+FIRST_NAMES = (
+    "Ada Alan Amara Ben Carmen Chen Dara Elif Femi Grace Hana Ivan Jonas Kofi "
+    "Lena Luis Maya Mohammed Nia Omar Priya Rosa Sam Tariq Una Vera Yusuf Zoe"
+).split()
+LAST_NAMES = (
+    "Adeyemi Bauer Castro Dubois Eriksen Fischer Garcia Haddad Ito Jensen Khan "
+    "Kowalski Lopez Mensah Novak Okafor Patel Rossi Sato Silva Tanaka Weber"
+).split()
+VERBS = (
+    "Review Prepare Update Fix Draft Schedule Migrate Audit Plan Test Deploy "
+    "Document Refactor Renew Archive Publish"
+).split()
+SUBJECTS = (
+    "invoice report budget release contract backup roadmap onboarding payroll "
+    "newsletter inventory shipment warranty training forecast dashboard "
+    "database checklist proposal"
+).split()
+
+STATUS_WEIGHTS = {
+    StatusType.PENDING: 25,
+    StatusType.IN_PROGRESS: 20,
+    StatusType.COMPLETED: 45,
+    StatusType.CANCELLED: 10,
+}
+PRIORITY_WEIGHTS = {
+    PriorityLevel.LOW: 30,
+    PriorityLevel.MEDIUM: 40,
+    PriorityLevel.HIGH: 20,
+    PriorityLevel.CRITICAL: 10,
+}
+
+TaskRow = Tuple[str, Optional[date], str, int, int, int, datetime, datetime]
+
+
+def generate_tasks(
+    *,
+    seed: int,
+    count: int,
+    user_ids: Sequence[int],
+    status_ids: Dict[str, int],
+    priority_ids: Dict[str, int],
+    now: datetime,
+) -> List[TaskRow]:
+    """Return count task rows with skewed assignees, due dates and statuses.
+
+    A tenth of the assignees own nearly half of the tasks, most due dates fall
+    within a few weeks of creation, and the status mix follows STATUS_WEIGHTS.
+    """
+
+    generator = random.Random(seed)
+    statuses = [status_ids[name] for name in STATUS_WEIGHTS]
+    status_weights = list(STATUS_WEIGHTS.values())
+    priorities = [priority_ids[name] for name in PRIORITY_WEIGHTS]
+    priority_weights = list(PRIORITY_WEIGHTS.values())
+
+    rows = []
+    for _ in range(count):
+        created_at = now - timedelta(seconds=generator.randint(0, 365 * 86400))
+        updated_at = min(
+            created_at + timedelta(seconds=int(generator.expovariate(1 / 86400))),
+            now,
+        )
+        due_date = None
+        if generator.random() > 0.15:
+            days = int(generator.expovariate(1 / 14))
+            due_date = created_at.date() + timedelta(days=days)
+
+        subject = generator.choice(SUBJECTS)
+        assignee = int(len(user_ids) * generator.random() ** 3)
+        rows.append(
+            (
+                f"{generator.choice(VERBS)} {subject}",
+                due_date,
+                f"{generator.choice(VERBS)} the {subject} "
+                f"for {generator.choice(SUBJECTS)}.",
+                generator.choices(priorities, weights=priority_weights)[0],
+                generator.choices(statuses, weights=status_weights)[0],
+                user_ids[assignee],
+                created_at,
+                updated_at,
+            )
+        )
+    return rows
+
+
+def generate_chunk(arguments: Dict[str, Any]) -> List[TaskRow]:
+    """Generate one chunk of task rows from a dict of generate_tasks arguments."""
+
+    return generate_tasks(**arguments)
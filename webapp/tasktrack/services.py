@@ -1,11 +1,27 @@
 """Service layer for the tasktrack application."""
 
-from typing import Any
+import datetime
+from collections import Counter
+from typing import Any, Dict, List, Optional
 
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
 from django.utils import timezone
+from django.utils.dateparse import parse_date
 
-from webapp.tasktrack.enums import StatusType
-from webapp.tasktrack.models import Status, Task
+from webapp.accounts.models import CustomUser
+from webapp.tasktrack.enums import StatisticDimension, StatusType
+from webapp.tasktrack.models import (
+    Priority,
+    Status,
+    Task,
+    TaskArchive,
+    TaskStatistics,
+    uncounted_deletes,
+)
 
 
 def create_task(
@@ -15,11 +31,11 @@ def create_task(
     due_date: Any,
     description: str,
     priority: Any,
-    assigned_to: Any
+    assigned_to: Any,
 ) -> None:
     """Create new task."""
 
-    status = Status.objects.filter(name=StatusType.PENDING).first()
+    status = Status.objects.cached(StatusType.PENDING)
 
     task = Task(
         title=title,
@@ -34,11 +50,273 @@ def create_task(
     task.save()
 
 
-def update_task(*, user: Any, pk: int) -> None:
-    """Update task."""
+def update_task(*, user: Any, task: Task, changes: Dict[str, Any]) -> bool:
+    """Store the changed fields of a task with a single save.
 
-    task = Task.objects.get(pk=pk)
+    Nothing is written when there are no changes. Returns whether the task was
+    saved.
+    """
 
+    if not changes:
+        return False
+
+    for field, value in changes.items():
+        setattr(task, field, value)
     task.updated_by = user
     task.updated_at = timezone.now()
-    task.save()
+    task.save(update_fields=[*changes, "updated_by", "updated_at"])
+
+    return True
+
+
+def _user_id(value: Any) -> Optional[int]:
+    """Return the user id of a bulk payload value, rejecting booleans."""
+
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _parse_due_date(value: Any) -> Optional[datetime.date]:
+    """Convert a due date value from a bulk payload to a date."""
+
+    if value in (None, ""):
+        return None
+    if isinstance(value, datetime.date):
+        return value
+    try:
+        parsed = parse_date(str(value))
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValueError("Enter a valid date.")
+    return parsed
+
+
+def bulk_create_tasks(
+    *,
+    user: Any,
+    tasks: List[Dict[str, Any]],
+    chunk_size: Optional[int] = None,
+) -> List[Task]:
+    """Validate and create many pending tasks at once.
+
+    Each task is a mapping with a title, an optional due date and description,
+    a priority level name and the id of the assigned user. Every row is
+    validated before anything is written; errors are raised as a single
+    ValidationError keyed by "<row index>.<field>".
+    """
+
+    chunk_size = chunk_size or settings.TASK_BULK_CREATE_CHUNK_SIZE
+    title_max_length = Task._meta.get_field("title").max_length
+    today = timezone.localdate()
+    now = timezone.now()
+
+    assignee_ids = [
+        row.get("assigned_to")
+        for row in tasks
+        if isinstance(row, dict) and _user_id(row.get("assigned_to")) is not None
+    ]
+    assignees = CustomUser.objects.filter(is_active=True).in_bulk(assignee_ids)
+
+    status = Status.objects.cached(StatusType.PENDING)
+    if status is None:
+        status, _ = Status.objects.get_or_create(name=StatusType.PENDING)
+
+    errors: Dict[str, List[str]] = {}
+    instances = []
+
+    for index, row in enumerate(tasks):
+        if not isinstance(row, dict):
+            errors[f"{index}"] = ["Each task must be an object."]
+            continue
+
+        error_count = len(errors)
+
+        title = row.get("title")
+        if isinstance(title, str):
+            title = title.strip()
+        if not title or not isinstance(title, str):
+            errors[f"{index}.title"] = ["This field is required."]
+        elif len(title) > title_max_length:
+            errors[f"{index}.title"] = [
+                f"Ensure this value has at most {title_max_length} characters."
+            ]
+
+        description = row.get("description")
+        if description is not None and not isinstance(description, str):
+            errors[f"{index}.description"] = ["Enter a valid description."]
+
+        try:
+            due_date = _parse_due_date(row.get("due_date"))
+        except ValueError as error:
+            errors[f"{index}.due_date"] = [str(error)]
+            due_date = None
+        if due_date and due_date < today:
+            errors[f"{index}.due_date"] = [
+                "Due date cannot be earlier than the creation date."
+            ]
+
+        priority_name = row.get("priority")
+        priority = (
+            Priority.objects.cached(priority_name)
+            if isinstance(priority_name, str)
+            else None
+        )
+        if priority is None:
+            errors[f"{index}.priority"] = ["Select a valid priority."]
+
+        assigned_to = assignees.get(_user_id(row.get("assigned_to")))
+        if assigned_to is None:
+            errors[f"{index}.assigned_to"] = ["Select a valid user."]
+
+        if len(errors) > error_count:
+            continue
+
+        instances.append(
+            Task(
+                title=title,
+                due_date=due_date,
+                description=description,
+                priority=priority,
+                status=status,
+                assigned_to=assigned_to,
+                created_by=user,
+                updated_by=user,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    if errors:
+        raise ValidationError(errors)
+
+    deltas: Counter = Counter()
+    for instance in instances:
+        deltas.update(instance.statistic_keys())
+
+    with transaction.atomic():
+        created = Task.objects.bulk_create(instances, batch_size=chunk_size)
+        TaskStatistics.objects.all().apply_deltas(deltas)
+
+    return created
+
+
+def bulk_update_tasks(
+    *,
+    user: Any,
+    tasks: Any,
+    status: Any = None,
+    priority: Any = None,
+    assigned_to: Any = None,
+) -> int:
+    """Change the status, priority or assignee of every task in the queryset.
+
+    The tasks are changed with a single UPDATE statement stamped with the
+    user and time. The statistics are adjusted from one grouped read of the
+    affected rows. Returns the number of updated tasks.
+    """
+
+    changes = {
+        field: value
+        for field, value in (
+            ("status", status),
+            ("priority", priority),
+            ("assigned_to", assigned_to),
+        )
+        if value is not None
+    }
+    if not changes:
+        return 0
+
+    now = timezone.now()
+    replacements = {f"{field}_id": value.pk for field, value in changes.items()}
+
+    with transaction.atomic():
+        groups = (
+            tasks.annotate(
+                due_month=TruncMonth("due_date"), updated_month=TruncMonth("updated_at")
+            )
+            .order_by()
+            .values(
+                "status_id",
+                "priority_id",
+                "assigned_to_id",
+                "due_month",
+                "updated_month",
+            )
+            .annotate(total=Count("pk"))
+        )
+
+        deltas: Counter = Counter()
+        for group in groups:
+            previous = {
+                "status_id": group["status_id"],
+                "priority_id": group["priority_id"],
+                "assigned_to_id": group["assigned_to_id"],
+                "due_date": group["due_month"],
+                "updated_at": group["updated_month"],
+            }
+            current = {**previous, **replacements, "updated_at": now}
+            for key, count in TaskStatistics.keys_for(**previous).items():
+                deltas[key] -= count * group["total"]
+            for key, count in TaskStatistics.keys_for(**current).items():
+                deltas[key] += count * group["total"]
+
+        updated = tasks.update(**changes, updated_by=user, updated_at=now)
+        TaskStatistics.objects.all().apply_deltas(deltas)
+
+    return updated
+
+
+def delete_tasks(*, tasks: Any) -> int:
+    """Delete the tasks in the queryset and remove them from the statistics.
+
+    The statistics are adjusted from grouped reads of the rows rather than
+    once per deleted task. Returns the number of deleted tasks.
+    """
+
+    with transaction.atomic():
+        deltas: Counter = Counter()
+        deltas.subtract(TaskStatistics.count_keys(tasks))
+        with uncounted_deletes():
+            deleted, _ = tasks.delete()
+        TaskStatistics.objects.all().apply_deltas(deltas)
+
+    return deleted
+
+
+def archive_tasks(*, tasks: Any) -> int:
+    """Move the tasks in the queryset into the task archive.
+
+    The rows are copied with their ids and deleted from the task table in one
+    transaction. Their statistics move from the status and assignee buckets
+    to the archived status buckets; the priority and monthly buckets keep
+    counting them. Returns the number of archived tasks.
+    """
+
+    fields = [field.attname for field in Task._meta.concrete_fields]
+    now = timezone.now()
+
+    with transaction.atomic():
+        rows = list(tasks.order_by().values(*fields))
+        if not rows:
+            return 0
+
+        TaskArchive.objects.bulk_create(
+            [TaskArchive(**row, archived_at=now) for row in rows]
+        )
+
+        deltas: Counter = Counter()
+        for row in rows:
+            status = f"{row['status_id']}"
+            assignee = f"{row['assigned_to_id']}:{status}"
+            deltas[(StatisticDimension.STATUS, status)] -= 1
+            deltas[(StatisticDimension.ASSIGNEE_STATUS, assignee)] -= 1
+            deltas[(StatisticDimension.ARCHIVED_STATUS, status)] += 1
+
+        with uncounted_deletes():
+            Task.objects.filter(pk__in=[row["id"] for row in rows]).delete()
+        TaskStatistics.objects.all().apply_deltas(deltas)
+
+    return len(rows)
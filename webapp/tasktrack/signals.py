@@ -0,0 +1,83 @@
+"""Signal receivers for the tasktrack application."""
+
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from webapp.tasktrack.models import (
+    UNCOUNTED_DELETES,
+    Priority,
+    Status,
+    Task,
+    TaskArchive,
+    TaskStatistics,
+)
+
+# The deltas of the rows each running delete has collected, keyed by the id
+# of the delete's origin, with the origin and the number of rows left to go.
+PENDING_DELETES: ContextVar[Optional[Dict[int, Tuple[Any, Counter, int]]]] = ContextVar(
+    "pending_task_deletes", default=None
+)
+
+
+@receiver([post_save, post_delete], sender=Priority)
+@receiver([post_save, post_delete], sender=Status)
+def clear_lookup_cache(sender: Any, **kwargs: Any) -> None:
+    """Drop the cached lookup rows when one of them changes."""
+
+    sender.objects.clear_cache()
+
+
+@receiver(pre_delete, sender=Task)
+@receiver(pre_delete, sender=TaskArchive)
+def collect_task_statistics(
+    sender: Any, instance: Any, origin: Any = None, **kwargs: Any
+) -> None:
+    """Collect the statistics of a task, or archived task, about to be deleted.
+
+    A task deleted on its own is read again, as the instance may be stale,
+    and removed from the statistics straight away. Deleting a queryset, or a
+    user, status or priority that cascades to tasks and archived tasks, sends
+    this signal for every row it has just read before removing any of them,
+    so their deltas are summed and applied once the last of them is gone.
+    """
+
+    if UNCOUNTED_DELETES.get():
+        return
+
+    if origin is instance and sender is Task:
+        deltas: Counter = Counter()
+        deltas.subtract(instance.stored_statistic_keys())
+        TaskStatistics.objects.all().apply_deltas(deltas)
+        return
+
+    pending = PENDING_DELETES.get()
+    if pending is None:
+        pending = {}
+        PENDING_DELETES.set(pending)
+
+    _, deltas, remaining = pending.get(id(origin), (origin, Counter(), 0))
+    deltas.subtract(instance.statistic_keys())
+    pending[id(origin)] = (origin, deltas, remaining + 1)
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=TaskArchive)
+def remove_task_statistics(
+    sender: Any, instance: Any, origin: Any = None, **kwargs: Any
+) -> None:
+    """Apply the collected statistics once every row of a delete is removed."""
+
+    pending = PENDING_DELETES.get()
+    if not pending or id(origin) not in pending:
+        return
+
+    _, deltas, remaining = pending.pop(id(origin))
+    if remaining > 1:
+        pending[id(origin)] = (origin, deltas, remaining - 1)
+        return
+
+    TaskStatistics.objects.all().apply_deltas(deltas)
@@ -5,25 +5,41 @@ from django.urls import path
 from webapp.tasktrack.views import (
     create_task,
     create_task_view,
+    dashboard_stats_api,
     dashboard_view,
     delete_calendar_task,
     delete_task_view,
+    home_counts_api,
     home_view,
+    my_task_table_api,
+    task_bulk_create_api,
+    task_bulk_update_view,
     task_calendar_api,
     task_details_view,
+    task_search_api,
+    task_table_api,
     task_update_view,
     task_view,
+    user_search_api,
 )
 
 urlpatterns = [
     path("", home_view, name="home"),
     path("dashboard", dashboard_view, name="dashboard"),
     path("tasks-list/", task_view, name="tasks"),
+    path("tasks-bulk-update/", task_bulk_update_view, name="tasks_bulk_update"),
     path("create-task/", create_task_view, name="create_task"),
     path("task-details/ <int:pk>/", task_details_view, name="task_details"),
     path("task-update/ <int:pk>/", task_update_view, name="task_update"),
     path("delete-task/<int:pk>", delete_task_view, name="delete_task"),
     path("api/tasks/", task_calendar_api, name="task_calendar_api"),
+    path("api/tasks/counts/", home_counts_api, name="home_counts_api"),
+    path("api/dashboard/", dashboard_stats_api, name="dashboard_stats_api"),
+    path("api/tasks/search/", task_search_api, name="task_search_api"),
+    path("api/tasks/table/", task_table_api, name="task_table_api"),
+    path("api/tasks/table/mine/", my_task_table_api, name="my_task_table_api"),
+    path("api/users/search/", user_search_api, name="user_search_api"),
+    path("api/tasks/bulk/", task_bulk_create_api, name="task_bulk_create_api"),
     path("calendar/", create_task, name="calendar"),
     path(
         "delete-calendar-task/<int:task_id>/",
@@ -1,27 +1,53 @@
 """Contains the application template based views."""
 
-from datetime import datetime
-from typing import Any
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponseRedirect, JsonResponse
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import (
+    HttpRequest,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse, reverse_lazy
+from django.utils.dateparse import parse_date
 from django.utils.decorators import method_decorator
 from django.views.decorators.http import require_http_methods
 from django.views.generic.base import TemplateView
 from django.views.generic.edit import FormView
 
+from webapp.accounts.models import CustomUser
 from webapp.tasktrack import services
+from webapp.tasktrack.datatables import task_table
 from webapp.tasktrack.enums import StatusType
 from webapp.tasktrack.forms import (
+    BulkTaskUpdateForm,
     CreateCalendarTaskForm,
     CreateTaskForm,
     TaskUpdateForm,
 )
-from webapp.tasktrack.models import Status, Task
+from webapp.tasktrack.models import (
+    Priority,
+    Status,
+    Task,
+    TaskArchive,
+    TaskStatistics,
+)
+from webapp.tasktrack.pagination import paginate_tasks
 from webapp.tasktrack.permissions import limit_access
+from webapp.tasktrack.routers import use_replica
+
+CALENDAR_CHUNK_SIZE = 2000
 
 
 class HomeView(LoginRequiredMixin, TemplateView):
@@ -34,35 +60,23 @@ class HomeView(LoginRequiredMixin, TemplateView):
 
         context = super().get_context_data(**kwargs)
 
-        pending_tasks_count = (
-            Task.objects.filter(assigned_to=self.request.user).pending_tasks().count()
-        )
-        in_progress_tasks_count = (
-            Task.objects.filter(assigned_to=self.request.user)
-            .in_progress_tasks()
-            .count()
+        context["task_counts"] = TaskStatistics.status_counts(
+            assigned_to=self.request.user
         )
-        completed_tasks_count = (
-            Task.objects.filter(assigned_to=self.request.user).completed_tasks().count()
+        context["records_total"] = sum(context["task_counts"].values())
+        page = paginate_tasks(
+            self.request,
+            Task.objects.filter(assigned_to=self.request.user).for_listing(),
         )
-        cancelled_tasks_count = (
-            Task.objects.filter(assigned_to=self.request.user).cancelled_tasks().count()
-        )
-
-        task_list = Task.objects.filter(assigned_to=self.request.user).order_by("-pk")
 
-        context["task_counts"] = {
-            "pending": pending_tasks_count,
-            "in_progress": in_progress_tasks_count,
-            "completed": completed_tasks_count,
-            "cancelled": cancelled_tasks_count,
-        }
-        context["task_list"] = task_list
+        context["task_list"] = page.object_list
+        context["page_obj"] = page
 
         return context
 
 
 @method_decorator(limit_access, name="get")
+@method_decorator(use_replica, name="get")
 class DashboardView(LoginRequiredMixin, TemplateView):
     """Dashboard page view."""
 
@@ -75,161 +89,13 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
         current_year = datetime.now().year
 
-        pending_tasks_count = Task.objects.all().pending_tasks().count()
-        in_progress_tasks_count = Task.objects.all().in_progress_tasks().count()
-        completed_tasks_count = Task.objects.all().completed_tasks().count()
-        cancelled_tasks_count = Task.objects.all().cancelled_tasks().count()
-
-        low_priority_tasks_count = Task.objects.all().low_priority_tasks().count()
-        medium_priority_tasks_count = Task.objects.all().medium_priority_tasks().count()
-        high_priority_tasks_count = Task.objects.all().high_priority_tasks().count()
-        critical_priority_tasks_count = (
-            Task.objects.all().critical_priority_tasks().count()
-        )
-
-        jan_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=1
-        ).count()
-        feb_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=2
-        ).count()
-        mar_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=3
-        ).count()
-        apr_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=4
-        ).count()
-        may_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=5
-        ).count()
-        jun_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=6
-        ).count()
-        jul_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=7
-        ).count()
-        aug_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=8
-        ).count()
-        sep_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=9
-        ).count()
-        oct_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=10
-        ).count()
-        nov_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=11
-        ).count()
-        dec_due_tasks_count = Task.objects.filter(
-            due_date__year=current_year, due_date__month=12
-        ).count()
-
-        jan_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=1,
-        ).count()
-        feb_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=2,
-        ).count()
-        mar_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=3,
-        ).count()
-        apr_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=4,
-        ).count()
-        may_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=5,
-        ).count()
-        jun_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=6,
-        ).count()
-        jul_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=7,
-        ).count()
-        aug_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=8,
-        ).count()
-        sep_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=9,
-        ).count()
-        oct_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=10,
-        ).count()
-        nov_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=11,
-        ).count()
-        dec_completed_tasks_count = Task.objects.filter(
-            status__name=StatusType.COMPLETED.value,
-            updated_at__year=current_year,
-            updated_at__month=12,
-        ).count()
-
-        context["task_counts"] = {
-            "pending": pending_tasks_count,
-            "in_progress": in_progress_tasks_count,
-            "completed": completed_tasks_count,
-            "cancelled": cancelled_tasks_count,
-            "low_priority": low_priority_tasks_count,
-            "medium_priority": medium_priority_tasks_count,
-            "high_priority": high_priority_tasks_count,
-            "critical_priority": critical_priority_tasks_count,
-        }
-
-        context["due_tasks_count_by_month"] = {
-            "jan_due_tasks": jan_due_tasks_count,
-            "feb_due_tasks": feb_due_tasks_count,
-            "mar_due_tasks": mar_due_tasks_count,
-            "apr_due_tasks": apr_due_tasks_count,
-            "may_due_tasks": may_due_tasks_count,
-            "jun_due_tasks": jun_due_tasks_count,
-            "jul_due_tasks": jul_due_tasks_count,
-            "aug_due_tasks": aug_due_tasks_count,
-            "sep_due_tasks": sep_due_tasks_count,
-            "oct_due_tasks": oct_due_tasks_count,
-            "nov_due_tasks": nov_due_tasks_count,
-            "dec_due_tasks": dec_due_tasks_count,
-        }
-
-        context["completed_tasks_count_by_month"] = {
-            "jan_completed_tasks": jan_completed_tasks_count,
-            "feb_completed_tasks": feb_completed_tasks_count,
-            "mar_completed_tasks": mar_completed_tasks_count,
-            "apr_completed_tasks": apr_completed_tasks_count,
-            "may_completed_tasks": may_completed_tasks_count,
-            "jun_completed_tasks": jun_completed_tasks_count,
-            "jul_completed_tasks": jul_completed_tasks_count,
-            "aug_completed_tasks": aug_completed_tasks_count,
-            "sep_completed_tasks": sep_completed_tasks_count,
-            "oct_completed_tasks": oct_completed_tasks_count,
-            "nov_completed_tasks": nov_completed_tasks_count,
-            "dec_completed_tasks": dec_completed_tasks_count,
-        }
+        context.update(TaskStatistics.dashboard_counts(year=current_year))
 
         return context
 
 
 @method_decorator(limit_access, name="get")
+@method_decorator(use_replica, name="get")
 class TaskView(LoginRequiredMixin, TemplateView):
     """Task page view."""
 
@@ -240,21 +106,25 @@ class TaskView(LoginRequiredMixin, TemplateView):
 
         context = super().get_context_data(**kwargs)
 
-        pending_tasks_count = Task.objects.all().pending_tasks().count()
-        in_progress_tasks_count = Task.objects.all().in_progress_tasks().count()
-        completed_tasks_count = Task.objects.all().completed_tasks().count()
-        cancelled_tasks_count = Task.objects.all().cancelled_tasks().count()
+        context["task_counts"] = TaskStatistics.status_counts()
+        context["records_total"] = sum(context["task_counts"].values())
+        context["bulk_form"] = BulkTaskUpdateForm()
 
-        task_list = Task.objects.all().order_by("-pk")
+        query = self.request.GET.get("q", "").strip()
+        context["search_query"] = query
+        if query:
+            context["task_list"] = list(
+                Task.objects.all()
+                .search(query, limit=settings.TASK_SEARCH_LIMIT)
+                .for_listing()
+            )
+            context["records_filtered"] = Task.objects.all().matching(query).count()
+            return context
 
-        context["task_counts"] = {
-            "pending": pending_tasks_count,
-            "in_progress": in_progress_tasks_count,
-            "completed": completed_tasks_count,
-            "cancelled": cancelled_tasks_count,
-        }
+        page = paginate_tasks(self.request, Task.objects.all().for_listing())
 
-        context["task_list"] = task_list
+        context["task_list"] = page.object_list
+        context["page_obj"] = page
 
         return context
 
@@ -301,9 +171,17 @@ class TaskDetailsView(LoginRequiredMixin, TemplateView):
 
         pk = self.kwargs.get("pk")
 
-        task = get_object_or_404(Task, pk=pk)
+        task = Task.objects.filter(pk=pk).first()
+        if task is None:
+            task = get_object_or_404(
+                TaskArchive.objects.select_related(
+                    "priority", "status", "assigned_to", "created_by", "updated_by"
+                ),
+                pk=pk,
+            )
 
         context["task"] = task
+        context["archived"] = isinstance(task, TaskArchive)
 
         return context
 
@@ -327,8 +205,13 @@ def task_update_view(request: HttpRequest, pk: int) -> HttpResponseRedirect:
             form.data["assigned_to"] = data.assigned_to_id
 
         if form.is_valid():
-            form.save()
-            services.update_task(user=request.user, pk=pk)
+            services.update_task(
+                user=request.user,
+                task=data,
+                changes={
+                    field: form.cleaned_data[field] for field in form.changed_data
+                },
+            )
             return HttpResponseRedirect(reverse("task_details", kwargs={"pk": pk}))
 
     context = {"form": form}
@@ -336,7 +219,26 @@ def task_update_view(request: HttpRequest, pk: int) -> HttpResponseRedirect:
 
 
 @login_required
-@require_http_methods(["POST", "GET"])
+@require_http_methods(["POST"])
+@limit_access
+def task_bulk_update_view(request: HttpRequest) -> HttpResponseRedirect:
+    """Apply a status, priority or assignee to the selected tasks."""
+
+    form = BulkTaskUpdateForm(request.POST)
+    if form.is_valid():
+        services.bulk_update_tasks(
+            user=request.user,
+            tasks=Task.objects.filter(pk__in=form.cleaned_data["task_ids"]),
+            status=form.cleaned_data["status"],
+            priority=form.cleaned_data["priority"],
+            assigned_to=form.cleaned_data["assigned_to"],
+        )
+
+    return HttpResponseRedirect(reverse("tasks"))
+
+
+@login_required
+@require_http_methods(["POST"])
 @limit_access
 def delete_task_view(request: HttpRequest, pk: int) -> HttpResponseRedirect:
     """Delete task view."""
@@ -351,28 +253,272 @@ def delete_task_view(request: HttpRequest, pk: int) -> HttpResponseRedirect:
     )
 
 
+def _parse_calendar_date(value: Optional[str]) -> Optional[date]:
+    """Return the date part of a FullCalendar range boundary."""
+
+    if not value:
+        return None
+
+    parsed = parse_date(value[:10])
+    if parsed is None:
+        raise ValueError(f"Invalid calendar date: {value}")
+    return parsed
+
+
+def _calendar_event(
+    row: Dict[str, Any], *, priority: Any, status: Any
+) -> Dict[str, Any]:
+    """Convert a task values row to a FullCalendar event."""
+
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "start": row["due_date"].strftime("%Y-%m-%d"),
+        "description": row["description"],
+        "priority": priority.name,
+        "priority_level_colour": priority.priority_level_colour,
+        "status": status.name,
+        "status_colour": status.status_colour,
+    }
+
+
+def _calendar_events(rows: Iterator[Dict[str, Any]]) -> Iterator[Any]:
+    """Convert task values rows to FullCalendar events as they are fetched."""
+
+    for row in rows:
+        yield _calendar_event(
+            row,
+            priority=Priority.objects.cached_by_pk(row["priority_id"]),
+            status=Status.objects.cached_by_pk(row["status_id"]),
+        )
+
+
+async def _acalendar_events(rows: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[Any]:
+    """Convert task values rows to FullCalendar events as they are fetched."""
+
+    async for row in rows:
+        yield _calendar_event(
+            row,
+            priority=await Priority.objects.acached_by_pk(row["priority_id"]),
+            status=await Status.objects.acached_by_pk(row["status_id"]),
+        )
+
+
+def _stream_json_array(items: Iterable[Any]) -> Iterator[str]:
+    """Serialise the items as a JSON array one element at a time."""
+
+    yield "["
+    for index, item in enumerate(items):
+        yield ("," if index else "") + json.dumps(item, cls=DjangoJSONEncoder)
+    yield "]"
+
+
+async def _astream_json_array(items: AsyncIterator[Any]) -> AsyncIterator[str]:
+    """Serialise the items as a JSON array one element at a time."""
+
+    yield "["
+    separator = ""
+    async for item in items:
+        yield separator + json.dumps(item, cls=DjangoJSONEncoder)
+        separator = ","
+    yield "]"
+
+
 @login_required
 @require_http_methods(["POST", "GET"])
 @limit_access
-def task_calendar_api(request: HttpRequest) -> Any:
-    """Task api view."""
-
-    tasks = Task.objects.all()
-    events = []
-    for task in tasks:
-        events.append(
-            {
-                "id": task.id,
-                "title": task.title,
-                "start": task.due_date.strftime("%Y-%m-%d"),
-                "description": task.description,
-                "priority": task.priority.name,
-                "priority_level_colour": task.priority.priority_level_colour,
-                "status": task.status.name,
-                "status_colour": task.status.status_colour,
-            }
+@use_replica
+async def task_calendar_api(request: HttpRequest) -> Any:
+    """Task api view.
+
+    Only the tasks due within the optional FullCalendar ``start`` (inclusive)
+    and ``end`` (exclusive) range are returned, streamed as a JSON array. Under
+    ASGI the rows are fetched with the async ORM.
+    """
+
+    try:
+        start = _parse_calendar_date(request.GET.get("start"))
+        end = _parse_calendar_date(request.GET.get("end"))
+    except ValueError:
+        return JsonResponse({"error": "Invalid date range"}, status=400)
+
+    tasks = Task.objects.exclude(due_date=None)
+    if start:
+        tasks = tasks.filter(due_date__gte=start)
+    if end:
+        tasks = tasks.filter(due_date__lt=end)
+
+    rows = tasks.values(
+        "id",
+        "title",
+        "due_date",
+        "description",
+        "priority_id",
+        "status_id",
+    )
+
+    if isinstance(request, ASGIRequest):
+        content: Any = _astream_json_array(
+            _acalendar_events(rows.aiterator(chunk_size=CALENDAR_CHUNK_SIZE))
         )
-    return JsonResponse(events, safe=False)
+    else:
+        # WSGI servers read the response synchronously, and django would load a
+        # whole async stream into memory first, so stream the rows synchronously.
+        content = _stream_json_array(
+            _calendar_events(rows.iterator(chunk_size=CALENDAR_CHUNK_SIZE))
+        )
+
+    return StreamingHttpResponse(content, content_type="application/json")
+
+
+@login_required
+@require_http_methods(["GET"])
+async def home_counts_api(request: HttpRequest) -> JsonResponse:
+    """Return the number of tasks per status assigned to the user."""
+
+    user = await request.auser()
+    return JsonResponse(await TaskStatistics.astatus_counts(assigned_to=user))
+
+
+@login_required
+@require_http_methods(["GET"])
+@limit_access
+@use_replica
+async def dashboard_stats_api(request: HttpRequest) -> JsonResponse:
+    """Return the dashboard counters and monthly charts of the current year."""
+
+    return JsonResponse(
+        await TaskStatistics.adashboard_counts(year=datetime.now().year)
+    )
+
+
+@login_required
+@require_http_methods(["GET"])
+@limit_access
+def task_search_api(request: HttpRequest) -> JsonResponse:
+    """Return the tasks matching the q parameter, best matches first."""
+
+    tasks = (
+        Task.objects.all()
+        .search(request.GET.get("q", ""), limit=settings.TASK_SEARCH_LIMIT)
+        .for_listing()
+    )
+
+    results = [
+        {
+            "id": task.pk,
+            "title": task.title,
+            "due_date": task.due_date,
+            "priority": task.priority.name,
+            "status": task.status.name,
+            "assigned_to": str(task.assigned_to),
+            "url": reverse("task_details", kwargs={"pk": task.pk}),
+        }
+        for task in tasks
+    ]
+    return JsonResponse({"results": results})
+
+
+@login_required
+@require_http_methods(["GET"])
+@limit_access
+@use_replica
+def task_table_api(request: HttpRequest) -> JsonResponse:
+    """Return one draw of the tasks table for DataTables server-side processing."""
+
+    return JsonResponse(
+        task_table(
+            request.GET,
+            Task.objects.all(),
+            user=request.user,
+            total=lambda: sum(TaskStatistics.status_counts().values()),
+            rank_search=True,
+        )
+    )
+
+
+@login_required
+@require_http_methods(["GET"])
+def my_task_table_api(request: HttpRequest) -> JsonResponse:
+    """Return one draw of the home tasks table, the tasks assigned to the user."""
+
+    return JsonResponse(
+        task_table(
+            request.GET,
+            Task.objects.filter(assigned_to=request.user),
+            user=request.user,
+            total=lambda: sum(
+                TaskStatistics.status_counts(assigned_to=request.user).values()
+            ),
+        )
+    )
+
+
+def _user_search_page(term: str, page: int) -> Dict[str, Any]:
+    """Return one page of the active users matching the term, cached briefly."""
+
+    digest = hashlib.sha1(" ".join(term.lower().split()).encode()).hexdigest()
+    key = f"tasktrack:user-search:{digest}:{page}"
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    size = settings.USER_SEARCH_PAGE_SIZE
+    offset = (page - 1) * size
+    users = list(
+        CustomUser.objects.filter(is_active=True)
+        .search(term)
+        .only("pk", "username", "first_name", "last_name")[offset : offset + size + 1]
+    )
+    more = len(users) > size
+    result = {
+        "results": [{"id": user.pk, "text": str(user)} for user in users[:size]],
+        "pagination": {"more": more},
+        "more": more,
+    }
+    cache.set(key, result, settings.USER_SEARCH_CACHE_TIMEOUT)
+    return result
+
+
+@login_required
+@require_http_methods(["GET"])
+def user_search_api(request: HttpRequest) -> JsonResponse:
+    """Return a page of active users matching the term parameter for Select2."""
+
+    term = request.GET.get("term") or request.GET.get("q") or ""
+    try:
+        page = max(int(request.GET.get("page", 1)), 1)
+    except ValueError:
+        page = 1
+    return JsonResponse(_user_search_page(term, page))
+
+
+@login_required
+@require_http_methods(["POST"])
+@limit_access
+def task_bulk_create_api(request: HttpRequest) -> Any:
+    """Create every task in the posted JSON array."""
+
+    try:
+        payload = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"success": False, "errors": "Invalid JSON"}, status=400)
+
+    if not isinstance(payload, list):
+        return JsonResponse(
+            {"success": False, "errors": "Expected an array of tasks"}, status=400
+        )
+
+    try:
+        tasks = services.bulk_create_tasks(user=request.user, tasks=payload)
+    except ValidationError as error:
+        return JsonResponse(
+            {"success": False, "errors": error.message_dict}, status=400
+        )
+
+    return JsonResponse(
+        {"success": True, "task_ids": [task.pk for task in tasks]}, status=201
+    )
 
 
 @login_required
@@ -398,7 +544,9 @@ def create_task(request: HttpRequest) -> Any:
         form = CreateCalendarTaskForm(request.POST)
         if form.is_valid():
             task = form.save(commit=False)
-            status, _ = Status.objects.get_or_create(name=StatusType.PENDING)
+            status = Status.objects.cached(StatusType.PENDING)
+            if status is None:
+                status, _ = Status.objects.get_or_create(name=StatusType.PENDING)
             task.status = status
             task.created_by = request.user
             task.updated_by = request.user